@@ -0,0 +1,159 @@
+from __future__ import annotations
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from trading.backtest import result_cache
+from trading.backtest.engine import BacktestConfig, BacktestEngine
+from trading.data.action_store import DEFAULT_TTL, STORE_DIR, CorporateActionStore
+from trading.data.corporate_actions import DividendEvent, SplitEvent, actions_frame
+from trading.strategy.examples.noop import NoopStrategy
+
+
+class FakeFetcher:
+    def __init__(self, fail: tuple[str, ...] = ()) -> None:
+        self.calls: list[str] = []
+        self.fail = set(fail)
+        self.ratio = 2.0
+
+    def __call__(self, symbol: str) -> pd.DataFrame:
+        self.calls.append(symbol)
+        if symbol in self.fail:
+            raise ConnectionError("offline")
+        if symbol == "NOEVENTS":
+            return actions_frame(symbol)
+        return actions_frame(
+            symbol,
+            [SplitEvent(datetime(2020, 6, 1, tzinfo=timezone.utc), self.ratio)],
+            [DividendEvent(datetime(2021, 3, 1, tzinfo=timezone.utc), 0.25)],
+        )
+
+
+def _store(root: Path, fetcher: FakeFetcher, now: list[pd.Timestamp]) -> CorporateActionStore:
+    return CorporateActionStore(
+        root, fetcher=fetcher, rate_per_sec=1000.0, clock=lambda: now[0], max_workers=4
+    )
+
+
+def test_bulk_lookup_fetches_only_stale_symbols(tmp_path: Path) -> None:
+    now = [pd.Timestamp("2024-01-01", tz="UTC")]
+    fetcher = FakeFetcher()
+    store = _store(tmp_path, fetcher, now)
+    symbols = ["AAA", "BBB", "NOEVENTS"]
+
+    first = store.lookup(symbols)
+    assert sorted(fetcher.calls) == symbols
+    assert sorted(first["symbol"].unique()) == ["AAA", "BBB"] and len(first) == 4
+
+    # Steady state: within the TTL the universe is served without any fetch
+    fetcher.calls.clear()
+    now[0] += pd.Timedelta(days=3)
+    pd.testing.assert_frame_equal(store.lookup(symbols), first)
+    assert fetcher.calls == []
+
+    # Past the TTL stale symbols are refreshed; a new symbol is fetched on first use
+    now[0] += pd.Timedelta(days=5)
+    fetcher.ratio = 3.0
+    refreshed = store.lookup(["AAA", "CCC"])
+    assert sorted(fetcher.calls) == ["AAA", "CCC"]
+    splits = refreshed[refreshed["kind"] == "split"].set_index("symbol")["value"]
+    assert splits.to_dict() == {"AAA": 3.0, "CCC": 3.0}
+    assert set(store.actions()["symbol"]) == {"AAA", "BBB", "CCC"}
+
+
+def test_offline_and_failed_refresh_keep_stored_events(tmp_path: Path) -> None:
+    now = [pd.Timestamp("2024-01-01", tz="UTC")]
+    _store(tmp_path, FakeFetcher(), now).lookup(["AAA"])
+    stored = (tmp_path / "actions.parquet").stat().st_mtime_ns
+
+    now[0] += pd.Timedelta(days=30)
+    failing = FakeFetcher(fail=("AAA",))
+    assert len(_store(tmp_path, failing, now).lookup(["AAA"])) == 2
+    assert failing.calls == ["AAA"]
+
+    offline_fetcher = FakeFetcher()
+    offline = CorporateActionStore(tmp_path, ttl=None, fetcher=offline_fetcher)
+    assert len(offline.lookup(["AAA", "ZZZ"])) == 2
+    assert offline_fetcher.calls == []
+    assert (tmp_path / "actions.parquet").stat().st_mtime_ns == stored
+
+
+def test_result_cache_key_tracks_stored_events(tmp_path: Path) -> None:
+    cfg = BacktestConfig(
+        symbols=["AAA"], interval="1d", cache_dir=tmp_path, run_id="r", adjustment="split"
+    )
+    fetcher = FakeFetcher()
+    now = [pd.Timestamp("2024-01-01", tz="UTC")]
+    store = CorporateActionStore.for_cache(
+        tmp_path, fetcher=fetcher, rate_per_sec=1000.0, clock=lambda: now[0]
+    )
+    store.lookup(["AAA"])
+    before = result_cache.result_cache_key(cfg, "sha")
+
+    # A refresh that returns the same events leaves the key alone
+    now[0] += pd.Timedelta(days=30)
+    store.lookup(["AAA"])
+    assert result_cache.result_cache_key(cfg, "sha") == before
+
+    fetcher.ratio = 4.0
+    store.refresh(["AAA"])
+    assert result_cache.result_cache_key(cfg, "sha") != before
+
+
+def test_adjusted_run_refreshes_stale_actions_before_result_cache_lookup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ends = pd.date_range("2020-05-28", periods=6, freq="D", tz="UTC")
+    pd.DataFrame(
+        {
+            "symbol": "AAA",
+            "end": ends,
+            "open": 100.0,
+            "high": 100.0,
+            "low": 100.0,
+            "close": 100.0,
+            "volume": 1000,
+        }
+    ).to_parquet(tmp_path / "AAA_1d.parquet", index=False)
+    fetcher = FakeFetcher()
+    now = [pd.Timestamp.now(tz="UTC")]
+
+    def for_cache(cache_dir: Path, **kwargs: Any) -> CorporateActionStore:
+        return CorporateActionStore(
+            Path(cache_dir) / STORE_DIR,
+            ttl=kwargs.get("ttl", DEFAULT_TTL),
+            fetcher=fetcher,
+            rate_per_sec=1000.0,
+            clock=lambda: now[0],
+        )
+
+    monkeypatch.setattr(CorporateActionStore, "for_cache", for_cache)
+    monkeypatch.setattr(result_cache, "code_version", lambda: "test-sha")
+
+    def run(run_id: str) -> dict[str, Any]:
+        cfg = BacktestConfig(
+            symbols=["AAA"],
+            interval="1d",
+            cache_dir=tmp_path,
+            run_id=run_id,
+            out_dir=tmp_path / "runs",
+            result_cache_dir=tmp_path / "runs" / ".result_cache",
+            adjustment="split",
+        )
+        engine = BacktestEngine(strategy_factory=lambda sym: NoopStrategy(), config=cfg)
+        engine.run()
+        assert engine.summary is not None
+        return engine.summary
+
+    assert "cache" not in run("first")
+    assert run("again")["cache"]["hit"]
+
+    # Past the TTL a new split must be fetched, which changes the key: the run misses
+    now[0] += pd.Timedelta(days=30)
+    fetcher.ratio = 4.0
+    fetcher.calls.clear()
+    assert "cache" not in run("after-split")
+    assert fetcher.calls == ["AAA"]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from trading.backtest.cursor import BarCursor
+
+
+def _frame(symbol: str, days: list[str]) -> pd.DataFrame:
+    ends = pd.to_datetime(days, utc=True)
+    n = len(days)
+    return pd.DataFrame(
+        {
+            "symbol": [symbol] * n,
+            "end": ends,
+            "open": [100.0 + i for i in range(n)],
+            "high": [101.0 + i for i in range(n)],
+            "low": [99.0 + i for i in range(n)],
+            "close": [100.5 + i for i in range(n)],
+            "volume": pd.array([1000 + i for i in range(n)], dtype="Int64"),
+        }
+    )
+
+
+def test_cursor_matches_mask_lookup_with_gaps() -> None:
+    series = {
+        "SPY": _frame("SPY", ["2024-01-02", "2024-01-03", "2024-01-05"]),
+        "QQQ": _frame("QQQ", ["2024-01-03", "2024-01-04"]),
+    }
+    timeline = sorted({ts for df in series.values() for ts in df["end"].tolist()})
+    cursor = BarCursor(series)
+
+    for ts in timeline:
+        for sym, df in series.items():
+            rows = df[df["end"] == ts]
+            bar = cursor.bar_at(sym, ts.value)
+            if rows.empty:
+                assert bar is None
+                continue
+            row = rows.iloc[0]
+            assert bar is not None
+            assert bar.symbol == sym
+            assert bar.end == pd.to_datetime(row["end"]).to_pydatetime()
+            assert bar.end.isoformat() == ts.isoformat()
+            assert bar.close == float(row["close"])
+            assert bar.volume == int(row["volume"])
+
+
+def test_cursor_reset_rewinds_pointers() -> None:
+    series = {"SPY": _frame("SPY", ["2024-01-02"])}
+    cursor = BarCursor(series)
+    ts = pd.Timestamp("2024-01-02", tz="UTC").value
+    assert cursor.bar_at("SPY", ts) is not None
+    assert cursor.bar_at("SPY", ts) is None
+    cursor.reset()
+    assert cursor.bar_at("SPY", ts) is not None
@@ -0,0 +1,57 @@
+from __future__ import annotations
+from pathlib import Path
+
+from trading.bench.history import append_history, compare, find_baseline, load_history, make_entry
+from trading.bench.suite import BenchResult, SuiteConfig, run_suite
+
+
+def test_quick_suite_reports_positive_throughput() -> None:
+    config = SuiteConfig.quick()
+    config.universes = (2,)
+    config.end = "2023-01-31"
+    results = run_suite(config)
+    names = [r.name for r in results]
+    assert "micro.apply_fill" in names and "macro.backtest.1h.2sym" in names
+    assert all(r.value > 0 for r in results)
+    macro = results[-1]
+    assert macro.unit == "bars/s" and macro.params["bars"] > 0
+
+    assert [r.name for r in run_suite(config, only="micro.validate")] == ["micro.validate"]
+
+
+def test_history_baseline_and_regressions(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    append_history(path, make_entry([BenchResult("a", 100.0, "ops/s", 1.0)], "sha-old"))
+    append_history(path, make_entry([BenchResult("a", 95.0, "ops/s", 1.0)], "sha-new"))
+    history = load_history(path)
+    assert len(history) == 2
+
+    # Latest entry from another commit, or an explicit SHA prefix
+    assert find_baseline(history, "sha-new")["git_sha"] == "sha-old"  # type: ignore[index]
+    assert find_baseline(history, "sha-x", "sha-n")["git_sha"] == "sha-new"  # type: ignore[index]
+    assert find_baseline(history, "sha-x", "nope") is None
+
+    base = history[0]
+    assert compare(base, [BenchResult("a", 95.0, "ops/s", 1.0)], threshold=0.1) == []
+    regressions = compare(base, [BenchResult("a", 80.0, "ops/s", 1.0)], threshold=0.1)
+    assert [r.name for r in regressions] == ["a"]
+    assert round(regressions[0].change, 2) == -0.2
+    # Unknown benchmarks and unit changes are not comparable
+    assert compare(base, [BenchResult("b", 1.0, "ops/s", 1.0)]) == []
+    assert compare(base, [BenchResult("a", 1.0, "rows/s", 1.0)]) == []
+
+
+def test_baseline_is_taken_from_the_same_host(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    append_history(path, make_entry([BenchResult("a", 100.0, "ops/s", 1.0)], "sha-here"))
+    other = make_entry([BenchResult("a", 500.0, "ops/s", 1.0)], "sha-there")
+    other.update(machine="arm64", node="ci-runner-7")
+    append_history(path, other)
+    history = load_history(path)
+
+    assert find_baseline(history, "sha-new")["git_sha"] == "sha-here"  # type: ignore[index]
+    assert find_baseline(history, "sha-new", "sha-there") is None
+    there = {"machine": "arm64", "node": "ci-runner-7"}
+    assert find_baseline(history, "sha-new", host=there)["git_sha"] == "sha-there"  # type: ignore[index]
+    # Entries without host fields are never comparable
+    assert find_baseline([{"git_sha": "old", "results": {}}], "sha-new") is None
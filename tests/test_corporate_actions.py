@@ -1,9 +1,22 @@
 from __future__ import annotations
 from datetime import datetime, timezone
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from trading.data.corporate_actions import SplitEvent, apply_split_adjustments
+from trading.backtest.engine import BacktestConfig, load_series
+from trading.data.action_store import CorporateActionStore
+from trading.data.corporate_actions import (
+    DividendEvent,
+    SplitEvent,
+    actions_frame,
+    adjust_bars,
+    adjusted_path,
+    apply_split_adjustments,
+    ensure_adjusted,
+)
 
 
 def test_apply_split_adjustments_simple() -> None:
@@ -48,3 +61,87 @@ def test_apply_split_adjustments_simple() -> None:
     # Bars after split unchanged
     assert adj.loc[2, "close"] == 108.0
     assert adj.loc[2, "volume"] == 1200
+
+
+def _daily(symbol: str, closes: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "end": pd.date_range("2020-01-01", periods=len(closes), freq="D", tz="UTC"),
+            "open": closes,
+            "high": closes,
+            "low": closes,
+            "close": closes,
+            "volume": 100,
+        }
+    )
+
+
+def test_each_bar_is_adjusted_only_by_later_splits() -> None:
+    bars = _daily("AAA", [400.0, 400.0, 200.0, 200.0, 100.0])
+    splits = [
+        SplitEvent(date=datetime(2020, 1, 3, tzinfo=timezone.utc), ratio=2.0),
+        SplitEvent(date=datetime(2020, 1, 5, tzinfo=timezone.utc), ratio=2.0),
+    ]
+    adj = apply_split_adjustments(bars, splits)
+    assert adj["close"].tolist() == [100.0] * 5
+    assert adj["volume"].tolist() == [400, 400, 200, 200, 100]
+
+
+def test_batch_matches_per_symbol_and_total_return() -> None:
+    rng = np.random.default_rng(0)
+    symbols = [f"S{i}" for i in range(50)]
+    bars = pd.concat(
+        [_daily(s, list(100 + rng.random(30).cumsum())) for s in symbols], ignore_index=True
+    )
+    actions = pd.concat(
+        [
+            actions_frame(
+                s,
+                [SplitEvent(datetime(2020, 1, 1 + i % 28, tzinfo=timezone.utc), 1.0 + i % 3)],
+                [DividendEvent(datetime(2020, 1, 10 + i % 15, tzinfo=timezone.utc), 0.5)],
+            )
+            for i, s in enumerate(symbols)
+        ],
+        ignore_index=True,
+    )
+    batch = adjust_bars(bars.sample(frac=1.0, random_state=1), actions, mode="total_return")
+    for sym in ("S0", "S17", "S49"):
+        one = adjust_bars(
+            bars[bars["symbol"] == sym], actions[actions["symbol"] == sym], "total_return"
+        )
+        got = batch[batch["symbol"] == sym].reset_index(drop=True)
+        pd.testing.assert_frame_equal(got, one)
+
+    # Back-adjusting by 1 - D/P makes the ex-date return P_ex / (P_prev - D)
+    raw = bars[bars["symbol"] == "S0"].reset_index(drop=True)
+    adj = batch[batch["symbol"] == "S0"].reset_index(drop=True)
+    ex = int(np.flatnonzero(raw["end"] == pd.Timestamp("2020-01-10", tz="UTC"))[0])
+    split_only = adjust_bars(raw, actions[actions["symbol"] == "S0"], "split")["close"]
+    expected = split_only[ex] / (split_only[ex - 1] - 0.5)
+    assert adj["close"][ex] / adj["close"][ex - 1] == pytest.approx(expected)
+
+
+def test_adjusted_series_cached_next_to_raw(tmp_path: Path) -> None:
+    _daily("AAA", [200.0, 200.0, 100.0, 100.0]).to_parquet(tmp_path / "AAA_1d.parquet", index=False)
+    actions = actions_frame(
+        "AAA", [SplitEvent(date=datetime(2020, 1, 3, tzinfo=timezone.utc), ratio=2.0)]
+    )
+    path = ensure_adjusted(tmp_path, "AAA", "1d", actions, "split")
+    assert path == adjusted_path(tmp_path, "AAA", "1d", "split")
+    built = path.stat().st_mtime_ns
+    assert ensure_adjusted(tmp_path, "AAA", "1d", actions, "split").stat().st_mtime_ns == built
+
+    # Populate the store once, then load fully offline
+    store = CorporateActionStore.for_cache(tmp_path, fetcher=lambda symbol: actions)
+    assert store.refresh(["AAA"]) == ["AAA"]
+    cfg = BacktestConfig(
+        symbols=["AAA"],
+        interval="1d",
+        cache_dir=tmp_path,
+        run_id="adj",
+        adjustment="split",
+        actions_ttl_days=None,
+    )
+    assert load_series(cfg)["AAA"]["close"].tolist() == [100.0] * 4
+    assert path.stat().st_mtime_ns == built
@@ -0,0 +1,72 @@
+from __future__ import annotations
+from pathlib import Path
+import json
+
+import numpy as np
+import pandas as pd
+from typer.testing import CliRunner
+
+from trading.cli import app
+from trading.data.partitioned import write_partitioned
+from trading.data.quality import discover_series, scan_cache
+from trading.data.synthetic import write_synthetic_bars
+
+
+def _synth(out: Path, symbol: str, interval: str) -> pd.DataFrame:
+    write_synthetic_bars([symbol], interval, "2024-06-03", "2024-06-28", out, seed=1)
+    return pd.read_parquet(out / f"{symbol}_{interval}.parquet")
+
+
+def test_scan_reports_each_issue(tmp_path: Path) -> None:
+    _synth(tmp_path, "CLEAN", "15m")
+    df = _synth(tmp_path, "DIRTY", "15m")
+    # Synthetic sessions run every weekday; XNYS closes for Juneteenth (2024-06-19)
+    juneteenth = df["end"].dt.strftime("%Y-%m-%d") == "2024-06-19"
+    df = df[~juneteenth | (df.index % 2 == 0)].reset_index(drop=True)
+    df = df[df["end"].dt.strftime("%Y-%m-%d") != "2024-06-05"].reset_index(drop=True)
+    df.loc[10, "high"] = df.loc[10, "low"] - 1.0
+    df.loc[20, "close"] = np.nan
+    df.loc[30:34, "volume"] = 0
+    df.loc[50, ["open", "high", "low", "close"]] *= 3.0
+    df = pd.concat([df, df.iloc[[60]]], ignore_index=True)
+    df.to_parquet(tmp_path / "DIRTY_15m.parquet", index=False)
+
+    reports = {r.symbol: r for r in scan_cache(tmp_path, max_workers=2)}
+    assert set(reports) == {"CLEAN", "DIRTY"}
+
+    clean = reports["CLEAN"]
+    assert clean.ok and clean.missing_bars == 0 and clean.outliers == 0
+    assert clean.off_calendar_bars == 26  # the Juneteenth bars synthetic data emits
+
+    dirty = reports["DIRTY"]
+    assert not dirty.ok
+    assert dirty.nan_rows == 1 and dirty.duplicate_ends == 1
+    assert dirty.ohlc_violations == 1
+    assert dirty.zero_volume_runs == 1 and dirty.longest_zero_volume_run == 5
+    assert dirty.outliers == 2  # the jump up and the jump back down
+    assert dirty.missing_sessions == 1 and dirty.examples["missing_sessions"] == ["2024-06-05"]
+    assert dirty.missing_bars == 26 + 1  # the dropped session plus the NaN row
+
+
+def test_discovers_partitioned_and_daily_series(tmp_path: Path) -> None:
+    daily = _synth(tmp_path / "src", "SPY", "1d")
+    write_partitioned(daily, tmp_path, "SPY", "1d")
+    (tmp_path / "BAD_1d.parquet").write_bytes(b"not parquet")
+
+    assert discover_series(tmp_path) == [("BAD", "1d"), ("SPY", "1d")]
+    reports = {r.symbol: r for r in scan_cache(tmp_path, max_workers=1)}
+    assert reports["BAD"].read_error is not None and not reports["BAD"].ok
+    spy = reports["SPY"]
+    assert spy.ok and spy.rows == 20 and spy.off_calendar_bars == 1 and spy.missing_bars == 0
+
+
+def test_cli_writes_machine_readable_report(tmp_path: Path) -> None:
+    _synth(tmp_path, "SPY", "1h")
+    out = tmp_path / "report.json"
+    result = CliRunner().invoke(
+        app, ["data", "check", "--cache-dir", str(tmp_path), "--out", str(out), "--workers", "1"]
+    )
+    assert result.exit_code == 0, result.output
+    report = json.loads(out.read_text())
+    assert report["summary"]["series"] == 1 and report["summary"]["failing"] == 0
+    assert report["series"][0]["ok"] is True
@@ -0,0 +1,68 @@
+from __future__ import annotations
+import math
+import random
+
+import pytest
+
+from trading.core.models import Order
+from trading.observability.histogram import LatencyHistogram
+from trading.risk.manager import BasicRiskManager, RiskParams
+
+
+def _nearest_rank(sorted_vals: list[float], p: float) -> float:
+    return sorted_vals[max(1, math.ceil(p * len(sorted_vals))) - 1]
+
+
+def test_percentiles_within_bucket_resolution() -> None:
+    rng = random.Random(42)
+    values = [rng.lognormvariate(-3.0, 1.0) for _ in range(20000)]
+    hist = LatencyHistogram(sub_buckets=128)
+    for v in values:
+        hist.record(v)
+    values.sort()
+
+    assert hist.count == len(values)
+    assert hist.max == values[-1]
+    assert hist.min == values[0]
+    assert hist.mean == pytest.approx(sum(values) / len(values))
+    for p in [0.5, 0.95, 0.99, 0.999]:
+        exact = _nearest_rank(values, p)
+        assert hist.percentile(p) == pytest.approx(exact, rel=1.0 / 128)
+
+
+def test_memory_is_fixed_and_merge_combines() -> None:
+    a = LatencyHistogram()
+    b = LatencyHistogram()
+    buckets = len(a._counts)
+    for i in range(1, 5001):
+        a.record(float(i))
+        b.record(float(i) * 10.0)
+    assert len(a._counts) == buckets
+
+    a.merge(b)
+    assert a.count == 10000
+    assert a.max == 50000.0
+    assert a.min == 1.0
+    assert a.percentile(1.0) == 50000.0
+
+    with pytest.raises(ValueError):
+        a.merge(LatencyHistogram(sub_buckets=16))
+
+
+def test_empty_histogram_reports_zeros() -> None:
+    stats = LatencyHistogram().to_dict()
+    assert stats["count"] == 0
+    assert stats["p50"] == stats["p999"] == stats["max"] == 0.0
+
+
+def test_risk_manager_records_validate_latency() -> None:
+    hist = LatencyHistogram()
+    rm = BasicRiskManager(
+        RiskParams(max_gross_exposure=1e9, per_symbol_notional_cap=1e9),
+        enable_session_gate=False,
+        latency_histogram=hist,
+    )
+    order = Order(local_id="o", symbol="SPY", side="buy", type="limit", quantity=1, limit_price=1.0)
+    assert rm.validate(order) is not None
+    assert rm.validate(order) is not None
+    assert hist.count == 2
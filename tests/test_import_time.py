@@ -0,0 +1,41 @@
+from __future__ import annotations
+import json
+import subprocess
+import sys
+
+# Cumulative import time of the CLI entry module (typer included), in microseconds.
+# Currently ~40ms; pulling pandas onto this path alone costs ~400ms.
+CLI_IMPORT_BUDGET_US = 250_000
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "pandas_market_calendars", "pydantic", "yaml")
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def test_cli_help_and_registry_do_not_import_heavy_modules() -> None:
+    code = (
+        "import sys, json\n"
+        "from trading.cli import app\n"
+        "from trading.strategy import get_strategy_names\n"
+        "get_strategy_names()\n"
+        "try:\n"
+        "    app(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(json.dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))\n"
+    )
+    loaded = json.loads(_run(code).stdout.strip().splitlines()[-1])
+    assert loaded == []
+
+
+def test_cli_import_time_budget() -> None:
+    def cumulative_us() -> int:
+        err = _run("import trading.cli", "-X", "importtime").stderr
+        line = [ln for ln in err.splitlines() if ln.rstrip().endswith("| trading.cli")][-1]
+        return int(line.split("|")[1])
+
+    # Best of three keeps a loaded machine from failing the budget spuriously
+    assert min(cumulative_us() for _ in range(3)) < CLI_IMPORT_BUDGET_US
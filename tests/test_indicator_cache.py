@@ -0,0 +1,99 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.backtest.engine import BacktestConfig, BacktestEngine
+from trading.core.contracts import Strategy
+from trading.core.models import Bar, Order
+from trading.data.synthetic import write_synthetic_bars
+from trading.indicators import batch
+from trading.indicators.cache import (
+    IndicatorCache,
+    array_fingerprint,
+    default_cache,
+    set_default_cache,
+)
+
+
+def test_memoizes_by_content_and_params() -> None:
+    cache = IndicatorCache()
+    x = np.arange(100.0)
+    first = cache.get("sma", x, window=5)
+    np.testing.assert_array_equal(first, batch.sma(x, 5))
+    assert cache.get("sma", x.copy(), window=5) is first
+    assert cache.get("sma", x, window=6) is not first
+    assert cache.get("sma", x + 1.0, window=5) is not first
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 3
+    with pytest.raises(ValueError):
+        first[0] = 1.0  # shared results are read-only
+    with pytest.raises(KeyError):
+        cache.get("nope", x)
+
+
+def test_multi_input_indicators_and_explicit_fingerprint() -> None:
+    cache = IndicatorCache()
+    h, lo, c = np.linspace(2, 3, 50), np.linspace(1, 2, 50), np.linspace(1.5, 2.5, 50)
+    fp = array_fingerprint(h, lo, c)
+    out = cache.get("atr", h, lo, c, fingerprint=fp, window=5)
+    np.testing.assert_array_equal(out, batch.atr(h, lo, c, 5))
+    assert cache.get("atr", h, lo, c, window=5) is out
+    assert array_fingerprint(h, lo, c) != array_fingerprint(lo, h, c)
+
+
+def test_lru_budget_spills_and_reloads(tmp_path: Path) -> None:
+    x = np.random.default_rng(0).normal(size=1000)  # 8000-byte results
+    cache = IndicatorCache(max_bytes=20_000, spill_dir=tmp_path)
+    for window in (2, 3, 4):
+        cache.get("sma", x, window=window)
+    assert len(cache) == 2 and cache.nbytes <= 20_000 and cache.evictions == 1
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+
+    reloaded = cache.get("sma", x, window=2)
+    assert cache.spill_hits == 1 and cache.misses == 3
+    np.testing.assert_array_equal(reloaded, batch.sma(x, 2))
+    # Another process pointing at the same directory reuses the spilled result
+    other = IndicatorCache(spill_dir=tmp_path)
+    other.get("sma", x, window=2)
+    assert other.spill_hits == 1 and other.misses == 0
+
+
+class CachedSMA(Strategy):
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.sma: Optional[np.ndarray] = None
+
+    def prepare(self, bars: pd.DataFrame) -> None:
+        self.sma = default_cache().get("sma", bars["close"].to_numpy(), window=self.window)
+
+    def on_bar(self, bar: Bar) -> Optional[Order]:
+        return None
+
+
+def test_engine_prepare_shares_columns_across_runs(tmp_path: Path) -> None:
+    write_synthetic_bars(["AAA", "BBB"], "1d", "2024-01-01", "2024-03-01", tmp_path, seed=4)
+    cache = IndicatorCache()
+    set_default_cache(cache)
+    try:
+        for run_id, window in (("r1", 5), ("r2", 5), ("r3", 10)):
+            cfg = BacktestConfig(
+                symbols=["AAA", "BBB"],
+                interval="1d",
+                cache_dir=tmp_path,
+                run_id=run_id,
+                out_dir=tmp_path / "runs",
+            )
+            strategies: dict[str, CachedSMA] = {}
+
+            def factory(sym: str) -> CachedSMA:
+                strategies[sym] = CachedSMA(window)
+                return strategies[sym]
+
+            BacktestEngine(strategy_factory=factory, config=cfg).run()
+            assert strategies["AAA"].sma is not None and len(strategies["AAA"].sma) == 45
+    finally:
+        set_default_cache(None)
+    assert cache.misses == 4 and cache.hits == 2
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.indicators import batch
+
+
+@pytest.fixture
+def prices() -> np.ndarray:
+    rng = np.random.default_rng(7)
+    return 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(300, 4)), axis=0))
+
+
+def test_rolling_indicators_match_pandas(prices: np.ndarray) -> None:
+    df = pd.DataFrame(prices)
+    np.testing.assert_allclose(batch.sma(prices, 20), df.rolling(20).mean(), rtol=1e-10)
+    np.testing.assert_allclose(
+        batch.ema(prices, 10), df.ewm(span=10, adjust=False, min_periods=10).mean()
+    )
+    np.testing.assert_allclose(batch.rolling_min(prices, 5), df.rolling(5).min())
+    np.testing.assert_allclose(batch.rolling_max(prices, 5), df.rolling(5).max())
+    weights = np.arange(1, 11)
+    expected = df.rolling(10).apply(lambda w: np.dot(w, weights) / weights.sum(), raw=True)
+    np.testing.assert_allclose(batch.wma(prices, 10), expected, rtol=1e-10)
+    vol = df.pct_change().rolling(20).std() * np.sqrt(252)
+    np.testing.assert_allclose(batch.rolling_volatility(prices, 20, periods_per_year=252), vol)
+
+
+def test_panel_columns_equal_one_dimensional_calls(prices: np.ndarray) -> None:
+    for fn in (batch.sma, batch.ema, batch.wma, batch.rsi, batch.zscore):
+        panel = fn(prices, 14)
+        assert panel.shape == prices.shape
+        for j in range(prices.shape[1]):
+            np.testing.assert_allclose(panel[:, j], fn(prices[:, j], 14), rtol=1e-12)
+
+
+def test_warm_up_rows_are_nan(prices: np.ndarray) -> None:
+    close = prices[:, 0]
+    assert (
+        np.isnan(batch.sma(close, 20)[:19]).all() and not np.isnan(batch.sma(close, 20)[19:]).any()
+    )
+    assert np.isnan(batch.ema(close, 20)[:19]).all() and not np.isnan(batch.ema(close, 20)[19])
+    # Differences lose a row, so RSI and volatility need window + 1 prices
+    assert np.isnan(batch.rsi(close, 14)[:14]).all() and not np.isnan(batch.rsi(close, 14)[14])
+    assert np.isnan(batch.rolling_volatility(close, 10)[:10]).all()
+    assert np.isnan(batch.sma(close[:5], 20)).all() and np.isnan(batch.wma(close[:5], 20)).all()
+    m = batch.macd(close)
+    assert np.isnan(m.macd[:25]).all() and not np.isnan(m.macd[25])
+    assert np.isnan(m.signal[:33]).all() and not np.isnan(m.signal[33])
+
+
+def test_panel_gaps_do_not_leak(prices: np.ndarray) -> None:
+    gappy = prices.copy()
+    gappy[100, 1] = np.nan
+    out = batch.sma(gappy, 10)
+    assert np.isnan(out[100:110, 1]).all() and not np.isnan(out[110, 1])
+    np.testing.assert_allclose(out[:, 0], batch.sma(prices[:, 0], 10))
+    assert np.isnan(batch.ema(gappy, 10)[100, 1]) and not np.isnan(batch.ema(gappy, 10)[101, 1])
+
+
+def test_rsi_bollinger_zscore_and_atr() -> None:
+    rising = np.arange(1.0, 40.0)
+    assert (batch.rsi(rising, 14)[14:] == 100.0).all()
+    assert (batch.rsi(np.full(30, 5.0), 14)[14:] == 50.0).all()
+    zig = np.tile([1.0, 2.0], 20)
+    r = batch.rsi(zig, 14)[14:]
+    assert ((r > 30) & (r < 70)).all()
+
+    x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    bands = batch.bollinger(x, window=5, k=2.0)
+    assert bands.middle[-1] == 3.0 and bands.upper[-1] == pytest.approx(3.0 + 2 * np.sqrt(2.0))
+    assert batch.zscore(x, 5)[-1] == pytest.approx(2.0 / np.sqrt(2.0))
+    assert np.isnan(batch.zscore(np.ones(5), 5)[-1])
+
+    high, low, close = (
+        np.array([10.0, 12.0, 11.0]),
+        np.array([9.0, 10.5, 8.0]),
+        np.array([9.5, 11.0, 9.0]),
+    )
+    np.testing.assert_allclose(batch.true_range(high, low, close), [1.0, 2.5, 3.0])
+    np.testing.assert_allclose(batch.atr(high, low, close, 2)[1:], [1.75, 2.375])
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        batch.sma(np.ones(10), 0)
+    with pytest.raises(ValueError):
+        batch.sma(np.ones((2, 2, 2)), 2)
+    with pytest.raises(ValueError):
+        batch.macd(np.ones(50), fast=26, slow=12)
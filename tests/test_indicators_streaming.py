@@ -0,0 +1,91 @@
+from __future__ import annotations
+from typing import Any, Callable
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+from trading.indicators import batch
+from trading.indicators.streaming import (
+    StreamingATR,
+    StreamingEMA,
+    StreamingMax,
+    StreamingMin,
+    StreamingRSI,
+    StreamingSMA,
+)
+
+
+Bars = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+@pytest.fixture
+def bars() -> Bars:
+    rng = np.random.default_rng(11)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, 500)))
+    close[[120, 121, 300]] = np.nan  # gaps, as in a panel column
+    spread = np.abs(rng.normal(0, 0.5, 500))
+    return close + spread, close - spread, close
+
+
+def _stream(indicator: Any, values: np.ndarray) -> np.ndarray:
+    return np.array([indicator.update(v) for v in values])
+
+
+@pytest.mark.parametrize(
+    "make, fn",
+    [
+        (lambda: StreamingSMA(20), lambda x: batch.sma(x, 20)),
+        (lambda: StreamingEMA(20), lambda x: batch.ema(x, 20)),
+        (lambda: StreamingRSI(14), lambda x: batch.rsi(x, 14)),
+        (lambda: StreamingMin(10), lambda x: batch.rolling_min(x, 10)),
+        (lambda: StreamingMax(10), lambda x: batch.rolling_max(x, 10)),
+    ],
+)
+def test_streaming_matches_batch(
+    make: Callable[[], Any], fn: Callable[[np.ndarray], np.ndarray], bars: Bars
+) -> None:
+    close = bars[2]
+    np.testing.assert_allclose(_stream(make(), close), fn(close), rtol=1e-10, equal_nan=True)
+
+
+def test_streaming_atr_matches_batch(bars: Bars) -> None:
+    high, low, close = bars
+    atr = StreamingATR(14)
+    out = np.array([atr.update(h, lo, c) for h, lo, c in zip(high, low, close)])
+    np.testing.assert_allclose(out, batch.atr(high, low, close, 14), rtol=1e-10, equal_nan=True)
+
+
+def test_sma_running_sum_does_not_drift() -> None:
+    rng = np.random.default_rng(0)
+    values = 1e6 + rng.normal(0, 1.0, 100_000)
+    sma = StreamingSMA(50)
+    for v in values:
+        sma.update(v)
+    assert sma.value == pytest.approx(values[-50:].mean(), rel=1e-15)
+
+
+@pytest.mark.parametrize("cls", [StreamingSMA, StreamingEMA, StreamingRSI, StreamingMax])
+def test_state_round_trip_resumes_identically(cls: Any, bars: Bars) -> None:
+    close = bars[2]
+    full = cls(14)
+    expected = _stream(full, close)
+    head = cls(14)
+    _stream(head, close[:250])
+    restored = cls.from_state(json.loads(json.dumps(head.state())))
+    np.testing.assert_array_equal(_stream(restored, close[250:]), expected[250:])
+    unpickled = pickle.loads(pickle.dumps(full))
+    assert unpickled.update(101.0) == full.update(101.0)
+
+
+def test_slots_and_validation() -> None:
+    sma = StreamingSMA(3)
+    with pytest.raises(AttributeError):
+        sma.extra = 1  # type: ignore[attr-defined]
+    assert np.isnan(sma.value)
+    for v in (1.0, 2.0, 3.0):
+        sma.update(v)
+    assert sma.ready and sma.value == 2.0
+    with pytest.raises(ValueError):
+        StreamingEMA(0)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.data.panel import Panel, end_ns, load_panel, union_timeline
+from trading.data.synthetic import write_synthetic_bars
+
+
+def test_union_timeline_sorts_and_dedupes() -> None:
+    out = union_timeline([np.array([3, 5, 9]), np.array([1, 5, 7]), np.array([], dtype=np.int64)])
+    assert out.tolist() == [1, 3, 5, 7, 9]
+    assert union_timeline([]).tolist() == []
+
+
+def test_panel_aligns_ragged_series(tmp_path: Path) -> None:
+    write_synthetic_bars(["AAA", "BBB"], "1d", "2024-01-01", "2024-02-01", tmp_path, seed=3)
+    bbb = pd.read_parquet(tmp_path / "BBB_1d.parquet")
+    bbb.iloc[5:].iloc[::2].to_parquet(tmp_path / "BBB_1d.parquet", index=False)
+
+    panel = load_panel(tmp_path, ["AAA", "BBB", "ZZZ"], "1d", max_workers=4)
+    assert panel.symbols == ["AAA", "BBB"] and panel.missing == ["ZZZ"]
+    aaa = pd.read_parquet(tmp_path / "AAA_1d.parquet")
+    assert panel.shape == (len(aaa), 2)
+    assert (
+        panel.end.tolist()
+        == pd.DatetimeIndex(aaa["end"]).to_numpy("datetime64[ns]").view("int64").tolist()
+    )
+
+    valid = panel.valid[:, 1]
+    sparse = pd.read_parquet(tmp_path / "BBB_1d.parquet")
+    assert valid.sum() == len(sparse) and not valid[:5].any()
+    np.testing.assert_array_equal(panel["close"][valid, 1], sparse["close"].to_numpy())
+    assert np.isnan(panel["close"][~valid, 1]).all()
+    assert (panel["volume"][~valid, 1] == 0).all()
+    np.testing.assert_array_equal(panel["volume"][:, 0], aaa["volume"].to_numpy())
+
+
+def test_panel_projection_and_dtype(tmp_path: Path) -> None:
+    write_synthetic_bars(["AAA"], "1h", "2024-01-02", "2024-01-05", tmp_path, seed=1)
+    panel = load_panel(tmp_path, ["AAA"], "1h", fields=["close"], price_dtype=np.float32)
+    assert list(panel.fields) == ["close"] and panel["close"].dtype == np.float32
+    with pytest.raises(ValueError):
+        load_panel(tmp_path, ["AAA"], "1h", fields=["vwap"])
+
+
+def test_from_series_accepts_loaded_frames(tmp_path: Path) -> None:
+    write_synthetic_bars(["AAA"], "1d", "2024-01-01", "2024-01-10", tmp_path, seed=2)
+    df = pd.read_parquet(tmp_path / "AAA_1d.parquet")
+    panel = Panel.from_series({"AAA": df})
+    assert panel.valid.all() and panel.column("AAA") == 0
+    np.testing.assert_array_equal(panel["open"][:, 0], df["open"].to_numpy())
+
+
+def test_end_ns_normalizes_the_datetime_unit() -> None:
+    ends = pd.date_range("2024-01-01", periods=3, freq="D", tz="America/New_York")
+    expected = [pd.Timestamp(ts).value for ts in ends]
+    for unit in ("ns", "us", "s"):
+        assert end_ns(pd.DataFrame({"end": ends.as_unit(unit)})).tolist() == expected
@@ -1,8 +1,10 @@
 from __future__ import annotations
 from pathlib import Path
 from datetime import datetime, timezone
+from typing import Any
 
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
 from trading.data.parquet_adapter import ParquetLatestBarAdapter
@@ -120,3 +122,112 @@ def test_series_loader_rejects_duplicate_timestamps(tmp_path: Path) -> None:
     _write_parquet(file, rows)
     with pytest.raises(Exception):
         load_parquet_series(base, "SPY", "1d")
+
+
+def _write_row_groups(path: Path, ends: pd.DatetimeIndex, closes: list[float]) -> None:
+    df = pd.DataFrame(
+        {
+            "symbol": "SPY",
+            "end": ends,
+            "open": closes,
+            "high": closes,
+            "low": closes,
+            "close": closes,
+            "volume": 1000,
+        }
+    )
+    df.to_parquet(path, index=False, row_group_size=2)
+
+
+def test_latest_bar_reads_only_last_row_group(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Rows stored out of order: the newest bar sits in the middle row group
+    ends = pd.DatetimeIndex(
+        ["2024-01-01", "2024-01-02", "2024-01-05", "2024-01-03", "2024-01-04"], tz="UTC"
+    )
+    _write_row_groups(tmp_path / "SPY_1d.parquet", ends, [1.0, 2.0, 5.0, 3.0, 4.0])
+    reads: list[int] = []
+    original = pq.ParquetFile.read_row_group
+
+    def spy(self: pq.ParquetFile, i: int, *args: Any, **kwargs: Any) -> Any:
+        reads.append(i)
+        return original(self, i, *args, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_group", spy)
+    adapter = ParquetLatestBarAdapter(base_dir=tmp_path)
+    bar = adapter.latest_completed_bar("SPY", "1d")
+    assert bar is not None and bar.close == 5.0
+    assert bar.end == datetime(2024, 1, 5, tzinfo=timezone.utc)
+    assert reads == [1]
+
+    # Unchanged file: served from cache without touching Parquet
+    assert adapter.latest_completed_bar("SPY", "1d") == bar
+    assert reads == [1]
+
+
+def test_latest_bar_cache_invalidates_on_rewrite(tmp_path: Path) -> None:
+    path = tmp_path / "SPY_1d.parquet"
+    _write_row_groups(path, pd.date_range("2024-01-01", periods=3, tz="UTC"), [1.0, 2.0, 3.0])
+    adapter = ParquetLatestBarAdapter(base_dir=tmp_path)
+    first = adapter.latest_completed_bar("SPY", "1d")
+    assert first is not None and first.close == 3.0
+
+    _write_row_groups(path, pd.date_range("2024-01-01", periods=4, tz="UTC"), [1.0, 2.0, 3.0, 4.0])
+    second = adapter.latest_completed_bar("SPY", "1d")
+    assert second is not None and second.close == 4.0
+
+
+def test_latest_completed_bars_batch_and_partitioned_store(tmp_path: Path) -> None:
+    from trading.data.partitioned import write_partitioned
+
+    _write_row_groups(
+        tmp_path / "SPY_1d.parquet", pd.date_range("2024-01-01", periods=3, tz="UTC"), [1, 2, 3]
+    )
+    qqq = pd.DataFrame(
+        {
+            "symbol": "QQQ",
+            "end": pd.date_range("2023-12-30", periods=4, tz="UTC"),
+            "open": 7.0,
+            "high": 7.0,
+            "low": 7.0,
+            "close": [7.0, 7.0, 7.0, 8.0],
+            "volume": 10,
+        }
+    )
+    write_partitioned(qqq, tmp_path, "QQQ", "1d")
+
+    bars = ParquetLatestBarAdapter(base_dir=tmp_path).latest_completed_bars(
+        ["SPY", "QQQ", "IWM"], "1D"
+    )
+    assert list(bars) == ["SPY", "QQQ", "IWM"]
+    assert bars["SPY"] is not None and bars["SPY"].close == 3.0
+    assert bars["QQQ"] is not None and bars["QQQ"].close == 8.0
+    assert bars["QQQ"].end == datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert bars["IWM"] is None
+
+
+def test_partitions_win_over_stale_flat_file(tmp_path: Path) -> None:
+    from trading.data.partitioned import write_partitioned
+
+    ends = pd.date_range("2024-01-01 21:00", periods=7, freq="D", tz="UTC")
+    full = pd.DataFrame(
+        {
+            "symbol": "SPY",
+            "end": ends,
+            "open": 100.0,
+            "high": 101.0,
+            "low": 99.0,
+            "close": [100.0 + i for i in range(7)],
+            "volume": 1000,
+        }
+    )
+    # 'data partition' keeps the flat file; an incremental download then extends only
+    # the partitions, leaving the flat copy two bars behind
+    full.iloc[:5].to_parquet(tmp_path / "SPY_1d.parquet", index=False)
+    write_partitioned(full, tmp_path, "SPY", "1d")
+
+    bar = ParquetLatestBarAdapter(base_dir=tmp_path).latest_completed_bar("SPY", "1D")
+    loaded = load_parquet_series(tmp_path, "SPY", "1d")
+    assert bar is not None and bar.close == 106.0
+    assert pd.Timestamp(bar.end) == loaded["end"].iloc[-1] == ends[-1]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from trading.backtest import result_cache
+from trading.backtest.engine import BacktestConfig, load_series
+from trading.data.partitioned import (
+    partition_dir,
+    partition_files,
+    partition_flat_cache,
+    write_partitioned,
+)
+from trading.data.series_loader import load_parquet_series, series_exists
+
+
+def _bars(symbol: str, start: str, periods: int, close: float = 100.0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "end": pd.date_range(start, periods=periods, freq="D", tz="UTC"),
+            "open": close,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": 1000,
+        }
+    )
+
+
+@pytest.fixture()
+def flat_cache(tmp_path: Path) -> Path:
+    base = tmp_path / "cache"
+    base.mkdir()
+    # Three calendar years, written out of order to exercise sorting
+    _bars("SPY", "2022-11-01", 500).iloc[::-1].to_parquet(base / "SPY_1d.parquet", index=False)
+    return base
+
+
+def test_partitioned_store_matches_flat_cache(flat_cache: Path, tmp_path: Path) -> None:
+    store = tmp_path / "store"
+    written = partition_flat_cache(flat_cache, store)
+    assert sorted(p.parent.name for p in written) == ["year=2022", "year=2023", "year=2024"]
+    assert series_exists(store, "SPY", "1d") and not series_exists(store, "QQQ", "1d")
+
+    pd.testing.assert_frame_equal(
+        load_parquet_series(store, "SPY", "1d"), load_parquet_series(flat_cache, "SPY", "1d")
+    )
+
+
+def test_window_is_half_open_and_prunes_years(flat_cache: Path, tmp_path: Path) -> None:
+    store = tmp_path / "store"
+    partition_flat_cache(flat_cache, store)
+
+    for base in (flat_cache, store):
+        window = load_parquet_series(base, "SPY", "1d", "2023-04-01", "2023-07-01")
+        assert window["end"].iloc[0] == pd.Timestamp("2023-04-01", tz="UTC")
+        assert window["end"].iloc[-1] == pd.Timestamp("2023-06-30", tz="UTC")
+        assert len(window) == 91
+
+    files = partition_files(store, "SPY", "1d", "2023-04-01", "2024-01-01")
+    assert [p.parent.name for p in files] == ["year=2023"]
+    assert len(partition_files(store, "SPY", "1d", start="2024-02-01")) == 1
+
+    cfg = BacktestConfig(
+        symbols=["SPY"],
+        interval="1d",
+        cache_dir=store,
+        run_id="w",
+        start="2024-01-01",
+        end="2024-01-11",
+    )
+    assert len(load_series(cfg)["SPY"]) == 10
+
+
+def test_write_partitioned_merges_and_overwrites(tmp_path: Path) -> None:
+    write_partitioned(_bars("SPY", "2024-12-20", 10), tmp_path, "SPY", "1d")
+    # Overlapping update: last three days revised, five new days in the next year
+    write_partitioned(_bars("SPY", "2024-12-27", 8, close=200.0), tmp_path, "SPY", "1d")
+
+    df = load_parquet_series(tmp_path, "SPY", "1d")
+    assert len(df) == 15
+    assert df["end"].is_monotonic_increasing
+    assert (df.loc[df["end"] >= pd.Timestamp("2024-12-27", tz="UTC"), "close"] == 200.0).all()
+    years = sorted(p.name for p in partition_dir(tmp_path, "SPY", "1d").iterdir())
+    assert years == ["year=2024", "year=2025"]
+
+
+def test_result_cache_key_ignores_partitions_outside_window(tmp_path: Path) -> None:
+    write_partitioned(_bars("SPY", "2023-01-01", 365), tmp_path, "SPY", "1d")
+    cfg = BacktestConfig(
+        symbols=["SPY"], interval="1d", cache_dir=tmp_path, run_id="r", end="2024-01-01"
+    )
+    before = result_cache.result_cache_key(cfg, "sha")
+    write_partitioned(_bars("SPY", "2024-01-01", 30), tmp_path, "SPY", "1d")
+    assert result_cache.result_cache_key(cfg, "sha") == before
+
+    cfg.end = None
+    assert result_cache.result_cache_key(cfg, "sha") != before
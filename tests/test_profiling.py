@@ -0,0 +1,95 @@
+from __future__ import annotations
+import json
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from trading.backtest.engine import BacktestConfig, BacktestEngine
+from trading.core.contracts import Strategy
+from trading.core.models import Bar, Order
+from trading.observability.profiling import StageProfiler
+from trading.reporting.report import generate_html_report
+
+
+class BuyOnce(Strategy):
+    def __init__(self) -> None:
+        self.done = False
+
+    def on_bar(self, bar: Bar) -> Optional[Order]:
+        if self.done:
+            return None
+        self.done = True
+        return Order(local_id="o1", symbol=bar.symbol, side="buy", type="market", quantity=1)
+
+
+def _write_cache(cache_dir: Path) -> None:
+    ends = pd.date_range("2024-01-01", periods=5, freq="D", tz="UTC")
+    pd.DataFrame(
+        {
+            "symbol": "SPY",
+            "end": ends,
+            "open": 100.0,
+            "high": 101.0,
+            "low": 99.0,
+            "close": 100.5,
+            "volume": 1000,
+        }
+    ).to_parquet(cache_dir / "SPY_1d.parquet", index=False)
+
+
+def test_stage_profiler_attributes_laps() -> None:
+    prof = StageProfiler()
+    prof.start()
+    prof.lap("on_bar")
+    prof.lap("on_bar")
+    prof.lap("snapshot")
+    summary = prof.summary()
+    assert summary["on_bar"]["count"] == 2
+    assert summary["snapshot"]["count"] == 1
+    assert "bar_lookup" not in summary
+    assert all(0.0 <= st["share"] <= 1.0 for st in summary.values())
+    for key in ["total_ms", "avg", "max", "p50", "p95", "p99"]:
+        assert key in summary["on_bar"]
+
+
+def test_engine_summary_and_report_include_stages(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    _write_cache(cache_dir)
+    cfg = BacktestConfig(
+        symbols=["SPY"], interval="1d", cache_dir=cache_dir, run_id="on", out_dir=tmp_path
+    )
+    BacktestEngine(strategy_factory=lambda s: BuyOnce(), config=cfg).run()
+
+    summary = json.loads((tmp_path / "on" / "summary.json").read_text("utf-8"))
+    stages = summary["observability"]["stages_ms"]
+    assert stages["bar_lookup"]["count"] == 5
+    assert stages["on_bar"]["count"] == 5
+    assert stages["risk_validate"]["count"] == 1
+    assert stages["simulate_fill"]["count"] == 1
+    assert stages["apply_fill"]["count"] == 1
+    assert stages["snapshot"]["count"] == 5
+    assert stages["exposure_scan"]["count"] == 5
+
+    html = generate_html_report(tmp_path / "on").read_text("utf-8")
+    assert "Hot-path stages" in html and "simulate_fill" in html
+
+
+def test_engine_profiling_can_be_disabled(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    _write_cache(cache_dir)
+    cfg = BacktestConfig(
+        symbols=["SPY"],
+        interval="1d",
+        cache_dir=cache_dir,
+        run_id="off",
+        out_dir=tmp_path,
+        profile_stages=False,
+    )
+    BacktestEngine(strategy_factory=lambda s: BuyOnce(), config=cfg).run()
+
+    summary = json.loads((tmp_path / "off" / "summary.json").read_text("utf-8"))
+    assert summary["observability"]["stages_ms"] is None
+    assert summary["observability"]["timers"]["bar_loop_ms"]["count"] == 5
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from trading.backtest.recorders import (
+    EQUITY_SCHEMA,
+    ORDERS_SCHEMA,
+    ParquetRecorder,
+    ledger_files,
+    read_ledger,
+)
+
+
+def test_recorder_flushes_in_batches_with_native_timestamps(tmp_path: Path) -> None:
+    path = tmp_path / "equity.parquet"
+    rec = ParquetRecorder(path, EQUITY_SCHEMA, flush_every=4)
+    start = pd.Timestamp("2024-01-02", tz="UTC").value
+    for i in range(10):
+        rec.append(start + i * 60_000_000_000, 100.0 + i, 100.0 + i, 0.0, 0.0)
+    # Two full batches already streamed to disk, remainder still buffered
+    assert path.exists()
+    rec.close()
+
+    pf = pq.ParquetFile(path)
+    assert pf.metadata.num_rows == 10
+    assert pf.metadata.num_row_groups == 3
+    assert pf.schema_arrow.field("ts").type == pa.timestamp("ns", tz="UTC")
+    df = pf.read().to_pandas()
+    assert df["ts"].iloc[0] == pd.Timestamp("2024-01-02", tz="UTC")
+    assert df["cash"].tolist() == [100.0 + i for i in range(10)]
+    assert rec.rows == 10
+
+
+def test_recorder_without_rows_writes_nothing(tmp_path: Path) -> None:
+    path = tmp_path / "orders.parquet"
+    rec = ParquetRecorder(path, ORDERS_SCHEMA)
+    rec.close()
+    assert not path.exists()
+
+
+def test_append_writes_a_new_segment(tmp_path: Path) -> None:
+    path = tmp_path / "equity.parquet"
+    start = pd.Timestamp("2024-01-02", tz="UTC").value
+    rec = ParquetRecorder(path, EQUITY_SCHEMA, flush_every=4)
+    for i in range(5):
+        rec.append(start + i, 100.0 + i, 100.0 + i, 0.0, 0.0)
+    rec.close()
+    first = path.stat().st_mtime_ns
+
+    for run in range(2):
+        rec = ParquetRecorder(path, EQUITY_SCHEMA, flush_every=4, append=True)
+        assert rec.rows == 5 + 3 * run
+        for i in range(3):
+            rec.append(start + 10 * (run + 1) + i, 0.0, 0.0, 0.0, 0.0)
+        rec.close()
+
+    assert [p.name for p in ledger_files(path)] == [
+        "equity.parquet",
+        "equity.1.parquet",
+        "equity.2.parquet",
+    ]
+    assert path.stat().st_mtime_ns == first
+    assert read_ledger(path, ["ts"]).num_rows == rec.rows == 11
+
+    # A fresh (non-append) recorder drops the old segments with the file
+    ParquetRecorder(path, EQUITY_SCHEMA).close()
+    assert ledger_files(path) == []
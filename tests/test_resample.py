@@ -0,0 +1,119 @@
+from __future__ import annotations
+from pathlib import Path
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.backtest.metrics import periods_per_year
+from trading.data import resample
+from trading.data.resample import derived_path, ensure_resampled, resample_bars
+from trading.data.series_loader import load_parquet_series, series_exists, source_files
+from trading.data.synthetic import SynthParams, write_synthetic_bars
+
+
+@pytest.fixture()
+def minute_cache(tmp_path: Path) -> Path:
+    # Thanksgiving week: a holiday (synthetic bars still emitted) and a 13:00 early close
+    write_synthetic_bars(
+        ["SPY"],
+        interval="1m",
+        start="2024-11-25",
+        end="2024-11-29",
+        out_dir=tmp_path,
+        params=SynthParams(missing_prob=0.02),
+        seed=3,
+    )
+    return tmp_path
+
+
+def test_hourly_bars_follow_exchange_sessions(minute_cache: Path) -> None:
+    minute = load_parquet_series(minute_cache, "SPY", "1m")
+    hourly = resample_bars(minute, "1h")
+
+    days = hourly["end"].dt.tz_convert("America/New_York").dt.date.astype(str)
+    assert "2024-11-28" not in set(days)
+    counts = days.value_counts()
+    assert counts["2024-11-25"] == 7 and counts["2024-11-29"] == 4
+    assert hourly["end"].iloc[-1] == pd.Timestamp("2024-11-29 18:00", tz="UTC")
+
+    # Every hourly bar aggregates exactly the minute bars ending in its bucket
+    for _, bar in hourly.sample(5, random_state=0).iterrows():
+        lo = max(bar["end"] - pd.Timedelta(hours=1), bar["end"].floor("D"))
+        sub = minute[(minute["end"] > lo) & (minute["end"] <= bar["end"])]
+        assert bar["open"] == sub["open"].iloc[0]
+        assert bar["close"] == sub["close"].iloc[-1]
+        assert bar["high"] == sub["high"].max() and bar["low"] == sub["low"].min()
+        assert bar["volume"] == sub["volume"].sum()
+
+
+def test_daily_bars_and_incomplete_trailing_bucket(minute_cache: Path) -> None:
+    minute = load_parquet_series(minute_cache, "SPY", "1m")
+    daily = resample_bars(minute, "1d")
+    assert len(daily) == 4
+    assert daily["end"].iloc[-1] == pd.Timestamp("2024-11-29 18:00", tz="UTC")
+    # Holiday and after-close minutes are dropped; the rest sum the same at any interval
+    hourly = resample_bars(minute, "1h")
+    assert daily["volume"].sum() == hourly["volume"].sum()
+    assert daily["high"].max() == hourly["high"].max()
+
+    # Cut the source mid-session: the forming daily bar is not emitted
+    partial = minute[minute["end"] < pd.Timestamp("2024-11-27 17:00", tz="UTC")]
+    assert len(resample_bars(partial, "1d")) == 2
+    assert len(resample_bars(partial, "1d", complete_only=False)) == 3
+
+
+def test_loader_derives_and_reuses_until_source_changes(minute_cache: Path) -> None:
+    assert series_exists(minute_cache, "SPY", "15m")
+    assert not series_exists(minute_cache, "QQQ", "15m")
+    assert source_files(minute_cache, "SPY", "15m") == [minute_cache / "SPY_1m.parquet"]
+
+    df = load_parquet_series(minute_cache, "SPY", "15m")
+    path = derived_path(minute_cache, "SPY", "15m")
+    assert path.exists() and len(df) == 26 * 3 + 14
+    built = path.stat().st_mtime_ns
+    window = load_parquet_series(minute_cache, "SPY", "15m", "2024-11-26", "2024-11-27")
+    assert len(window) == 26 and path.stat().st_mtime_ns == built
+
+    # Rewriting the 1m source invalidates the derived file
+    source = minute_cache / "SPY_1m.parquet"
+    minute = pd.read_parquet(source)
+    minute["close"] = minute["close"] * 2
+    minute.to_parquet(source, index=False)
+    os.utime(source, ns=(built + 10**9, built + 10**9))
+    assert ensure_resampled(minute_cache, "SPY", "15m") == path
+    assert path.stat().st_mtime_ns != built
+    assert np.allclose(load_parquet_series(minute_cache, "SPY", "15m")["close"], df["close"] * 2)
+
+
+def test_unchanged_source_is_not_rehashed(
+    minute_cache: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from trading.data import hashing
+
+    path = ensure_resampled(minute_cache, "SPY", "15m")
+    built = path.stat().st_mtime_ns
+
+    def forbidden(*args: object, **kwargs: object) -> str:
+        raise AssertionError("source was hashed or resampled again")
+
+    # A new process has no memoized digests; the footer stamp alone proves it current
+    monkeypatch.setattr(hashing, "_DIGEST_CACHE", {})
+    monkeypatch.setattr(resample, "file_sha256", forbidden)
+    assert ensure_resampled(minute_cache, "SPY", "15m") == path
+
+    # Touching the source forces one hash; same content re-stamps instead of rebuilding
+    monkeypatch.undo()
+    monkeypatch.setattr(resample, "resample_bars", forbidden)
+    source = minute_cache / "SPY_1m.parquet"
+    os.utime(source, ns=(built + 10**9, built + 10**9))
+    assert ensure_resampled(minute_cache, "SPY", "15m") == path
+    monkeypatch.setattr(resample, "file_sha256", forbidden)
+    assert ensure_resampled(minute_cache, "SPY", "15m") == path
+
+
+def test_periods_per_year_scales_with_interval() -> None:
+    assert periods_per_year("1h") == int(252 * 6.5)
+    assert periods_per_year("15m") == 252 * 26
+    assert periods_per_year("weird") == 252
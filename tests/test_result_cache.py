@@ -0,0 +1,233 @@
+from __future__ import annotations
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+import pytest
+
+from trading.backtest import result_cache
+from trading.backtest.engine import BacktestConfig, BacktestEngine
+from trading.core.contracts import Strategy
+from trading.core.models import Bar
+
+
+class NoopStrategy(Strategy):
+    def on_bar(self, bar: Bar) -> None:
+        return None
+
+
+def _write_cache(cache_dir: Path, close: float) -> None:
+    ends = pd.date_range("2024-01-01", periods=3, freq="D", tz="UTC")
+    pd.DataFrame(
+        {
+            "symbol": "SPY",
+            "end": ends,
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "volume": 1000,
+        }
+    ).to_parquet(cache_dir / "SPY_1d.parquet", index=False)
+
+
+@pytest.fixture()
+def clean_tree(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(result_cache, "code_version", lambda: "test-sha")
+
+
+def _run(tmp_path: Path, run_id: str, calls: list[str]) -> BacktestEngine:
+    cfg = BacktestConfig(
+        symbols=["SPY"],
+        interval="1d",
+        cache_dir=tmp_path / "cache",
+        run_id=run_id,
+        out_dir=tmp_path / "runs",
+        result_cache_dir=tmp_path / "runs" / ".result_cache",
+    )
+
+    def factory(sym: str) -> Strategy:
+        calls.append(sym)
+        return NoopStrategy()
+
+    engine = BacktestEngine(strategy_factory=factory, config=cfg)
+    engine.run()
+    return engine
+
+
+def test_repeat_run_reuses_cached_artifacts(tmp_path: Path, clean_tree: None) -> None:
+    (tmp_path / "cache").mkdir()
+    _write_cache(tmp_path / "cache", 100.0)
+    calls: list[str] = []
+
+    _run(tmp_path, "first", calls)
+    assert calls == ["SPY"]
+    second = _run(tmp_path, "second", calls)
+    assert calls == ["SPY"]  # no strategy was built: nothing recomputed
+
+    run_dir = tmp_path / "runs" / "second"
+    summary = json.loads((run_dir / "summary.json").read_text("utf-8"))
+    assert summary["run_id"] == "second"
+    assert summary["cache"]["hit"] is True
+    assert summary["cache"]["source_run_id"] == "first"
+    assert second.summary == summary
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(run_dir / "equity.parquet"),
+        pd.read_parquet(tmp_path / "runs" / "first" / "equity.parquet"),
+    )
+
+
+def test_changed_inputs_miss_the_cache(tmp_path: Path, clean_tree: None) -> None:
+    (tmp_path / "cache").mkdir()
+    _write_cache(tmp_path / "cache", 100.0)
+    calls: list[str] = []
+    _run(tmp_path, "first", calls)
+
+    _write_cache(tmp_path / "cache", 101.0)
+    _run(tmp_path, "second", calls)
+    assert calls == ["SPY", "SPY"]
+    summary = json.loads((tmp_path / "runs" / "second" / "summary.json").read_text("utf-8"))
+    assert "cache" not in summary
+
+
+def test_unknown_code_version_bypasses_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(result_cache, "code_version", lambda: None)
+    (tmp_path / "cache").mkdir()
+    _write_cache(tmp_path / "cache", 100.0)
+    calls: list[str] = []
+    _run(tmp_path, "first", calls)
+    _run(tmp_path, "second", calls)
+    assert calls == ["SPY", "SPY"]
+    assert not (tmp_path / "runs" / ".result_cache").exists()
+
+
+def test_code_version_ignores_working_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = result_cache.code_version()
+    monkeypatch.chdir(tmp_path)
+    assert result_cache.code_version() == expected
+
+
+class _FakeDistribution:
+    version = "1.2.3"
+
+    def __init__(self, root: Path, direct_url: Optional[dict[str, Any]]) -> None:
+        self.root = root
+        self.direct_url = direct_url
+
+    def locate_file(self, path: str) -> Path:
+        return self.root / path
+
+    def read_text(self, name: str) -> Optional[str]:
+        assert name == "direct_url.json"
+        return None if self.direct_url is None else json.dumps(self.direct_url)
+
+
+@pytest.mark.parametrize(
+    "direct_url, expected",
+    [
+        (None, "trading-app==1.2.3"),
+        ({"url": "file:///w/a.whl", "archive_info": {"hash": "sha256=ab"}}, "trading-app==1.2.3"),
+        (
+            {"url": "git+https://x", "vcs_info": {"vcs": "git", "commit_id": "c0ffee"}},
+            "trading-app==1.2.3+c0ffee",
+        ),
+        ({"url": "file:///src/trading", "dir_info": {"editable": True}}, None),
+        ({"url": "file:///src/trading", "dir_info": {}}, None),
+    ],
+)
+def test_code_version_falls_back_to_regular_installs_only(
+    monkeypatch: pytest.MonkeyPatch, direct_url: Optional[dict[str, Any]], expected: Optional[str]
+) -> None:
+    import importlib.metadata
+
+    import trading
+
+    site = Path(trading.__file__).resolve().parent.parent
+    monkeypatch.setattr(result_cache, "run_git", lambda *args: "")
+    monkeypatch.setattr(
+        importlib.metadata, "distribution", lambda name: _FakeDistribution(site, direct_url)
+    )
+    assert result_cache.code_version() == expected
+
+
+def test_code_version_ignores_metadata_of_another_copy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import importlib.metadata
+
+    # Source tree imported while a stale copy sits in site-packages
+    monkeypatch.setattr(result_cache, "run_git", lambda *args: "")
+    monkeypatch.setattr(
+        importlib.metadata, "distribution", lambda name: _FakeDistribution(tmp_path, None)
+    )
+    assert result_cache.code_version() is None
+
+
+def test_strategy_code_version_tracks_third_party_module_source(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import importlib.util
+
+    from trading.strategy.examples.ma_crossover import MovingAverageCrossover
+
+    assert result_cache.strategy_code_version(MovingAverageCrossover) is None
+    module_path = tmp_path / "my_strategy_mod.py"
+    versions = []
+    for threshold in (1, 2):
+        module_path.write_text(
+            "from trading.core.contracts import Strategy\n"
+            "class MyStrategy(Strategy):\n"
+            f"    THRESHOLD = {threshold}\n"
+            "    def on_bar(self, bar):\n"
+            "        return None\n"
+        )
+        os.utime(module_path, ns=(threshold * 10**9, threshold * 10**9))
+        spec = importlib.util.spec_from_file_location("my_strategy_mod", module_path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, "my_strategy_mod", module)
+        spec.loader.exec_module(module)
+        versions.append(result_cache.strategy_code_version(module.MyStrategy))
+    assert versions[0] is not None and versions[0].startswith("sha256:")
+    assert versions[0] != versions[1]
+
+
+def test_gc_drops_entries_unused_for_keep_days(tmp_path: Path, clean_tree: None) -> None:
+    (tmp_path / "cache").mkdir()
+    _write_cache(tmp_path / "cache", 100.0)
+    _run(tmp_path, "first", [])
+    _write_cache(tmp_path / "cache", 101.0)
+    _run(tmp_path, "second", [])
+    cache = result_cache.ResultCache(tmp_path / "runs" / ".result_cache")
+    entries = sorted(p for p in cache.base_dir.iterdir())
+    assert len(entries) == 2
+    old = time.time() - 10 * 86400
+    for entry in entries:
+        os.utime(entry, (old, old))
+
+    # Restoring an entry counts as a use and keeps it
+    third = _run(tmp_path, "third", [])
+    assert third.summary is not None
+    used = cache.base_dir / third.summary["cache"]["key"]
+    assert cache.gc(keep_days=5, apply=False) == [e for e in entries if e != used]
+    cache.gc(keep_days=5)
+    assert list(cache.base_dir.iterdir()) == [used]
+
+
+def test_git_sha_is_taken_from_the_package_checkout(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from trading.util.git import git_sha
+
+    expected = git_sha()
+    assert expected is not None
+    monkeypatch.chdir(tmp_path)
+    assert git_sha() == expected
@@ -27,3 +27,13 @@ def test_prune_directories_dry_run(tmp_path: Path) -> None:
     to_remove = prune_directories(tmp_path, keep_days=5, apply=False)
     assert old_dir in to_remove
     assert new_dir not in to_remove
+
+
+def test_prune_directories_skips_excluded_names(tmp_path: Path) -> None:
+    old = (datetime.now(timezone.utc) - timedelta(days=10)).timestamp()
+    for name in ("old", ".series_cache"):
+        (tmp_path / name).mkdir()
+        os.utime(tmp_path / name, (old, old))
+
+    to_remove = prune_directories(tmp_path, keep_days=5, exclude=[".series_cache"])
+    assert to_remove == [tmp_path / "old"]
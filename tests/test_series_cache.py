@@ -0,0 +1,111 @@
+from __future__ import annotations
+import os
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from trading.data import series_cache
+from trading.data.series_cache import SeriesCache
+from trading.data.series_loader import load_parquet_series
+
+
+def _write(base: Path, periods: int, close: float = 100.0) -> Path:
+    path = base / "SPY_1d.parquet"
+    pd.DataFrame(
+        {
+            "symbol": "SPY",
+            "end": pd.date_range("2024-01-01", periods=periods, freq="D", tz="UTC"),
+            "open": close,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": 1000,
+        }
+    ).to_parquet(path, index=False)
+    return path
+
+
+def _no_decode(*args: Any, **kwargs: Any) -> pd.DataFrame:
+    raise AssertionError("source was decoded again")
+
+
+def test_cached_load_matches_loader_and_skips_decode(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write(tmp_path, 30)
+    cache = SeriesCache(tmp_path / ".series_cache")
+    expected = load_parquet_series(tmp_path, "SPY", "1d")
+    pd.testing.assert_frame_equal(cache.load(tmp_path, "SPY", "1d"), expected)
+    assert len(list((tmp_path / ".series_cache").glob("*.arrow"))) == 1
+
+    monkeypatch.setattr(series_cache, "load_parquet_series", _no_decode)
+    pd.testing.assert_frame_equal(cache.load(tmp_path, "SPY", "1d"), expected)
+    # A fresh instance (e.g. another process) resolves the key from the stat pointer
+    pd.testing.assert_frame_equal(
+        SeriesCache(tmp_path / ".series_cache").load(tmp_path, "SPY", "1d"), expected
+    )
+
+
+def test_key_follows_content_and_window(tmp_path: Path) -> None:
+    path = _write(tmp_path, 30)
+    cache = SeriesCache(tmp_path / ".series_cache")
+    key = cache.key(tmp_path, "SPY", "1d")
+    assert cache.key(tmp_path, "SPY", "1d", start="2024-01-10") != key
+
+    # Touching the file keeps the content hash, so the cached series is reused
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert cache.key(tmp_path, "SPY", "1d") == key
+
+    _write(tmp_path, 31, close=50.0)
+    assert cache.key(tmp_path, "SPY", "1d") != key
+    df = cache.load(tmp_path, "SPY", "1d")
+    assert len(df) == 31 and (df["close"] == 50.0).all()
+
+
+def test_corrupt_entry_is_rebuilt(tmp_path: Path) -> None:
+    _write(tmp_path, 5)
+    cache = SeriesCache(tmp_path / ".series_cache")
+    cache.path_for(cache.key(tmp_path, "SPY", "1d")).write_bytes(b"not arrow")
+    assert len(cache.load(tmp_path, "SPY", "1d")) == 5
+    assert len(cache.load(tmp_path, "SPY", "1d")) == 5
+
+
+def test_missing_source_raises(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        SeriesCache(tmp_path / ".series_cache").load(tmp_path, "SPY", "1d")
+
+
+def test_gc_drops_superseded_entries_then_least_recently_used(tmp_path: Path) -> None:
+    source = _write(tmp_path, 30)
+    cache_dir = tmp_path / ".series_cache"
+    cache = SeriesCache(cache_dir)
+    cache.load(tmp_path, "SPY", "1d")
+    cache.load(tmp_path, "SPY", "1d", start="2024-01-10")
+    assert cache.gc() == []
+
+    # Rewriting the source orphans the full-range entry and its pointer
+    old_key = cache.key(tmp_path, "SPY", "1d")
+    _write(tmp_path, 31)
+    os.utime(source, ns=(source.stat().st_atime_ns, source.stat().st_mtime_ns + 10**9))
+    cache.load(tmp_path, "SPY", "1d")
+    assert len(list(cache_dir.glob("*.arrow"))) == 3
+    assert cache_dir / f"{old_key}.arrow" in cache.gc(apply=False)
+    removed = cache.gc()
+    assert not (cache_dir / f"{old_key}.arrow").exists()
+    # The windowed entry was built from the old file too, so it goes with its pointer
+    assert len(removed) == 4
+    assert len(list(cache_dir.glob("*.arrow"))) == 1
+    assert len(list((cache_dir / "by-stat").iterdir())) == 1
+
+    # Over budget: the least recently loaded entries go first
+    cache.load(tmp_path, "SPY", "1d", start="2024-01-20")
+    newest = cache.path_for(cache.key(tmp_path, "SPY", "1d", start="2024-01-20"))
+    past = newest.stat().st_mtime_ns - 10**9
+    for path in cache_dir.glob("*.arrow"):
+        if path != newest:
+            os.utime(path, ns=(past, past))
+    cache.gc(max_bytes=newest.stat().st_size)
+    assert list(cache_dir.glob("*.arrow")) == [newest]
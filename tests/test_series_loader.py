@@ -0,0 +1,62 @@
+from __future__ import annotations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.data.partitioned import write_partitioned
+from trading.data.series_cache import SeriesCache
+from trading.data.series_loader import load_parquet_series
+from trading.data.synthetic import write_synthetic_bars
+
+
+@pytest.fixture()
+def cache(tmp_path: Path) -> Path:
+    write_synthetic_bars(["SPY"], "1h", "2023-01-01", "2024-12-31", tmp_path, seed=2)
+    return tmp_path
+
+
+def test_projection_and_compact_dtypes(cache: Path) -> None:
+    full = load_parquet_series(cache, "SPY", "1h")
+
+    close = load_parquet_series(cache, "SPY", "1h", columns=["close"])
+    assert list(close.columns) == ["end", "close"]
+    pd.testing.assert_frame_equal(close, full[["end", "close"]])
+
+    compact = load_parquet_series(cache, "SPY", "1h", "2024-01-01", None, compact=True)
+    assert list(compact.columns) == ["end", "open", "high", "low", "close", "volume"]
+    assert compact["end"].dtype == np.int64 and compact["close"].dtype == np.float32
+    assert compact["volume"].dtype == np.int32
+    window = full[full["end"] >= pd.Timestamp("2024-01-01", tz="UTC")].reset_index(drop=True)
+    assert np.array_equal(
+        compact["end"], pd.DatetimeIndex(window["end"]).to_numpy("datetime64[ns]").view("int64")
+    )
+    assert np.allclose(compact["close"], window["close"], rtol=1e-6)
+    assert compact.memory_usage(deep=True).sum() < full.memory_usage(deep=True).sum() / 4
+
+    with pytest.raises(ValueError, match="Unknown columns"):
+        load_parquet_series(cache, "SPY", "1h", columns=["vwap"])
+
+
+def test_projection_on_partitions_and_wide_volume(cache: Path, tmp_path: Path) -> None:
+    df = load_parquet_series(cache, "SPY", "1h")
+    df["volume"] = df["volume"].astype("int64") * 10_000
+    store = tmp_path / "store"
+    write_partitioned(df, store, "SPY", "1h")
+
+    compact = load_parquet_series(store, "SPY", "1h", columns=["volume"], compact=True)
+    assert list(compact.columns) == ["end", "volume"]
+    # Volumes past the int32 range are kept as int64 rather than wrapped
+    assert compact["volume"].dtype == np.int64
+    assert np.array_equal(compact["volume"], df["volume"].to_numpy(dtype=np.int64))
+
+
+def test_series_cache_keys_on_projection(cache: Path, tmp_path: Path) -> None:
+    series_cache = SeriesCache(tmp_path / "mm")
+    narrow = series_cache.load(cache, "SPY", "1h", columns=["close"], compact=True)
+    wide = series_cache.load(cache, "SPY", "1h")
+    assert list(narrow.columns) == ["end", "close"] and "symbol" in wide.columns
+    again = series_cache.load(cache, "SPY", "1h", columns=["close"], compact=True)
+    pd.testing.assert_frame_equal(again, narrow)
+    assert len(list((tmp_path / "mm").glob("*.arrow"))) == 2
@@ -0,0 +1,113 @@
+from __future__ import annotations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.backtest.engine import BacktestConfig, BacktestEngine
+from trading.core.models import Bar
+from trading.data.synthetic import write_synthetic_bars
+from trading.indicators import batch
+from trading.strategy import get_strategy
+from trading.strategy.examples.ma_crossover import MovingAverageCrossover
+from trading.strategy.examples.momentum import MomentumStrategy
+
+
+def _bars(closes: list[float]) -> list[Bar]:
+    start = pd.Timestamp("2024-01-01", tz="UTC")
+    return [
+        Bar("SPY", (start + pd.Timedelta(days=i)).to_pydatetime(), c, c, c, c, 1000)
+        for i, c in enumerate(closes)
+    ]
+
+
+def test_ma_crossover_enters_and_exits_with_signed_orders() -> None:
+    closes = [10.0] * 5 + [11.0, 12.0, 13.0] + [9.0, 8.0, 7.0]
+    strat = MovingAverageCrossover(fast=2, slow=4, quantity=7)
+    orders = [(i, o) for i, o in enumerate(map(strat.on_bar, _bars(closes))) if o is not None]
+    assert [(i, o.side, o.quantity) for i, o in orders] == [(5, "buy", 7), (8, "sell", -7)]
+    assert strat.state.position == 0 and orders[0][1].local_id == "SPY-ma-1"
+
+
+def test_ma_crossover_prepared_columns_match_streaming() -> None:
+    rng = np.random.default_rng(5)
+    closes = list(100.0 * np.exp(np.cumsum(rng.normal(0, 0.02, 400))))
+    bars = _bars(closes)
+    streaming = MovingAverageCrossover(fast=5, slow=20, notional=10_000.0)
+    prepared = MovingAverageCrossover(fast=5, slow=20, notional=10_000.0)
+    prepared.prepare(pd.DataFrame({"close": closes}))
+    a = [streaming.on_bar(b) for b in bars]
+    b = [prepared.on_bar(b) for b in bars]
+    assert [o and (o.side, o.quantity) for o in a] == [o and (o.side, o.quantity) for o in b]
+    assert sum(o is not None for o in a) > 4
+
+
+def test_ma_crossover_continues_past_prepared_range() -> None:
+    rng = np.random.default_rng(7)
+    closes = list(100.0 * np.exp(np.cumsum(rng.normal(0, 0.02, 120))))
+    strat = MovingAverageCrossover(fast=5, slow=20)
+    strat.prepare(pd.DataFrame({"close": closes[:60]}))
+    seen = []
+    for bar in _bars(closes):
+        strat.on_bar(bar)
+        seen.append((strat.state.fast, strat.state.slow))
+    # The streaming SMAs were fed while the prepared columns were in use
+    assert np.allclose(np.array(seen)[:, 0], batch.sma(closes, 5), equal_nan=True)
+    assert np.allclose(np.array(seen)[:, 1], batch.sma(closes, 20), equal_nan=True)
+
+
+def test_ma_crossover_pickles_without_prepared_columns() -> None:
+    import pickle
+
+    closes = [100.0 + i % 7 for i in range(500)]
+    strat = MovingAverageCrossover(fast=3, slow=8)
+    strat.prepare(pd.DataFrame({"close": closes}))
+    for bar in _bars(closes[:50]):
+        strat.on_bar(bar)
+    restored = pickle.loads(pickle.dumps(strat))
+    assert restored._fast_col is None and restored._slow_col is None
+    assert len(pickle.dumps(strat)) < 4000
+    # Columns come back through prepare(), and the streaming state carried over
+    restored.prepare(pd.DataFrame({"close": closes}))
+    for bar in _bars(closes)[50:]:
+        assert restored.on_bar(bar) == strat.on_bar(bar)
+
+
+def test_momentum_sizes_by_notional() -> None:
+    closes = [100.0, 100.0, 100.0, 110.0, 120.0, 100.0, 90.0]
+    strat = MomentumStrategy(lookback=2, notional=1000.0)
+    out = [strat.on_bar(b) for b in _bars(closes)]
+    assert out[:3] == [None, None, None]
+    assert out[3] is not None and (out[3].side, out[3].quantity) == ("buy", 9)
+    assert out[4] is None
+    assert out[5] is not None and (out[5].side, out[5].quantity) == ("sell", -9)
+
+
+def test_invalid_params() -> None:
+    with pytest.raises(ValueError):
+        MovingAverageCrossover(fast=50, slow=20)
+    with pytest.raises(ValueError):
+        MomentumStrategy(lookback=0)
+
+
+@pytest.mark.parametrize(
+    "name, params", [("ma_crossover", {"fast": 5, "slow": 20}), ("momentum", {"lookback": 10})]
+)
+def test_registered_strategies_trade_in_engine(
+    tmp_path: Path, name: str, params: dict[str, int]
+) -> None:
+    write_synthetic_bars(["AAA", "BBB"], "1d", "2023-01-01", "2024-01-01", tmp_path, seed=9)
+    cls = get_strategy(name)
+    cfg = BacktestConfig(
+        symbols=["AAA", "BBB"],
+        interval="1d",
+        cache_dir=tmp_path,
+        run_id=name,
+        out_dir=tmp_path / "runs",
+    )
+    engine = BacktestEngine(strategy_factory=lambda sym: cls(**params, symbol=sym), config=cfg)  # type: ignore[call-arg]
+    engine.run()
+    fills = pd.read_parquet(tmp_path / "runs" / name / "fills.parquet")
+    assert len(fills) > 4 and (fills["qty"] < 0).any()
+    assert all(pos.qty >= 0 for pos in engine.portfolio.positions.values())
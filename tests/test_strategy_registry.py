@@ -0,0 +1,95 @@
+from __future__ import annotations
+from types import SimpleNamespace
+import subprocess
+import sys
+
+import pytest
+
+from trading.strategy import registry
+from trading.strategy.examples.noop import NoopStrategy
+
+
+def test_builtin_names_listed_without_importing_modules() -> None:
+    code = (
+        "import sys; from trading.strategy import get_strategy_names; names = get_strategy_names();"
+        "print(sorted(m for m in sys.modules if m.startswith('trading.strategy.examples')), names)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.startswith("[] [") and "'ma_crossover'" in out.stdout
+
+
+def test_lookup_imports_on_demand_and_entry_points(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(registry, "_STRATEGY_REGISTRY", {})
+    monkeypatch.setattr(registry, "_STRATEGY_PATHS", dict(registry._BUILTIN_STRATEGIES))
+    monkeypatch.setattr(registry, "_entry_points_loaded", False)
+    eps = [SimpleNamespace(name="Plugin", value="trading.strategy.examples.noop:NoopStrategy")]
+    import importlib.metadata
+
+    monkeypatch.setattr(
+        importlib.metadata,
+        "entry_points",
+        lambda group: eps if group == "trading.strategies" else [],
+    )
+    assert "plugin" in registry.get_strategy_names()
+    assert registry.get_strategy("PLUGIN") is NoopStrategy
+    assert registry.get_strategy("noop") is NoopStrategy
+    with pytest.raises(KeyError):
+        registry.get_strategy("missing")
+
+
+def test_register_path_and_conflicts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(registry, "_STRATEGY_REGISTRY", {})
+    monkeypatch.setattr(registry, "_STRATEGY_PATHS", dict(registry._BUILTIN_STRATEGIES))
+    registry.register_strategy_path("custom", "trading.strategy.examples.noop:NoopStrategy")
+    assert registry.get_strategy("custom") is NoopStrategy
+    with pytest.raises(ValueError):
+        registry.register_strategy_path("custom", "other.module:Other")
+    with pytest.raises(ValueError):
+        registry.register_strategy("momentum")(NoopStrategy)
+    registry.register_strategy_path("not_a_strategy", "trading.strategy.sizing:target_shares")
+    with pytest.raises(TypeError):
+        registry.get_strategy("not_a_strategy")
+
+
+def test_create_strategy_passes_symbol_only_when_accepted() -> None:
+    from trading.core.contracts import Strategy
+    from trading.strategy import create_strategy
+
+    class NoSymbol(Strategy):
+        def __init__(self, lookback: int = 3) -> None:
+            self.lookback = lookback
+
+        def on_bar(self, bar: object) -> None:
+            return None
+
+    plain = create_strategy(NoSymbol, "SPY", {"lookback": 5})
+    assert isinstance(plain, NoSymbol) and plain.lookback == 5
+    noop = create_strategy(NoopStrategy, "SPY", {})
+    assert isinstance(noop, NoopStrategy) and noop.symbol == "SPY"
+    assert getattr(create_strategy(NoopStrategy, "SPY", {"symbol": "QQQ"}), "symbol") == "QQQ"
+
+
+def test_signal_strategies_resolve_for_the_vectorized_engine(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import numpy as np
+    import pandas as pd
+
+    from trading.core.contracts import SignalStrategy
+    from trading.strategy.examples.ma_crossover import MovingAverageCrossover
+
+    assert registry.get_signal_strategy("ma_crossover") is MovingAverageCrossover
+    with pytest.raises(TypeError):
+        registry.get_signal_strategy("noop")
+
+    class Flat(SignalStrategy):
+        def target_positions(self, bars: pd.DataFrame) -> np.ndarray:
+            return np.zeros(len(bars))
+
+    monkeypatch.setattr(registry, "_STRATEGY_REGISTRY", {})
+    monkeypatch.setattr(registry, "_STRATEGY_PATHS", dict(registry._BUILTIN_STRATEGIES))
+    registry.register_strategy("flat")(Flat)
+    assert registry.get_signal_strategy("flat") is Flat
+    assert registry.resolve_strategy("flat") is Flat
+    with pytest.raises(TypeError):
+        registry.get_strategy("flat")
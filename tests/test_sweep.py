@@ -0,0 +1,60 @@
+from __future__ import annotations
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from trading.backtest.engine import BacktestConfig
+from trading.backtest.sweep import expand_param_grid, run_sweep
+
+
+def _write_cache(cache_dir: Path) -> None:
+    ends = pd.date_range("2024-01-01", periods=30, freq="D", tz="UTC")
+    closes = [100.0 + i for i in range(len(ends))]
+    pd.DataFrame(
+        {
+            "symbol": "SPY",
+            "end": ends,
+            "open": closes,
+            "high": closes,
+            "low": closes,
+            "close": closes,
+            "volume": 1000,
+        }
+    ).to_parquet(cache_dir / "SPY_1d.parquet", index=False)
+
+
+def test_expand_param_grid_product_and_scalars() -> None:
+    grid = expand_param_grid({"fast": [5, 10], "slow": [20, 50], "size": 1})
+    assert grid == [
+        {"fast": 5, "slow": 20, "size": 1},
+        {"fast": 5, "slow": 50, "size": 1},
+        {"fast": 10, "slow": 20, "size": 1},
+        {"fast": 10, "slow": 50, "size": 1},
+    ]
+    assert expand_param_grid({"fast": 5}) == [{"fast": 5}]
+    with pytest.raises(ValueError):
+        expand_param_grid({"fast": []})
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_sweep_writes_leaderboard(tmp_path: Path, workers: int) -> None:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    _write_cache(cache_dir)
+    base = BacktestConfig(
+        symbols=["SPY"], interval="1d", cache_dir=cache_dir, run_id="unused", out_dir=tmp_path
+    )
+
+    out = run_sweep(
+        base, "ma_crossover", {"fast": [5, 10], "slow": 20}, sweep_id="s", max_workers=workers
+    )
+
+    board = pd.read_parquet(out)
+    assert len(board) == 2
+    assert set(board["param_id"]) == {"p0000", "p0001"}
+    assert set(board["param_fast"]) == {5, 10}
+    assert {"sharpe", "cagr", "max_drawdown", "bars_per_sec"} <= set(board.columns)
+    assert (tmp_path / "s" / "p0000" / "summary.json").exists()
+    assert (tmp_path / "s" / "p0001" / "equity.parquet").exists()
+    assert not (tmp_path / "s" / ".indicator_cache").exists()
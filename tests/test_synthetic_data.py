@@ -0,0 +1,82 @@
+from __future__ import annotations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.data.series_loader import load_parquet_series
+from trading.data.synthetic import (
+    SynthParams,
+    session_timeline,
+    synthetic_symbols,
+    write_synthetic_bars,
+)
+
+
+def test_timeline_follows_sessions_across_dst() -> None:
+    ends, first = session_timeline("1h", "2024-03-08", "2024-03-11")
+    stamps = pd.to_datetime(ends, utc=True)
+    # Friday before and Monday after the US DST switch, 7 bars each (last one truncated)
+    assert len(stamps) == 14 and first.sum() == 2
+    assert stamps[0] == pd.Timestamp("2024-03-08 15:30", tz="UTC")
+    assert stamps[6] == pd.Timestamp("2024-03-08 21:00", tz="UTC")
+    assert stamps[13] == pd.Timestamp("2024-03-11 20:00", tz="UTC")
+
+    daily, _ = session_timeline("1d", "2024-01-01", "2024-01-07")
+    assert len(daily) == 5
+
+
+def test_written_caches_load_and_are_seeded(tmp_path: Path) -> None:
+    params = SynthParams(
+        jump_intensity=20.0, regime_switch_prob=0.01, gap_prob=0.5, missing_prob=0.05
+    )
+    symbols = synthetic_symbols(3)
+    for out in ("a", "b"):
+        paths = write_synthetic_bars(
+            symbols,
+            interval="15m",
+            start="2024-01-01",
+            end="2024-03-31",
+            out_dir=tmp_path / out,
+            params=params,
+            seed=7,
+        )
+    assert [p.name for p in paths] == [f"{s}_15m.parquet" for s in symbols]
+
+    full, _ = session_timeline("15m", "2024-01-01", "2024-03-31")
+    for sym in symbols:
+        df = load_parquet_series(tmp_path / "a", sym, "15m")
+        pd.testing.assert_frame_equal(df, load_parquet_series(tmp_path / "b", sym, "15m"))
+        assert 0.9 * len(full) < len(df) < len(full)  # some bars missing
+        assert (df["symbol"] == sym).all()
+        assert (df["high"] >= df[["open", "close"]].max(axis=1)).all()
+        assert (df["low"] <= df[["open", "close"]].min(axis=1)).all()
+        assert (df["volume"] >= 1).all()
+
+    spy = load_parquet_series(tmp_path / "a", symbols[0], "15m")
+    other = load_parquet_series(tmp_path / "a", symbols[1], "15m")
+    assert not np.allclose(spy["close"].iloc[:50], other["close"].iloc[:50])
+
+
+def test_gaps_only_at_session_open(tmp_path: Path) -> None:
+    write_synthetic_bars(
+        ["GAP"],
+        interval="1h",
+        start="2024-01-01",
+        end="2024-01-31",
+        out_dir=tmp_path,
+        params=SynthParams(gap_prob=1.0),
+        seed=1,
+    )
+    df = load_parquet_series(tmp_path, "GAP", "1h")
+    jumped = df["open"].to_numpy()[1:] != df["close"].to_numpy()[:-1]
+    local_day = df["end"].dt.tz_convert("America/New_York").dt.date.to_numpy()
+    session_open = local_day[1:] != local_day[:-1]
+    assert jumped.any()
+    assert not jumped[~session_open].any()
+
+
+def test_rejects_unknown_interval(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        write_synthetic_bars(["X"], interval="1w", out_dir=tmp_path)
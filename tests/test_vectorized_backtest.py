@@ -0,0 +1,200 @@
+from __future__ import annotations
+import json
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.backtest.engine import BacktestConfig, BacktestEngine
+from trading.backtest.vectorized import VectorizedBacktestEngine
+from trading.core.contracts import SignalStrategy, Strategy
+from trading.core.models import Bar, Order
+
+
+def _targets(closes: np.ndarray) -> np.ndarray:
+    # Hold 10 shares while close is above its running mean, add 5 more on strong moves
+    mean = np.cumsum(closes) / np.arange(1, len(closes) + 1)
+    base = np.where(closes > mean, 10, 0)
+    return base + np.where(closes > mean * 1.02, 5, 0)
+
+
+class ArraySignals(SignalStrategy):
+    def target_positions(self, bars: pd.DataFrame) -> np.ndarray:
+        return _targets(bars["close"].to_numpy())
+
+
+class ReplaySignals(Strategy):
+    """Event-driven twin of ArraySignals emitting the equivalent market orders."""
+
+    def __init__(self, symbol: str, series: pd.DataFrame) -> None:
+        self.symbol = symbol
+        self.targets = _targets(series["close"].to_numpy())
+        self.i = 0
+        self.pos = 0
+
+    def on_bar(self, bar: Bar) -> Optional[Order]:
+        target = int(self.targets[self.i])
+        self.i += 1
+        delta = target - self.pos
+        if delta == 0:
+            return None
+        self.pos = target
+        side = "buy" if delta > 0 else "sell"
+        return Order(
+            local_id=f"{self.symbol}-{self.i}",
+            symbol=self.symbol,
+            side=side,
+            type="market",
+            quantity=delta,
+        )
+
+
+def _write_cache(cache_dir: Path) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(7)
+    frames: dict[str, pd.DataFrame] = {}
+    for i, sym in enumerate(["SPY", "QQQ", "IWM"]):
+        ends = pd.date_range("2024-01-01", periods=120, freq="D", tz="UTC")
+        ends = ends[rng.random(len(ends)) > 0.1 * i]
+        close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, len(ends))))
+        df = pd.DataFrame(
+            {
+                "symbol": sym,
+                "end": ends,
+                "open": close,
+                "high": close * 1.01,
+                "low": close * 0.99,
+                "close": close,
+                "volume": rng.integers(1000, 5000, len(ends)),
+            }
+        )
+        df.to_parquet(cache_dir / f"{sym}_1d.parquet", index=False)
+        frames[sym] = df
+    return frames
+
+
+def test_vectorized_matches_event_driven_engine(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    frames = _write_cache(cache_dir)
+    symbols = list(frames)
+
+    def config(run_id: str) -> BacktestConfig:
+        return BacktestConfig(
+            symbols=symbols, interval="1d", cache_dir=cache_dir, run_id=run_id, out_dir=tmp_path
+        )
+
+    BacktestEngine(lambda s: ReplaySignals(s, frames[s]), config("event")).run()
+    VectorizedBacktestEngine(lambda s: ArraySignals(), config("vec")).run()
+
+    for name in ["bars", "orders", "fills"]:
+        ev = pd.read_parquet(tmp_path / "event" / f"{name}.parquet")
+        vec = pd.read_parquet(tmp_path / "vec" / f"{name}.parquet")
+        assert list(ev.columns) == list(vec.columns)
+        if name == "orders":
+            assert ev["limit"].isna().all() and vec["limit"].isna().all()
+            ev, vec = ev.drop(columns="limit"), vec.drop(columns="limit")
+        pd.testing.assert_frame_equal(ev, vec, check_dtype=False)
+    ev_eq = pd.read_parquet(tmp_path / "event" / "equity.parquet")
+    vec_eq = pd.read_parquet(tmp_path / "vec" / "equity.parquet")
+    pd.testing.assert_frame_equal(ev_eq, vec_eq, check_exact=False, rtol=1e-9)
+
+    ev_sum = json.loads((tmp_path / "event" / "summary.json").read_text("utf-8"))
+    vec_sum = json.loads((tmp_path / "vec" / "summary.json").read_text("utf-8"))
+    assert vec_sum["mode"] == "vectorized"
+    for key, value in ev_sum["metrics"].items():
+        assert vec_sum["metrics"][key] == pytest.approx(value, rel=1e-6, abs=1e-9)
+    assert vec_sum["observability"]["counters"] == ev_sum["observability"]["counters"]
+    assert (
+        vec_sum["observability"]["missing_bars_per_symbol"]
+        == ev_sum["observability"]["missing_bars_per_symbol"]
+    )
+
+
+def test_vectorized_rejects_short_targets(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    _write_cache(cache_dir)
+
+    class Short(SignalStrategy):
+        def target_positions(self, bars: pd.DataFrame) -> np.ndarray:
+            return np.full(len(bars), -1)
+
+    cfg = BacktestConfig(
+        symbols=["SPY"], interval="1d", cache_dir=cache_dir, run_id="r", out_dir=tmp_path
+    )
+    with pytest.raises(ValueError):
+        VectorizedBacktestEngine(lambda s: Short(), cfg).run()
+
+
+@pytest.mark.parametrize("notional", [None, 2500.0])
+def test_ma_crossover_targets_match_event_driven_engine(
+    tmp_path: Path, notional: Optional[float]
+) -> None:
+    from trading.strategy.examples.ma_crossover import MovingAverageCrossover
+
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    symbols = list(_write_cache(cache_dir))
+
+    def config(run_id: str) -> BacktestConfig:
+        return BacktestConfig(
+            symbols=symbols, interval="1d", cache_dir=cache_dir, run_id=run_id, out_dir=tmp_path
+        )
+
+    def factory(symbol: str) -> MovingAverageCrossover:
+        return MovingAverageCrossover(3, 8, symbol=symbol, quantity=7, notional=notional)
+
+    BacktestEngine(factory, config("event")).run()
+    VectorizedBacktestEngine(factory, config("vec")).run()
+    for name in ["orders", "fills"]:
+        ev = pd.read_parquet(tmp_path / "event" / f"{name}.parquet")
+        vec = pd.read_parquet(tmp_path / "vec" / f"{name}.parquet")
+        assert len(ev) > 4
+        pd.testing.assert_frame_equal(ev, vec, check_dtype=False)
+
+
+def test_cli_runs_vectorized_engine(tmp_path: Path) -> None:
+    from typer.testing import CliRunner
+
+    from trading.cli import app
+
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    _write_cache(cache_dir)
+
+    def write_config(strategy: str, params: str) -> str:
+        path = tmp_path / f"{strategy}.yaml"
+        path.write_text(
+            'timeframe: "1D"\n'
+            'symbols: ["SPY", "QQQ"]\n'
+            f'data: {{source: "parquet", cache_dir: "{cache_dir.as_posix()}"}}\n'
+            "risk: {max_gross_exposure: 100000, per_symbol_notional_cap: 25000}\n"
+            "execution: {slippage_bps: 1, commission_fixed: 1.0}\n"
+            f'strategy: {{name: "{strategy}", params: {params}}}\n'
+        )
+        return str(path)
+
+    base = ["backtest", "--no-autodownload", "--out-dir", str(tmp_path / "runs")]
+    ma = write_config("ma_crossover", "{fast: 3, slow: 8}")
+    for mode in ["event", "vectorized"]:
+        result = CliRunner().invoke(
+            app, [*base, "--config", ma, "--run-id", mode, "--engine", mode, "--no-result-cache"]
+        )
+        assert result.exit_code == 0, result.output
+    ev = pd.read_parquet(tmp_path / "runs" / "event" / "fills.parquet")
+    vec = pd.read_parquet(tmp_path / "runs" / "vectorized" / "fills.parquet")
+    assert len(ev) > 0
+    pd.testing.assert_frame_equal(ev, vec, check_dtype=False)
+    summary = json.loads((tmp_path / "runs" / "vectorized" / "summary.json").read_text())
+    assert summary["mode"] == "vectorized"
+
+    # Event-only strategies and checkpointing are rejected for the vectorized engine
+    momentum = write_config("momentum", "{}")
+    for args in (
+        ["--config", momentum, "--engine", "vectorized"],
+        ["--config", ma, "--engine", "vectorized", "--checkpoint"],
+    ):
+        result = CliRunner().invoke(app, [*base, *args])
+        assert result.exit_code == 2, result.output
@@ -0,0 +1,83 @@
+from __future__ import annotations
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict
+import hashlib
+import json
+import os
+import pickle
+
+from trading.backtest.engine import BacktestConfig
+from trading.backtest.metrics import RunningMetrics
+from trading.backtest.result_cache import _NON_RESULT_FIELDS
+from trading.core.contracts import Strategy
+from trading.observability.histogram import LatencyHistogram
+from trading.observability.profiling import StageProfiler
+from trading.portfolio.accounting import PortfolioState
+
+
+CHECKPOINT_FILE = "checkpoint.pkl"
+_FORMAT_VERSION = 4
+
+# Besides the fields that never affect results, a resume may extend the window (``end``),
+# add symbols (they start fresh) and edit the config file in ways that leave every other
+# field alone (``config_hash`` hashes its bytes)
+_RESUMABLE_FIELDS = _NON_RESULT_FIELDS | {"end", "symbols", "config_hash"}
+
+
+@dataclass
+class EngineCheckpoint:
+    """Everything a ``BacktestEngine`` needs to continue a run after ``last_ts_ns``.
+
+    Strategies are stored as-is (pickled), so strategy classes must be importable at
+    module level. The backtest risk manager is stateless and is rebuilt from config.
+    Ledger rows already live in the run's Parquet artifacts; only their counts are kept,
+    along with the running equity statistics the summary metrics are computed from and
+    the wall time spent so far (throughput in the summary covers all segments).
+    ``config_fingerprint`` ties the state to the config (and, through
+    ``strategy_version``, the strategy name and params) it was produced with.
+    """
+
+    last_ts_ns: int
+    config_fingerprint: str
+    portfolio: PortfolioState
+    strategies: Dict[str, Strategy]
+    orders_approved: int
+    turnover_notional: float
+    time_in_market_bars: int
+    peak_gross_exposure: float
+    metrics: RunningMetrics
+    elapsed_seconds: float
+    missing_bars_per_symbol: Dict[str, int]
+    bar_loop_ms: LatencyHistogram
+    profiler: StageProfiler
+    ledger_rows: Dict[str, int] = field(default_factory=dict)
+    version: int = _FORMAT_VERSION
+
+
+def config_fingerprint(config: BacktestConfig) -> str:
+    """Hash of the config fields a resumed run must share with the checkpointed one."""
+    fields = {k: v for k, v in asdict(config).items() if k not in _RESUMABLE_FIELDS}
+    blob = json.dumps(fields, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def save_checkpoint(run_dir: str | Path, checkpoint: EngineCheckpoint) -> Path:
+    """Atomically write ``checkpoint.pkl`` into the run directory."""
+    path = Path(run_dir) / CHECKPOINT_FILE
+    tmp = path.with_suffix(".pkl.tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    return path
+
+
+def load_checkpoint(run_dir: str | Path) -> EngineCheckpoint:
+    path = Path(run_dir) / CHECKPOINT_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"No checkpoint at {path}; run once with checkpointing enabled")
+    with open(path, "rb") as f:
+        checkpoint = pickle.load(f)
+    if not isinstance(checkpoint, EngineCheckpoint) or checkpoint.version != _FORMAT_VERSION:
+        raise ValueError(f"Unsupported checkpoint format at {path}")
+    return checkpoint
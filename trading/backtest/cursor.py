@@ -0,0 +1,74 @@
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from trading.core.models import Bar
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def ns_to_datetime(value: int) -> datetime:
+    """Convert epoch nanoseconds to a UTC datetime (microsecond precision)."""
+    return _EPOCH + timedelta(microseconds=int(value) // 1000)
+
+
+class BarCursor:
+    """Columnar, pointer-based access to pre-loaded bar series.
+
+    Each series is converted once into NumPy arrays (epoch-ns timestamps, float64 prices,
+    int64 volume). A per-symbol position pointer advances as the merged timeline is
+    walked, so looking up the bar for a timestamp is O(1) instead of a DataFrame mask.
+
+    Series must be sorted by ``end`` with unique timestamps (as returned by
+    ``load_parquet_series``) and timestamps must be requested in ascending order.
+    """
+
+    def __init__(self, series: Mapping[str, pd.DataFrame]) -> None:
+        self._end: Dict[str, np.ndarray] = {}
+        self._open: Dict[str, np.ndarray] = {}
+        self._high: Dict[str, np.ndarray] = {}
+        self._low: Dict[str, np.ndarray] = {}
+        self._close: Dict[str, np.ndarray] = {}
+        self._volume: Dict[str, np.ndarray] = {}
+        self._pos: Dict[str, int] = {}
+        for sym, df in series.items():
+            end = pd.to_datetime(df["end"], utc=True)
+            self._end[sym] = end.to_numpy(dtype="datetime64[ns]").view("int64")
+            self._open[sym] = df["open"].to_numpy(dtype="float64")
+            self._high[sym] = df["high"].to_numpy(dtype="float64")
+            self._low[sym] = df["low"].to_numpy(dtype="float64")
+            self._close[sym] = df["close"].to_numpy(dtype="float64")
+            self._volume[sym] = df["volume"].to_numpy(dtype="int64")
+            self._pos[sym] = 0
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._end.keys())
+
+    def __len__(self) -> int:
+        return sum(len(arr) for arr in self._end.values())
+
+    def bar_at(self, symbol: str, ts_ns: int) -> Optional[Bar]:
+        """Return the symbol's bar ending at ``ts_ns`` and advance its pointer, else None."""
+        pos = self._pos[symbol]
+        ends = self._end[symbol]
+        if pos >= len(ends) or ends[pos] != ts_ns:
+            return None
+        self._pos[symbol] = pos + 1
+        return Bar(
+            symbol=symbol,
+            end=ns_to_datetime(ends[pos]),
+            open=float(self._open[symbol][pos]),
+            high=float(self._high[symbol][pos]),
+            low=float(self._low[symbol][pos]),
+            close=float(self._close[symbol][pos]),
+            volume=int(self._volume[symbol][pos]),
+        )
+
+    def reset(self) -> None:
+        for sym in self._pos:
+            self._pos[sym] = 0
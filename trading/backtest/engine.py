@@ -1,22 +1,36 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 import json
-import subprocess
 import time
 
 import pandas as pd
 
-from trading.core.models import Bar, Order
+from trading.core.models import Order
 from trading.core.contracts import Strategy
 from trading.execution.simulator import SimpleExecutionSimulator, FillPolicy
 from trading.portfolio.accounting import PortfolioState
 from trading.risk.manager import BasicRiskManager, RiskParams
+from trading.data.panel import end_ns, load_many, union_timeline
 from trading.data.series_loader import load_parquet_series
-from trading.backtest.metrics import compute_from_equity
+from trading.backtest.metrics import Metrics, RunningMetrics, compute_from_equity
+from trading.backtest.cursor import BarCursor
+from trading.observability.histogram import LatencyHistogram
+from trading.observability.profiling import StageProfiler
+from trading.backtest.recorders import (
+    BARS_SCHEMA,
+    EQUITY_SCHEMA,
+    FILLS_SCHEMA,
+    ORDERS_SCHEMA,
+    ParquetRecorder,
+    read_ledger,
+)
 from trading.util.clock import Clock, DEFAULT_CLOCK
+from trading.util.git import git_sha
+
+if TYPE_CHECKING:
+    from trading.backtest.checkpoint import EngineCheckpoint
 
 
 @dataclass
@@ -31,6 +45,22 @@ class BacktestConfig:
     per_symbol_notional_cap: float = 25000.0
     config_hash: Optional[str] = None
     heartbeat_every: int = 100
+    artifact_flush_rows: int = 65536
+    profile_stages: bool = True
+    strategy_version: Optional[str] = None
+    result_cache_dir: Optional[str | Path] = None
+    checkpoint: bool = False
+    # Optional half-open date window [start, end) pushed down to the Parquet reads
+    start: Optional[str] = None
+    end: Optional[str] = None
+    # Memory-mapped Arrow copies of validated series (see trading.data.series_cache)
+    series_cache_dir: Optional[str | Path] = None
+    # Corporate-action adjustment: "none", "split" or "total_return"
+    adjustment: str = "none"
+    # Refresh stored corporate actions older than this; None never fetches (offline)
+    actions_ttl_days: Optional[float] = 7.0
+    # Threads reading symbol series concurrently
+    load_workers: int = 8
 
 
 class BacktestEngine:
@@ -63,111 +93,141 @@ class BacktestEngine:
             ),
             enable_session_gate=False,
         )
-        self._orders: list[dict[str, Any]] = []
-        self._fills: list[dict[str, Any]] = []
-        self._equity: list[dict[str, Any]] = []
-        self._bars: list[dict[str, Any]] = []
         # Observability accumulators
         self._orders_approved_count: int = 0
-        self._bar_loop_ms: list[float] = []
+        self._bar_loop_ms = LatencyHistogram()
+        self._profiler = StageProfiler(enabled=config.profile_stages)
         self._missing_bars_per_symbol: Dict[str, int] = {sym: 0 for sym in config.symbols}
         self._turnover_notional: float = 0.0
         self._time_in_market_bars: int = 0
         self._peak_gross_exposure: float = 0.0
+        self._metrics = RunningMetrics()
+        # Wall time of earlier segments of a resumed run, so throughput covers every bar
+        self._elapsed_before: float = 0.0
+        self._elapsed_s: float = 0.0
+        self.summary: Optional[Dict[str, Any]] = None
+
+    def run(self, series: Optional[Dict[str, pd.DataFrame]] = None, resume: bool = False) -> None:
+        """Run the bar loop and write artifacts.
 
-    def run(self) -> None:
+        ``series`` may be passed pre-loaded (e.g., shared across sweep runs); it is not
+        mutated. By default series are loaded from the configured Parquet cache.
+
+        With ``resume=True`` the engine restores the run directory's checkpoint, processes
+        only bars after the checkpointed timestamp and appends them to the existing
+        artifacts. The result cache is bypassed when checkpointing or resuming.
+        """
         self._run_start = time.perf_counter()
         out_base = Path(self.config.out_dir) / self.config.run_id
         (out_base / "reports").mkdir(parents=True, exist_ok=True)
 
-        # Load series for each symbol
-        series: Dict[str, pd.DataFrame] = {}
-        missing: list[str] = []
-        for sym in self.config.symbols:
-            try:
-                series[sym] = load_parquet_series(self.config.cache_dir, sym, self.config.interval)
-            except FileNotFoundError:
-                missing.append(sym)
-        if not series:
-            raise FileNotFoundError(
-                f"No cached data found for symbols {missing} at {self.config.cache_dir}. "
-                f"Generate fixtures (e.g., 'python -m trading fixtures download {' '.join(self.config.symbols)} --interval {self.config.interval} --start 2024-01-01 --out-dir {self.config.cache_dir}') or adjust cache_dir."
-            )
+        # Reuse artifacts of an identical earlier run (same config, inputs and code)
+        cache_key: Optional[str] = None
+        cache: Any = None
+        if self.config.result_cache_dir is not None and not (resume or self.config.checkpoint):
+            from trading.backtest import result_cache
 
-        # Create strategies per symbol
-        strategies: Dict[str, Strategy] = {
-            sym: self.strategy_factory(sym) for sym in self.config.symbols
-        }
+            code = result_cache.code_version()
+            if code is not None:
+                # The key hashes the stored corporate actions, so refresh stale ones first;
+                # otherwise a cached adjusted result would keep the store from ever updating
+                _load_actions(self.config)
+                cache = result_cache.ResultCache(self.config.result_cache_dir)
+                cache_key = result_cache.result_cache_key(self.config, code)
+                if cache.lookup(cache_key) is not None:
+                    self.summary = cache.restore(cache_key, out_base, self.config.run_id)
+                    self._log("result_cache_hit", key=cache_key)
+                    return
+
+        if series is None:
+            series = load_series(self.config)
+
+        full_series = series
+        strategies: Dict[str, Strategy] = {}
+        self._last_ts_ns: Optional[int] = None
+        if resume:
+            from trading.backtest.checkpoint import config_fingerprint, load_checkpoint
+
+            ckpt = load_checkpoint(out_base)
+            if ckpt.config_fingerprint != config_fingerprint(self.config):
+                raise ValueError(
+                    f"Cannot resume {self.config.run_id}: its checkpoint was written with a "
+                    "different config or strategy params; start a new run instead"
+                )
+            strategies = self._restore(ckpt)
+            # Only bars strictly after the checkpoint are new
+            cutoff = pd.Timestamp(ckpt.last_ts_ns, tz="UTC")
+            series = {sym: df[df["end"] > cutoff] for sym, df in series.items()}
+            self._log("resume", last_ts=cutoff.isoformat(), run_id=self.config.run_id)
+
+        # Ledgers stream to Parquet in bounded batches instead of accumulating in memory
+        flush_rows = self.config.artifact_flush_rows
+        self._bars = ParquetRecorder(
+            out_base / "bars.parquet", BARS_SCHEMA, flush_rows, append=resume
+        )
+        self._orders = ParquetRecorder(
+            out_base / "orders.parquet", ORDERS_SCHEMA, flush_rows, append=resume
+        )
+        self._fills = ParquetRecorder(
+            out_base / "fills.parquet", FILLS_SCHEMA, flush_rows, append=resume
+        )
+        self._equity = ParquetRecorder(
+            out_base / "equity.parquet", EQUITY_SCHEMA, flush_rows, append=resume
+        )
 
-        # Merge all timestamps across symbols using k-way merge to reduce memory
-        import heapq
-
-        iters: Dict[str, Any] = {sym: iter(df["end"].tolist()) for sym, df in series.items()}
-        heap: list[tuple[datetime, str]] = []
-        for sym, it in iters.items():
-            try:
-                first = next(it)
-                heap.append((first, sym))
-            except StopIteration:
-                continue
-        heapq.heapify(heap)
-        all_ts: list[datetime] = []
-        last_emitted: Optional[datetime] = None
-        while heap:
-            ts, sym = heapq.heappop(heap)
-            if last_emitted is None or ts != last_emitted:
-                all_ts.append(ts)
-                last_emitted = ts
-            # advance iterator for sym
-            try:
-                nxt = next(iters[sym])
-                heapq.heappush(heap, (nxt, sym))
-            except StopIteration:
-                pass
+        # Create strategies per symbol (symbols added since the checkpoint start fresh)
+        restored = set(strategies)
+        for sym in self.config.symbols:
+            if sym not in strategies:
+                strategies[sym] = self.strategy_factory(sym)
+        self._strategies = strategies
+        # Prepared rows must line up with the bars each strategy sees: restored ones have
+        # seen the history before the checkpoint, fresh ones only see the new bars
+        for sym, strategy in strategies.items():
+            source = full_series if sym in restored else series
+            if sym in source:
+                strategy.prepare(source[sym])
+
+        # Union of every symbol's bar ends, sorted and de-duplicated in one pass
+        timeline = union_timeline(end_ns(df) for df in series.values())
 
         heartbeat_every = max(1, int(self.config.heartbeat_every))
-        for idx, ts in enumerate(all_ts):
+        cursor = BarCursor(series)
+        symbols = cursor.symbols
+        prof = self._profiler
+        profile = prof.enabled
+        for idx, ts_ns in enumerate(timeline.tolist()):
             loop_start = time.perf_counter()
             marks: Dict[str, float] = {}
-            for sym, df in series.items():
-                # Get row at timestamp if present
-                rows = df[df["end"] == ts]
-                if rows.empty:
+            ts = pd.Timestamp(ts_ns, tz="UTC")
+            for sym in symbols:
+                if profile:
+                    prof.start()
+                bar = cursor.bar_at(sym, ts_ns)
+                if profile:
+                    prof.lap("bar_lookup")
+                if bar is None:
                     self._missing_bars_per_symbol[sym] = (
                         self._missing_bars_per_symbol.get(sym, 0) + 1
                     )
                     continue
-                row = rows.iloc[0]
-                bar = Bar(
-                    symbol=sym,
-                    end=pd.to_datetime(row["end"]).to_pydatetime(),
-                    open=float(row["open"]),
-                    high=float(row["high"]),
-                    low=float(row["low"]),
-                    close=float(row["close"]),
-                    volume=int(row["volume"]),
-                )
                 # Record bar
-                self._bars.append(
-                    {
-                        "ts": bar.end.isoformat(),
-                        "symbol": sym,
-                        "open": bar.open,
-                        "high": bar.high,
-                        "low": bar.low,
-                        "close": bar.close,
-                        "volume": bar.volume,
-                    }
-                )
+                self._bars.append(ts_ns, sym, bar.open, bar.high, bar.low, bar.close, bar.volume)
                 marks[sym] = bar.close
+                if profile:
+                    prof.lap("record")
 
                 # Strategy decision
                 order: Optional[Order] = strategies[sym].on_bar(bar)
+                if profile:
+                    prof.lap("on_bar")
                 if order is None:
                     continue
 
                 # Risk
                 approved = self.risk.validate(order)
+                if profile:
+                    prof.lap("risk_validate")
                 if approved is None:
                     continue
                 # Count orders that passed risk checks
@@ -182,46 +242,44 @@ class BacktestEngine:
                     bar_volume=bar.volume,
                     fill_ts=bar.end,
                 )
+                if profile:
+                    prof.lap("simulate_fill")
                 # Record order regardless
                 self._orders.append(
-                    {
-                        "ts": ts.isoformat(),
-                        "symbol": sym,
-                        "side": order.side,
-                        "type": order.type,
-                        "qty": order.quantity,
-                        "limit": order.limit_price,
-                    }
+                    ts_ns, sym, order.side, order.type, order.quantity, order.limit_price
                 )
                 if fill is not None:
                     self._fills.append(
-                        {
-                            "ts": fill.ts.isoformat(),
-                            "symbol": sym,
-                            "qty": fill.qty,
-                            "price": fill.price,
-                            "commission": self.config.commission_fixed,
-                        }
+                        pd.Timestamp(fill.ts).value,
+                        sym,
+                        fill.qty,
+                        fill.price,
+                        self.config.commission_fixed,
                     )
+                    if profile:
+                        prof.lap("record")
                     # Apply to portfolio with commission
                     self.portfolio.apply_fill(
                         fill, price=fill.price, symbol=sym, commission=self.config.commission_fixed
                     )
                     # Turnover notional accumulates absolute traded notional
                     self._turnover_notional += abs(float(fill.qty) * float(fill.price))
+                    if profile:
+                        prof.lap("apply_fill")
+                elif profile:
+                    prof.lap("record")
 
-            snap = self.portfolio.snapshot(
-                as_of=ts if isinstance(ts, datetime) else self._clock.now_utc(), marks=marks
-            )
+            if profile:
+                prof.start()
+            snap = self.portfolio.snapshot(as_of=ts, marks=marks)
+            if profile:
+                prof.lap("snapshot")
             self._equity.append(
-                {
-                    "ts": snap.ts.isoformat(),
-                    "cash": snap.cash,
-                    "equity": snap.equity,
-                    "unrealized_pnl": snap.unrealized_pnl,
-                    "realized_pnl": snap.realized_pnl,
-                }
+                ts_ns, snap.cash, snap.equity, snap.unrealized_pnl, snap.realized_pnl
             )
+            self._metrics.update(snap.equity)
+            if profile:
+                prof.lap("record")
             # Time in market: any open position across symbols
             if any(pos.qty != 0 for pos in self.portfolio.positions.values()):
                 self._time_in_market_bars += 1
@@ -234,11 +292,16 @@ class BacktestEngine:
                 gross += abs(float(pos.qty) * float(price))
             if gross > self._peak_gross_exposure:
                 self._peak_gross_exposure = gross
+            if profile:
+                prof.lap("exposure_scan")
             loop_end = time.perf_counter()
-            self._bar_loop_ms.append((loop_end - loop_start) * 1000.0)
+            self._bar_loop_ms.record((loop_end - loop_start) * 1000.0)
+            self._last_ts_ns = ts_ns
 
             # Emit a simple heartbeat every N bars
             if idx % heartbeat_every == 0:
+                if profile:
+                    prof.start()
                 try:
                     # Support both structlog and stdlib
                     try:
@@ -259,122 +322,219 @@ class BacktestEngine:
                         )
                 except Exception:
                     pass
+                if profile:
+                    prof.lap("logging")
 
         # Write artifacts
         self._write_artifacts(out_base)
+        if (self.config.checkpoint or resume) and self._last_ts_ns is not None:
+            self._save_checkpoint(out_base)
+        if cache is not None and cache_key is not None:
+            cache.store(cache_key, out_base)
 
-    def _write_artifacts(self, out_base: Path) -> None:
-        import pyarrow as pa
-        import pyarrow.parquet as pq
+    def _restore(self, ckpt: EngineCheckpoint) -> Dict[str, Strategy]:
+        """Load engine state from a checkpoint and return the restored strategies."""
+        self.portfolio = ckpt.portfolio
+        self._orders_approved_count = ckpt.orders_approved
+        self._turnover_notional = ckpt.turnover_notional
+        self._time_in_market_bars = ckpt.time_in_market_bars
+        self._peak_gross_exposure = ckpt.peak_gross_exposure
+        self._metrics = ckpt.metrics
+        self._elapsed_before = ckpt.elapsed_seconds
+        self._missing_bars_per_symbol = {
+            sym: ckpt.missing_bars_per_symbol.get(sym, 0) for sym in self.config.symbols
+        }
+        self._bar_loop_ms = ckpt.bar_loop_ms
+        if self._profiler.enabled:
+            self._profiler = ckpt.profiler
+            self._profiler.enabled = True
+        self._last_ts_ns = ckpt.last_ts_ns
+        return dict(ckpt.strategies)
 
-        def write_parquet(records: list[dict[str, Any]], name: str) -> None:
-            if not records:
-                return
-            table = pa.Table.from_pylist(records)
-            pq.write_table(table, out_base / f"{name}.parquet")
+    def _save_checkpoint(self, out_base: Path) -> None:
+        from trading.backtest.checkpoint import (
+            EngineCheckpoint,
+            config_fingerprint,
+            save_checkpoint,
+        )
 
-        write_parquet(self._bars, "bars")
-        write_parquet(self._orders, "orders")
-        write_parquet(self._fills, "fills")
-        write_parquet(self._equity, "equity")
+        assert self._last_ts_ns is not None
+        path = save_checkpoint(
+            out_base,
+            EngineCheckpoint(
+                last_ts_ns=self._last_ts_ns,
+                config_fingerprint=config_fingerprint(self.config),
+                portfolio=self.portfolio,
+                strategies=self._strategies,
+                orders_approved=self._orders_approved_count,
+                turnover_notional=self._turnover_notional,
+                time_in_market_bars=self._time_in_market_bars,
+                peak_gross_exposure=self._peak_gross_exposure,
+                metrics=self._metrics,
+                elapsed_seconds=self._elapsed_s,
+                missing_bars_per_symbol=self._missing_bars_per_symbol,
+                bar_loop_ms=self._bar_loop_ms,
+                profiler=self._profiler,
+                ledger_rows={
+                    "bars": self._bars.rows,
+                    "orders": self._orders.rows,
+                    "fills": self._fills.rows,
+                    "equity": self._equity.rows,
+                },
+            ),
+        )
+        self._log("checkpoint_saved", path=str(path), last_ts_ns=self._last_ts_ns)
 
-        # Compute metrics from equity
+    def _log(self, event: str, **fields: Any) -> None:
+        # Support both structlog and stdlib
         try:
-            import pyarrow.parquet as pq
-
-            eq_path = out_base / "equity.parquet"
-            if eq_path.exists():
-                equity_df = pq.read_table(eq_path).to_pandas()
-                metrics = compute_from_equity(equity_df, self.config.interval)
-            else:
-                metrics = None
-        except Exception:
-            metrics = None
+            self._logger.info(event, **fields)
+        except TypeError:
+            self._logger.info(event, extra=fields)
 
-        # Try to include git SHA
-        try:
-            git_sha = (
-                subprocess.run(
-                    ["git", "rev-parse", "HEAD"], capture_output=True, text=True
-                ).stdout.strip()
-                or None
-            )
-        except Exception:
-            git_sha = None
-
-        # Observability: counters and timers
-        def _percentiles(values: list[float], ps: list[float]) -> Dict[str, float]:
-            if not values:
-                return {f"p{int(p*100)}": 0.0 for p in ps}
-            sorted_vals = sorted(values)
-            n = len(sorted_vals)
-            results: Dict[str, float] = {}
-            for p in ps:
-                if n == 1:
-                    q = sorted_vals[0]
-                else:
-                    k = max(0, min(n - 1, int(round(p * (n - 1)))))
-                    q = float(sorted_vals[k])
-                results[f"p{int(p*100)}"] = q
-            return results
-
-        total_bars = len(self._bars)
-        total_secs = max(1e-9, time.perf_counter() - self._run_start)
+    def _write_artifacts(self, out_base: Path) -> None:
+        for recorder in (self._bars, self._orders, self._fills, self._equity):
+            recorder.close()
+
+        total_bars = self._bars.rows
+        self._elapsed_s = self._elapsed_before + (time.perf_counter() - self._run_start)
+        total_secs = max(1e-9, self._elapsed_s)
         bars_per_sec = float(total_bars) / float(total_secs)
         counters = {
-            "bars": len(self._bars),
-            "orders_proposed": len(self._orders),
+            "bars": self._bars.rows,
+            "orders_proposed": self._orders.rows,
             "orders_approved": self._orders_approved_count,
-            "fills": len(self._fills),
+            "fills": self._fills.rows,
         }
-        timer_stats = (
-            {
-                "count": len(self._bar_loop_ms),
-                "avg": (
-                    (sum(self._bar_loop_ms) / len(self._bar_loop_ms)) if self._bar_loop_ms else 0.0
-                ),
-                "max": max(self._bar_loop_ms) if self._bar_loop_ms else 0.0,
-                **_percentiles(self._bar_loop_ms, [0.5, 0.95]),
-                "bars_per_sec": bars_per_sec,
-            }
-            if self._bar_loop_ms
-            else {"count": 0, "avg": 0.0, "max": 0.0, "p50": 0.0, "p95": 0.0, "bars_per_sec": 0.0}
+        timer_stats: Dict[str, float] = {
+            **self._bar_loop_ms.to_dict(),
+            "bars_per_sec": bars_per_sec if self._bar_loop_ms.count else 0.0,
+        }
+        self.summary = write_summary(
+            out_base,
+            self.config,
+            counters=counters,
+            timers={"bar_loop_ms": timer_stats},
+            stages=self._profiler.summary() if self._profiler.enabled else None,
+            missing_bars_per_symbol=self._missing_bars_per_symbol,
+            turnover_notional=self._turnover_notional,
+            time_in_market_ratio=(
+                float(self._time_in_market_bars) / float(self._equity.rows)
+                if self._equity.rows
+                else 0.0
+            ),
+            peak_gross_exposure=self._peak_gross_exposure,
+            metrics=self._metrics.result(self.config.interval) if self._metrics.bars else None,
         )
 
-        summary = {
-            "run_id": self.config.run_id,
-            "symbols": self.config.symbols,
-            "interval": self.config.interval,
-            "git_sha": git_sha,
-            "config_hash": self.config.config_hash,
-            "slippage_bps": self.config.slippage_bps,
-            "commission_fixed": self.config.commission_fixed,
-            "metrics": (
-                None
-                if metrics is None
-                else {
-                    "cagr": metrics.cagr,
-                    "sharpe": metrics.sharpe,
-                    "sortino": metrics.sortino,
-                    "max_drawdown": metrics.max_drawdown,
-                    "calmar": metrics.calmar,
-                    "hit_rate": metrics.hit_rate,
-                    # Additional
-                    "turnover_notional": self._turnover_notional,
-                    "time_in_market_ratio": (
-                        float(self._time_in_market_bars) / float(len(self._equity))
-                        if self._equity
-                        else 0.0
-                    ),
-                    "peak_gross_exposure": self._peak_gross_exposure,
-                }
-            ),
-            "observability": {
-                "counters": counters,
-                "timers": {
-                    "bar_loop_ms": timer_stats,
-                },
-                "missing_bars_per_symbol": self._missing_bars_per_symbol,
-            },
-        }
-        (out_base / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+def _load_actions(config: BacktestConfig) -> Optional[pd.DataFrame]:
+    """Corporate actions for all configured symbols from the local store, in one lookup."""
+    if config.adjustment == "none":
+        return None
+    from trading.data.action_store import CorporateActionStore
+
+    ttl = None if config.actions_ttl_days is None else pd.Timedelta(days=config.actions_ttl_days)
+    return CorporateActionStore.for_cache(config.cache_dir, ttl=ttl).lookup(config.symbols)
+
+
+def _adjusted_base(
+    config: BacktestConfig, symbol: str, actions: Optional[pd.DataFrame]
+) -> str | Path:
+    """Directory to load ``symbol`` from: the raw cache or its adjusted copy."""
+    if actions is None:
+        return config.cache_dir
+    from trading.data.corporate_actions import ensure_adjusted
+
+    return ensure_adjusted(
+        config.cache_dir, symbol, config.interval, actions, config.adjustment
+    ).parent
+
+
+def load_series(config: BacktestConfig) -> Dict[str, pd.DataFrame]:
+    """Load the cached series for every configured symbol, skipping missing ones.
+
+    Raises FileNotFoundError when none of the symbols has a cache file.
+    """
+    loader: Callable[..., pd.DataFrame] = load_parquet_series
+    if config.series_cache_dir is not None:
+        from trading.data.series_cache import SeriesCache
+
+        loader = SeriesCache(config.series_cache_dir).load
+    actions = _load_actions(config)
+
+    def load(sym: str) -> pd.DataFrame:
+        base = _adjusted_base(config, sym, actions)
+        return loader(base, sym, config.interval, config.start, config.end)
+
+    series, missing = load_many(config.symbols, load, max_workers=config.load_workers)
+    if not series:
+        raise FileNotFoundError(
+            f"No cached data found for symbols {missing} at {config.cache_dir}. "
+            f"Generate fixtures (e.g., 'python -m trading fixtures download {' '.join(config.symbols)} --interval {config.interval} --start 2024-01-01 --out-dir {config.cache_dir}') or adjust cache_dir."
+        )
+    return series
+
+
+def write_summary(
+    out_base: Path,
+    config: BacktestConfig,
+    *,
+    counters: Dict[str, int],
+    timers: Dict[str, Dict[str, float]],
+    missing_bars_per_symbol: Dict[str, int],
+    turnover_notional: float,
+    time_in_market_ratio: float,
+    peak_gross_exposure: float,
+    stages: Optional[Dict[str, Dict[str, float]]] = None,
+    mode: str = "event",
+    metrics: Optional[Metrics] = None,
+) -> Dict[str, Any]:
+    """Write ``summary.json`` for a run.
+
+    ``metrics`` are computed from the equity ledger unless the caller already tracked
+    them (the event engine does, so a resumed run never re-reads its equity). Shared by
+    the event-driven and vectorized engines so both produce the same summary layout
+    consumed by ``generate_html_report``.
+    """
+    if metrics is None:
+        try:
+            equity_df = read_ledger(out_base / "equity.parquet", ["ts", "equity"]).to_pandas()
+            metrics = compute_from_equity(equity_df, config.interval)
+        except Exception:
+            metrics = None
+
+    summary = {
+        "run_id": config.run_id,
+        "mode": mode,
+        "symbols": config.symbols,
+        "interval": config.interval,
+        "git_sha": git_sha(),
+        "config_hash": config.config_hash,
+        "slippage_bps": config.slippage_bps,
+        "commission_fixed": config.commission_fixed,
+        "metrics": (
+            None
+            if metrics is None
+            else {
+                "cagr": metrics.cagr,
+                "sharpe": metrics.sharpe,
+                "sortino": metrics.sortino,
+                "max_drawdown": metrics.max_drawdown,
+                "calmar": metrics.calmar,
+                "hit_rate": metrics.hit_rate,
+                # Additional
+                "turnover_notional": turnover_notional,
+                "time_in_market_ratio": time_in_market_ratio,
+                "peak_gross_exposure": peak_gross_exposure,
+            }
+        ),
+        "observability": {
+            "counters": counters,
+            "timers": timers,
+            "stages_ms": stages,
+            "missing_bars_per_symbol": missing_bars_per_symbol,
+        },
+    }
+    (out_base / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return summary
@@ -1,7 +1,8 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from math import sqrt
+from dataclasses import dataclass, field
+from math import isnan, sqrt
 from typing import Dict
+import re
 
 import pandas as pd
 
@@ -11,6 +12,18 @@ _INTERVAL_TO_PPY: Dict[str, int] = {
     "1h": int(252 * 6.5),  # trading hours per day
     "1m": 252 * 390,  # minutes per trading day
 }
+_INTRADAY_RE = re.compile(r"^(\d+)(m|h)$")
+
+
+def periods_per_year(interval: str) -> float:
+    """Bars per year for ``interval``; resampled intervals scale from 390 minutes/day."""
+    if interval in _INTERVAL_TO_PPY:
+        return _INTERVAL_TO_PPY[interval]
+    match = _INTRADAY_RE.match(interval)
+    if match is None:
+        return 252
+    minutes = int(match.group(1)) * (60 if match.group(2) == "h" else 1)
+    return 252 * 390 / minutes if minutes > 0 else 252
 
 
 @dataclass
@@ -23,13 +36,84 @@ class Metrics:
     hit_rate: float
 
 
+@dataclass
+class _Moments:
+    """Running count, mean and sum of squared deviations (Welford)."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def std(self) -> float:
+        return sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+@dataclass
+class RunningMetrics:
+    """Equity-curve statistics accumulated one bar at a time.
+
+    Holds only O(1) state (peak equity, worst drawdown, return moments and counters), so
+    a resumed run feeds just its new bars instead of re-reading the whole equity ledger.
+    ``result`` gives the same values as ``compute_from_equity`` on the full curve.
+    """
+
+    bars: int = 0
+    start_equity: float = 0.0
+    last_equity: float = 0.0
+    peak_equity: float = 0.0
+    max_drawdown: float = 0.0
+    positive_returns: int = 0
+    returns: _Moments = field(default_factory=_Moments)
+    downside: _Moments = field(default_factory=_Moments)
+
+    def update(self, equity: float) -> None:
+        equity = float(equity)
+        if self.bars == 0:
+            self.start_equity = self.peak_equity = equity
+        else:
+            ret = equity / self.last_equity - 1.0 if self.last_equity else float("nan")
+            if not isnan(ret):
+                self.returns.add(ret)
+                self.positive_returns += ret > 0.0
+                if ret < 0.0:
+                    self.downside.add(ret)
+            self.peak_equity = max(self.peak_equity, equity)
+        self.bars += 1
+        self.last_equity = equity
+        if self.peak_equity:
+            self.max_drawdown = min(self.max_drawdown, equity / self.peak_equity - 1.0)
+
+    def result(self, interval: str) -> Metrics:
+        ppy = periods_per_year(interval)
+        n = self.bars
+        cagr = (self.last_equity / self.start_equity) ** (ppy / max(1, n)) - 1.0 if n > 1 else 0.0
+        std_r = self.returns.std()
+        std_down = self.downside.std()
+        mean_r = self.returns.mean
+        max_dd = self.max_drawdown
+        return Metrics(
+            cagr=cagr,
+            sharpe=(mean_r * sqrt(ppy) / std_r) if std_r > 0 else 0.0,
+            sortino=(mean_r * sqrt(ppy) / std_down) if std_down > 0 else 0.0,
+            max_drawdown=max_dd,
+            calmar=(cagr / abs(max_dd)) if max_dd < 0 else 0.0,
+            hit_rate=(self.positive_returns / self.returns.count if self.returns.count else 0.0),
+        )
+
+
 def compute_from_equity(equity_df: pd.DataFrame, interval: str) -> Metrics:
     df = equity_df.copy()
     df = df.sort_values("ts")
     start_equity = float(df["equity"].iloc[0])
     end_equity = float(df["equity"].iloc[-1])
     n = len(df)
-    ppy = _INTERVAL_TO_PPY.get(interval, 252)
+    ppy = periods_per_year(interval)
 
     # Simple returns from equity
     returns = df["equity"].pct_change().dropna()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Optional, Sequence
+import os
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+_TS = pa.timestamp("ns", tz="UTC")
+
+BARS_SCHEMA = pa.schema(
+    [
+        ("ts", _TS),
+        ("symbol", pa.string()),
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+        ("volume", pa.int64()),
+    ]
+)
+ORDERS_SCHEMA = pa.schema(
+    [
+        ("ts", _TS),
+        ("symbol", pa.string()),
+        ("side", pa.string()),
+        ("type", pa.string()),
+        ("qty", pa.int64()),
+        ("limit", pa.float64()),
+    ]
+)
+FILLS_SCHEMA = pa.schema(
+    [
+        ("ts", _TS),
+        ("symbol", pa.string()),
+        ("qty", pa.int64()),
+        ("price", pa.float64()),
+        ("commission", pa.float64()),
+    ]
+)
+EQUITY_SCHEMA = pa.schema(
+    [
+        ("ts", _TS),
+        ("cash", pa.float64()),
+        ("equity", pa.float64()),
+        ("unrealized_pnl", pa.float64()),
+        ("realized_pnl", pa.float64()),
+    ]
+)
+
+
+def _segment_index(path: Path, candidate: Path) -> Optional[int]:
+    middle = candidate.name[len(path.stem) + 1 : len(candidate.name) - len(path.suffix)]
+    return int(middle) if middle.isdigit() else None
+
+
+def ledger_files(path: str | Path) -> list[Path]:
+    """Files holding the ledger at ``path`` in row order.
+
+    A resumed run appends to a ledger by adding a numbered segment next to it
+    (``equity.parquet``, ``equity.1.parquet``, ``equity.2.parquet``, ...) instead of
+    rewriting the rows already on disk.
+    """
+    path = Path(path)
+    segments: list[tuple[int, Path]] = []
+    for candidate in path.parent.glob(f"{path.stem}.*{path.suffix}"):
+        index = _segment_index(path, candidate)
+        if index is not None:
+            segments.append((index, candidate))
+    files = [path] if path.exists() else []
+    return files + [p for _, p in sorted(segments)]
+
+
+def read_ledger(path: str | Path, columns: Optional[Sequence[str]] = None) -> pa.Table:
+    """Read every segment of a ledger as one table."""
+    files = ledger_files(path)
+    if not files:
+        raise FileNotFoundError(f"No ledger at {path}")
+    cols = None if columns is None else list(columns)
+    return pa.concat_tables([pq.read_table(f, columns=cols) for f in files])
+
+
+def remove_ledger(path: str | Path) -> None:
+    """Delete a ledger and its appended segments."""
+    for f in ledger_files(path):
+        f.unlink(missing_ok=True)
+
+
+class ParquetRecorder:
+    """Append-only ledger that buffers typed columns and streams them to Parquet.
+
+    Rows are appended positionally in schema order (timestamps as UTC epoch nanoseconds).
+    Every ``flush_every`` rows the buffers are converted into a RecordBatch and written
+    through an incremental ``ParquetWriter``, so memory stays bounded by the buffer size
+    regardless of run length. Any existing ledger at ``path`` is removed up front; the
+    new file is only created once the first batch is flushed, so a recorder that never
+    receives rows writes nothing.
+
+    With ``append=True`` an existing ledger is continued instead: the new rows go to the
+    next numbered segment (see ``ledger_files``), written under a temporary name and
+    renamed into place on ``close()``. Existing segments are never read or rewritten.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        schema: pa.Schema,
+        flush_every: int = 65536,
+        *,
+        append: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.schema = schema
+        self.flush_every = max(1, int(flush_every))
+        self.rows = 0
+        self._columns: list[list[Any]] = [[] for _ in schema.names]
+        self._buffered = 0
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._target = self.path
+        self._tmp_path: Optional[Path] = None
+        existing = ledger_files(self.path) if append else []
+        if existing:
+            self._open_segment(existing)
+        else:
+            # Never write through a stale file: it may be hard-linked into the result cache
+            remove_ledger(self.path)
+
+    def _open_segment(self, existing: list[Path]) -> None:
+        # Only the footers are read: the schema check and the row count
+        if not pq.read_schema(existing[0]).equals(self.schema):
+            raise ValueError(f"Cannot append to {self.path}: schema differs from recorder")
+        self.rows = sum(pq.ParquetFile(f).metadata.num_rows for f in existing)
+        last = 0 if existing[-1] == self.path else _segment_index(self.path, existing[-1])
+        self._target = self.path.with_name(f"{self.path.stem}.{(last or 0) + 1}{self.path.suffix}")
+        self._tmp_path = self._target.with_name(self._target.name + ".tmp")
+
+    def append(self, *values: Any) -> None:
+        for column, value in zip(self._columns, values):
+            column.append(value)
+        self._buffered += 1
+        self.rows += 1
+        if self._buffered >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffered == 0:
+            return
+        arrays = [
+            pa.array(column, type=field.type) for column, field in zip(self._columns, self.schema)
+        ]
+        batch = pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._tmp_path or self._target, self.schema)
+        self._writer.write_batch(batch)
+        self._columns = [[] for _ in self.schema.names]
+        self._buffered = 0
+
+    def close(self) -> None:
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._tmp_path is not None and self._tmp_path.exists():
+            os.replace(self._tmp_path, self._target)
+        self._tmp_path = None
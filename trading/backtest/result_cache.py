@@ -0,0 +1,237 @@
+from __future__ import annotations
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+
+from trading.backtest.engine import BacktestConfig
+from trading.backtest.recorders import remove_ledger
+from trading.data.hashing import file_sha256
+from trading.data.series_loader import source_files
+from trading.util.git import run_git
+
+
+ARTIFACTS = ("bars.parquet", "orders.parquet", "fills.parquet", "equity.parquet", "summary.json")
+
+# Config fields that do not influence results and must not split the cache
+_NON_RESULT_FIELDS = {
+    "run_id",
+    "out_dir",
+    "heartbeat_every",
+    "artifact_flush_rows",
+    "profile_stages",
+    "result_cache_dir",
+    "checkpoint",
+    "series_cache_dir",
+    "actions_ttl_days",
+    "load_workers",
+}
+
+
+# Distribution name used when the package is not imported from a git checkout
+_DISTRIBUTION = "trading-app"
+
+
+def _installed_version() -> Optional[str]:
+    """``trading-app==<version>`` when the imported package is a regular install, else None.
+
+    Only a copy installed into site-packages from an index, a hashed archive or a VCS
+    commit is pinned by its metadata. Editable and local-directory installs keep the
+    version number while the code under it changes, so they are not identifiable.
+    """
+    from importlib.metadata import PackageNotFoundError, distribution
+
+    import trading
+
+    try:
+        dist = distribution(_DISTRIBUTION)
+    except PackageNotFoundError:
+        return None
+    # The metadata must describe the code actually imported, not a stale install
+    installed = Path(str(dist.locate_file("trading/__init__.py"))).resolve()
+    if installed != Path(trading.__file__).resolve():
+        return None
+    direct_url = dist.read_text("direct_url.json")
+    if direct_url is None:
+        return f"{_DISTRIBUTION}=={dist.version}"
+    origin = json.loads(direct_url)
+    commit = (origin.get("vcs_info") or {}).get("commit_id")
+    if commit:
+        return f"{_DISTRIBUTION}=={dist.version}+{commit}"
+    # A hashed archive pins the code; a local directory (editable or not) does not
+    archive = origin.get("archive_info") or {}
+    if archive.get("hash") or archive.get("hashes"):
+        return f"{_DISTRIBUTION}=={dist.version}"
+    return None
+
+
+def code_version() -> Optional[str]:
+    """Identity of the running ``trading`` code, or None when it cannot be pinned down.
+
+    Inside a git checkout this is the HEAD SHA, or None with uncommitted changes (a
+    dirty tree cannot be identified by its SHA, so callers should bypass the cache).
+    A regular (non-editable) install is identified by its distribution version.
+    """
+    try:
+        sha = run_git("rev-parse", "HEAD")
+        if sha:
+            dirty = run_git("status", "--porcelain", "--untracked-files=no")
+            return None if dirty else sha
+    except OSError:
+        pass
+    return _installed_version()
+
+
+def strategy_code_version(cls: type) -> Optional[str]:
+    """Identity of a strategy class's code when it lives outside ``trading``.
+
+    Built-in strategies are covered by :func:`code_version`. A third-party class is
+    identified by its distribution version (if installed) plus the digest of the
+    module defining it; helpers it imports from other modules are not covered.
+    """
+    import inspect
+    from importlib.metadata import packages_distributions, version
+
+    module = cls.__module__
+    if module == "trading" or module.startswith("trading."):
+        return None
+    parts = []
+    for dist in sorted(packages_distributions().get(module.partition(".")[0], [])):
+        parts.append(f"{dist}=={version(dist)}")
+    try:
+        source = inspect.getsourcefile(cls)
+    except TypeError:
+        source = None
+    if source is not None:
+        parts.append(f"sha256:{file_sha256(Path(source))[:16]}")
+    return ",".join(parts) or None
+
+
+def input_paths(config: BacktestConfig) -> Dict[str, list[Path]]:
+    """Source files whose content determines the run's input bars.
+
+    For the partitioned store only the year partitions overlapping the configured window
+    count, so appending newer data does not invalidate results for earlier windows.
+    Adjusted runs also depend on the corporate-action store's events table.
+    """
+    paths = {
+        sym: source_files(config.cache_dir, sym, config.interval, config.start, config.end)
+        for sym in config.symbols
+    }
+    if config.adjustment != "none":
+        from trading.data.action_store import ACTIONS_FILE, STORE_DIR
+
+        paths[STORE_DIR] = [Path(config.cache_dir) / STORE_DIR / ACTIONS_FILE]
+    return paths
+
+
+def result_cache_key(config: BacktestConfig, code: str) -> str:
+    """Key combining result-relevant config, config hash, input content hashes and code."""
+    fields = {k: v for k, v in asdict(config).items() if k not in _NON_RESULT_FIELDS}
+    base = Path(config.cache_dir)
+    inputs = {
+        sym: [
+            (path.relative_to(base).as_posix(), file_sha256(path) if path.exists() else None)
+            for path in paths
+        ]
+        for sym, paths in input_paths(config).items()
+    }
+    payload = {"config": fields, "inputs": inputs, "code": code}
+    blob = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class ResultCache:
+    """Content-addressed store of run artifacts: ``{base_dir}/{key}/<artifacts>``.
+
+    Entries are written to a temporary directory and renamed into place, so a
+    concurrent or interrupted run never leaves a partial entry behind. Restoring an
+    entry touches it, and ``gc`` drops entries nothing has used for a while.
+    """
+
+    def __init__(self, base_dir: str | Path) -> None:
+        self.base_dir = Path(base_dir)
+
+    def _entry(self, key: str) -> Path:
+        return self.base_dir / key
+
+    def lookup(self, key: str) -> Optional[Path]:
+        entry = self._entry(key)
+        return entry if (entry / "summary.json").exists() else None
+
+    def store(self, key: str, run_dir: Path) -> None:
+        entry = self._entry(key)
+        if entry.exists():
+            return
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.base_dir / f".tmp-{key}-{uuid.uuid4().hex[:8]}"
+        tmp.mkdir()
+        for name in ARTIFACTS:
+            if not (run_dir / name).exists():
+                continue
+            # Ledgers are immutable once written and can be shared; the summary is
+            # rewritten per run, so it gets its own copy
+            if name == "summary.json":
+                shutil.copy2(run_dir / name, tmp / name)
+            else:
+                _link_or_copy(run_dir / name, tmp / name)
+        try:
+            tmp.rename(entry)
+        except OSError:
+            # Another run stored the same key first
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def restore(self, key: str, run_dir: Path, run_id: str) -> Dict[str, Any]:
+        """Materialize a cached entry as ``run_dir`` and return its rewritten summary."""
+        entry = self._entry(key)
+        run_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        for name in ARTIFACTS:
+            src = entry / name
+            dst = run_dir / name
+            if name == "summary.json":
+                continue
+            remove_ledger(dst)
+            if src.exists():
+                _link_or_copy(src, dst)
+        summary: Dict[str, Any] = json.loads((entry / "summary.json").read_text("utf-8"))
+        summary["cache"] = {"hit": True, "key": key, "source_run_id": summary.get("run_id")}
+        summary["run_id"] = run_id
+        (run_dir / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        return summary
+
+    def gc(self, keep_days: float, *, apply: bool = True) -> list[Path]:
+        """Remove entries neither stored nor restored in the last ``keep_days`` days,
+        along with temporary directories that interrupted stores left behind.
+
+        Returns the removed entries; with ``apply=False`` they are only listed.
+        """
+        if not self.base_dir.exists():
+            return []
+        cutoff = time.time() - keep_days * 86400.0
+        removed: list[Path] = []
+        for child in sorted(self.base_dir.iterdir()):
+            try:
+                if child.is_dir() and child.stat().st_mtime < cutoff:
+                    removed.append(child)
+            except FileNotFoundError:
+                continue
+        if apply:
+            for path in removed:
+                shutil.rmtree(path, ignore_errors=True)
+        return removed
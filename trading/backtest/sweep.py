@@ -0,0 +1,142 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import product
+from pathlib import Path
+from typing import Any, Dict, Optional
+import logging
+import shutil
+
+import pandas as pd
+
+from trading.backtest.engine import BacktestConfig, BacktestEngine, load_series
+
+
+_LEADERBOARD_METRICS = [
+    "cagr",
+    "sharpe",
+    "sortino",
+    "max_drawdown",
+    "calmar",
+    "hit_rate",
+    "turnover_notional",
+    "time_in_market_ratio",
+    "peak_gross_exposure",
+]
+
+# Evicted indicator columns spill here so sweep workers can reuse each other's work
+INDICATOR_SPILL_DIR = ".indicator_cache"
+
+# Per-worker state populated by _init_worker so series are read once per process
+_WORKER_SERIES: Optional[Dict[str, pd.DataFrame]] = None
+_WORKER_BASE: Optional[BacktestConfig] = None
+_WORKER_STRATEGY: Optional[str] = None
+
+
+def expand_param_grid(params: Dict[str, Any]) -> list[Dict[str, Any]]:
+    """Expand a ``strategy.params`` block into the cartesian product of its list values.
+
+    Scalars are held fixed; list/tuple values are sweep axes, e.g.
+    ``{"fast": [10, 20], "slow": 50}`` -> ``[{"fast": 10, "slow": 50}, {"fast": 20, "slow": 50}]``.
+    Key order of the block is preserved so parameter ids are stable.
+    """
+    keys = list(params.keys())
+    axes = [list(params[k]) if isinstance(params[k], (list, tuple)) else [params[k]] for k in keys]
+    if any(len(axis) == 0 for axis in axes):
+        raise ValueError("parameter grid has an empty axis")
+    return [dict(zip(keys, combo)) for combo in product(*axes)]
+
+
+def _init_worker(base: BacktestConfig, strategy_name: str) -> None:
+    global _WORKER_SERIES, _WORKER_BASE, _WORKER_STRATEGY
+    from trading.indicators.cache import IndicatorCache, default_cache, set_default_cache
+
+    # Runs in one process share indicator columns, e.g. SMA(20) across fast/slow pairs
+    spill_dir = Path(base.out_dir) / INDICATOR_SPILL_DIR
+    if default_cache().spill_dir != spill_dir:
+        set_default_cache(IndicatorCache(spill_dir=spill_dir))
+
+    # Forked workers inherit the parent's already-loaded series; spawned ones load once here
+    if _WORKER_SERIES is None or _WORKER_BASE != base:
+        _WORKER_SERIES = load_series(base)
+    _WORKER_BASE = base
+    _WORKER_STRATEGY = strategy_name
+
+
+def _run_one(param_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    from trading.strategy import create_strategy, get_strategy
+
+    assert _WORKER_BASE is not None and _WORKER_STRATEGY is not None
+    strategy_cls = get_strategy(_WORKER_STRATEGY)
+    cfg = replace(_WORKER_BASE, run_id=param_id)
+
+    def factory(symbol: str) -> Any:
+        return create_strategy(strategy_cls, symbol, params)
+
+    engine = BacktestEngine(
+        strategy_factory=factory, config=cfg, logger=logging.getLogger("trading.sweep")
+    )
+    engine.run(series=_WORKER_SERIES)
+    summary = engine.summary or {}
+    metrics = summary.get("metrics") or {}
+    timers = (summary.get("observability") or {}).get("timers") or {}
+    row: Dict[str, Any] = {"param_id": param_id}
+    row.update({f"param_{k}": v for k, v in params.items()})
+    row.update({k: metrics.get(k) for k in _LEADERBOARD_METRICS})
+    row["bars_per_sec"] = (timers.get("bar_loop_ms") or {}).get("bars_per_sec")
+    return row
+
+
+def run_sweep(
+    base: BacktestConfig,
+    strategy_name: str,
+    grid: Dict[str, Any],
+    *,
+    sweep_id: str,
+    max_workers: Optional[int] = None,
+    sort_by: str = "sharpe",
+) -> Path:
+    """Run one ``BacktestEngine`` per parameter set and write ``leaderboard.parquet``.
+
+    Runs land under ``{base.out_dir}/{sweep_id}/{param_id}``. Bar series are loaded once
+    in the parent and reused by every run: forked workers inherit them, spawned workers
+    load them once in the pool initializer. With ``max_workers == 1`` everything runs
+    in-process. Indicator columns requested through the default ``IndicatorCache`` are
+    shared by runs in one process and spill to a scratch directory removed at the end.
+    Returns the leaderboard path.
+    """
+    from trading.indicators.cache import default_cache, set_default_cache
+
+    param_sets = expand_param_grid(grid)
+    sweep_dir = Path(base.out_dir) / sweep_id
+    sweep_dir.mkdir(parents=True, exist_ok=True)
+    run_base = replace(base, out_dir=sweep_dir, run_id=sweep_id)
+    jobs = [(f"p{idx:04d}", params) for idx, params in enumerate(param_sets)]
+
+    # Load once in the parent: used directly in-process and inherited by forked workers
+    previous_cache = default_cache()
+    _init_worker(run_base, strategy_name)
+    rows: list[Dict[str, Any]]
+    try:
+        if max_workers == 1 or len(jobs) == 1:
+            rows = [_run_one(pid, params) for pid, params in jobs]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(run_base, strategy_name),
+            ) as pool:
+                futures = [pool.submit(_run_one, pid, params) for pid, params in jobs]
+                rows = [f.result() for f in futures]
+    finally:
+        set_default_cache(previous_cache)
+        shutil.rmtree(sweep_dir / INDICATOR_SPILL_DIR, ignore_errors=True)
+
+    leaderboard = pd.DataFrame(rows)
+    if sort_by in leaderboard.columns:
+        leaderboard = leaderboard.sort_values(
+            sort_by, ascending=False, na_position="last", kind="stable"
+        )
+    out = sweep_dir / "leaderboard.parquet"
+    leaderboard.reset_index(drop=True).to_parquet(out, index=False)
+    return out
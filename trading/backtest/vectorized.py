@@ -0,0 +1,296 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+import time
+
+import numpy as np
+import pandas as pd
+
+from trading.core.contracts import SignalStrategy
+from trading.backtest.engine import BacktestConfig, load_series, write_summary
+from trading.backtest.recorders import (
+    BARS_SCHEMA,
+    EQUITY_SCHEMA,
+    FILLS_SCHEMA,
+    ORDERS_SCHEMA,
+    remove_ledger,
+)
+from trading.data.panel import end_ns, union_timeline
+
+
+_INITIAL_CASH = 100000.0
+
+
+class VectorizedBacktestEngine:
+    """Signal-array backtest mode: one NumPy pass per symbol instead of a per-bar loop.
+
+    Each strategy returns a target position (shares, long-only) for every bar of its
+    symbol. Position changes are filled as market orders at the bar close with the
+    configured slippage and fixed commission, which is what the event-driven engine does
+    for market orders (risk checks in backtests only gate limit-order notional). Cash,
+    average cost, realized/unrealized PnL and equity are computed with array operations;
+    only the fills themselves are walked in Python to track average cost.
+
+    Writes the same ``bars/orders/fills/equity.parquet`` and ``summary.json`` artifacts
+    as ``BacktestEngine``.
+    """
+
+    def __init__(
+        self,
+        strategy_factory: Callable[[str], SignalStrategy],
+        config: BacktestConfig,
+        logger: Optional[Any] = None,
+    ) -> None:
+        self.strategy_factory = strategy_factory
+        self.config = config
+        try:
+            self._logger: Any = logger or __import__("structlog").get_logger("trading.backtest")
+        except Exception:
+            import logging as _logging
+
+            self._logger = logger or _logging.getLogger("trading.backtest")
+
+    def run(self, series: Optional[Dict[str, pd.DataFrame]] = None) -> Dict[str, Any]:
+        run_start = time.perf_counter()
+        out_base = Path(self.config.out_dir) / self.config.run_id
+        (out_base / "reports").mkdir(parents=True, exist_ok=True)
+        if series is None:
+            series = load_series(self.config)
+
+        symbols = list(series.keys())
+        ends = {sym: end_ns(df) for sym, df in series.items()}
+        timeline = union_timeline(ends[sym] for sym in symbols)
+        n_ts = len(timeline)
+        bps = self.config.slippage_bps / 10000.0 if self.config.slippage_bps > 0 else 0.0
+        commission = float(self.config.commission_fixed)
+
+        cash_flow = np.zeros(n_ts, dtype="float64")
+        realized_flow = np.zeros(n_ts, dtype="float64")
+        position_value = np.zeros(n_ts, dtype="float64")
+        unrealized = np.zeros(n_ts, dtype="float64")
+        gross = np.zeros(n_ts, dtype="float64")
+        in_market = np.zeros(n_ts, dtype=bool)
+        turnover = 0.0
+        missing_bars: Dict[str, int] = {sym: 0 for sym in self.config.symbols}
+        bar_frames: list[pd.DataFrame] = []
+        fill_frames: list[pd.DataFrame] = []
+
+        loop_start = time.perf_counter()
+        for sym_idx, sym in enumerate(symbols):
+            df = series[sym]
+            sym_end = ends[sym]
+            n = len(sym_end)
+            close = df["close"].to_numpy(dtype="float64")
+            targets = self._targets(sym, df, n)
+
+            delta = np.diff(targets, prepend=0)
+            trade_idx = np.flatnonzero(delta)
+            fill_px = np.where(delta > 0, close * (1.0 + bps), close * (1.0 - bps))
+            avg_after, realized = self._walk_fills(delta, trade_idx, fill_px, commission)
+
+            # Per-bar cash and realized PnL flows land on the bar's slot in the timeline
+            slot = np.searchsorted(timeline, sym_end)
+            traded_qty = delta[trade_idx]
+            traded_px = fill_px[trade_idx]
+            np.add.at(cash_flow, slot[trade_idx], -(traded_qty * traded_px) - commission)
+            np.add.at(realized_flow, slot[trade_idx], realized)
+            turnover += float(np.abs(traded_qty * traded_px).sum())
+
+            # Mark-to-market on the union timeline: close when the symbol has a bar,
+            # otherwise the position's average cost (same rule as PortfolioState.snapshot)
+            last = np.searchsorted(sym_end, timeline, side="right") - 1
+            seen = last >= 0
+            last_c = np.clip(last, 0, None)
+            has_bar = np.zeros(n_ts, dtype=bool)
+            has_bar[slot] = True
+            qty_t = np.where(seen, targets[last_c], 0)
+            avg_t = np.where(seen, avg_after[last_c], 0.0)
+            mark_t = np.where(has_bar, close[last_c], avg_t)
+            position_value += qty_t * mark_t
+            unrealized += (mark_t - avg_t) * qty_t
+            gross += np.abs(qty_t * mark_t)
+            in_market |= qty_t != 0
+            missing_bars[sym] = int(n_ts - n)
+
+            bar_frames.append(
+                pd.DataFrame(
+                    {
+                        "_ts": sym_end,
+                        "_sym": sym_idx,
+                        "symbol": sym,
+                        "open": df["open"].to_numpy(dtype="float64"),
+                        "high": df["high"].to_numpy(dtype="float64"),
+                        "low": df["low"].to_numpy(dtype="float64"),
+                        "close": close,
+                        "volume": df["volume"].to_numpy(dtype="int64"),
+                    }
+                )
+            )
+            fill_frames.append(
+                pd.DataFrame(
+                    {
+                        "_ts": sym_end[trade_idx],
+                        "_sym": sym_idx,
+                        "symbol": sym,
+                        "qty": traded_qty,
+                        "price": traded_px,
+                    }
+                )
+            )
+
+        cash = _INITIAL_CASH + np.cumsum(cash_flow)
+        realized_cum = np.cumsum(realized_flow)
+        equity = cash + position_value
+        loop_ms = (time.perf_counter() - loop_start) * 1000.0
+
+        bars = self._ordered(bar_frames)
+        fills = self._ordered(fill_frames)
+        self._write_tables(out_base, timeline, bars, fills, cash, equity, unrealized, realized_cum)
+
+        total_bars = len(bars)
+        total_secs = max(1e-9, time.perf_counter() - run_start)
+        summary = write_summary(
+            out_base,
+            self.config,
+            counters={
+                "bars": total_bars,
+                "orders_proposed": len(fills),
+                "orders_approved": len(fills),
+                "fills": len(fills),
+            },
+            timers={
+                "vectorized_ms": {
+                    "count": 1,
+                    "avg": loop_ms,
+                    "max": loop_ms,
+                    "p50": loop_ms,
+                    "p95": loop_ms,
+                    "bars_per_sec": float(total_bars) / float(total_secs),
+                }
+            },
+            missing_bars_per_symbol=missing_bars,
+            turnover_notional=turnover,
+            time_in_market_ratio=float(in_market.sum()) / float(n_ts) if n_ts else 0.0,
+            peak_gross_exposure=max(0.0, float(gross.max())) if n_ts else 0.0,
+            mode="vectorized",
+        )
+        try:
+            self._logger.info("vectorized_backtest_finished", bars=total_bars, fills=len(fills))
+        except TypeError:
+            self._logger.info(
+                "vectorized_backtest_finished", extra={"bars": total_bars, "fills": len(fills)}
+            )
+        return summary
+
+    def _targets(self, symbol: str, df: pd.DataFrame, n: int) -> np.ndarray:
+        raw = np.asarray(self.strategy_factory(symbol).target_positions(df), dtype="float64")
+        if raw.shape != (n,):
+            raise ValueError(
+                f"target_positions for {symbol} returned shape {raw.shape}; expected ({n},)"
+            )
+        if np.isnan(raw).any():
+            raise ValueError(f"target_positions for {symbol} contains NaN")
+        targets: np.ndarray = np.rint(raw).astype(np.int64)
+        if (targets < 0).any():
+            raise ValueError(f"target_positions for {symbol} must be long-only (>= 0)")
+        return targets
+
+    @staticmethod
+    def _walk_fills(
+        delta: np.ndarray, trade_idx: np.ndarray, fill_px: np.ndarray, commission: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Average cost after every bar and realized PnL per fill (PortfolioState rules)."""
+        avg_at = np.full(len(delta), np.nan)
+        realized = np.zeros(len(trade_idx), dtype="float64")
+        qty = 0
+        avg = 0.0
+        for j, k in enumerate(trade_idx.tolist()):
+            d = int(delta[k])
+            px = float(fill_px[k])
+            if d > 0:
+                new_qty = qty + d
+                avg = (avg * qty + px * d) / new_qty
+                qty = new_qty
+            else:
+                realized[j] = (px - avg) * -d - commission
+                qty += d
+                if qty == 0:
+                    avg = 0.0
+            avg_at[k] = avg
+        # Forward-fill average cost between fills; zero before the first fill
+        filled = np.where(np.isnan(avg_at), -1, np.arange(len(delta)))
+        filled = np.maximum.accumulate(filled) if len(filled) else filled
+        return np.where(filled >= 0, avg_at[np.clip(filled, 0, None)], 0.0), realized
+
+    @staticmethod
+    def _ordered(frames: list[pd.DataFrame]) -> pd.DataFrame:
+        df = pd.concat(frames, ignore_index=True)
+        return df.sort_values(["_ts", "_sym"], kind="stable").reset_index(drop=True)
+
+    def _write_tables(
+        self,
+        out_base: Path,
+        timeline: np.ndarray,
+        bars: pd.DataFrame,
+        fills: pd.DataFrame,
+        cash: np.ndarray,
+        equity: np.ndarray,
+        unrealized: np.ndarray,
+        realized: np.ndarray,
+    ) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        def write(schema: pa.Schema, columns: list[Any], name: str) -> None:
+            # Replace rather than overwrite in place (files may be hard-linked elsewhere);
+            # segments left by an earlier resumed run in this directory go too
+            remove_ledger(out_base / name)
+            if len(columns[0]) == 0:
+                return
+            arrays = [
+                pa.array(np.asarray(col), type=field.type) for col, field in zip(columns, schema)
+            ]
+            pq.write_table(pa.Table.from_arrays(arrays, schema=schema), out_base / name)
+
+        write(
+            BARS_SCHEMA,
+            [
+                bars["_ts"],
+                bars["symbol"],
+                bars["open"],
+                bars["high"],
+                bars["low"],
+                bars["close"],
+                bars["volume"],
+            ],
+            "bars.parquet",
+        )
+        qty = fills["qty"].to_numpy()
+        write(
+            ORDERS_SCHEMA,
+            [
+                fills["_ts"],
+                fills["symbol"],
+                np.where(qty > 0, "buy", "sell"),
+                np.full(len(fills), "market"),
+                qty,
+                np.full(len(fills), np.nan),
+            ],
+            "orders.parquet",
+        )
+        write(
+            FILLS_SCHEMA,
+            [
+                fills["_ts"],
+                fills["symbol"],
+                qty,
+                fills["price"],
+                np.full(len(fills), float(self.config.commission_fixed)),
+            ],
+            "fills.parquet",
+        )
+        write(
+            EQUITY_SCHEMA,
+            [timeline, cash, equity, unrealized, realized],
+            "equity.parquet",
+        )
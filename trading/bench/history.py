@@ -0,0 +1,102 @@
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+import json
+import os
+import platform
+
+from trading.bench.suite import BenchResult
+
+
+DEFAULT_HISTORY = Path("bench") / "history.json"
+
+
+@dataclass
+class Regression:
+    name: str
+    baseline: float
+    current: float
+    unit: str
+
+    @property
+    def change(self) -> float:
+        """Relative throughput change (negative means slower)."""
+        return self.current / self.baseline - 1.0 if self.baseline else 0.0
+
+
+def host_info() -> Dict[str, str]:
+    """Fields identifying the host; throughput is only comparable on the same one."""
+    return {"machine": platform.machine(), "node": platform.node()}
+
+
+def make_entry(results: list[BenchResult], git_sha: Optional[str]) -> Dict[str, Any]:
+    """One history record: environment plus results keyed by benchmark name."""
+    return {
+        "git_sha": git_sha,
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        **host_info(),
+        "results": {r.name: asdict(r) for r in results},
+    }
+
+
+def load_history(path: str | Path) -> list[Dict[str, Any]]:
+    p = Path(path)
+    if not p.exists():
+        return []
+    entries: list[Dict[str, Any]] = json.loads(p.read_text("utf-8"))
+    return entries
+
+
+def append_history(path: str | Path, entry: Dict[str, Any]) -> None:
+    """Append an entry, rewriting the file atomically."""
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    entries = load_history(p)
+    entries.append(entry)
+    tmp = p.with_suffix(p.suffix + ".tmp")
+    tmp.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+    os.replace(tmp, p)
+
+
+def find_baseline(
+    history: list[Dict[str, Any]],
+    git_sha: Optional[str],
+    baseline_sha: Optional[str] = None,
+    host: Optional[Dict[str, str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Entry to compare against: the latest for ``baseline_sha`` if given, otherwise the
+    latest entry recorded for a different commit than ``git_sha``.
+
+    Only entries recorded on ``host`` (default: this one, see :func:`host_info`) are
+    candidates, since a shared history mixes results from different machines.
+    """
+    host = host_info() if host is None else host
+    for entry in reversed(history):
+        if any(entry.get(key) != value for key, value in host.items()):
+            continue
+        sha = entry.get("git_sha")
+        if baseline_sha is not None:
+            if sha is not None and sha.startswith(baseline_sha):
+                return entry
+        elif sha != git_sha or git_sha is None:
+            return entry
+    return None
+
+
+def compare(
+    baseline: Dict[str, Any], results: list[BenchResult], threshold: float = 0.1
+) -> list[Regression]:
+    """Benchmarks whose throughput dropped by more than ``threshold`` (0.1 = 10%)."""
+    regressions: list[Regression] = []
+    previous = baseline.get("results", {})
+    for result in results:
+        before = previous.get(result.name)
+        if before is None or before.get("unit") != result.unit:
+            continue
+        base_value = float(before["value"])
+        if base_value > 0 and result.value < base_value * (1.0 - threshold):
+            regressions.append(Regression(result.name, base_value, result.value, result.unit))
+    return regressions
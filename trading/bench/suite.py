@@ -0,0 +1,258 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+import logging
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from trading.core.contracts import Strategy
+from trading.core.models import Bar, Fill, Order
+
+
+@dataclass
+class BenchResult:
+    """Throughput of one benchmark; ``value`` is in ``unit`` and higher is better."""
+
+    name: str
+    value: float
+    unit: str
+    seconds: float
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+def _best_of(fn: Callable[[], None], repeat: int) -> float:
+    """Best wall time of ``repeat`` calls; the minimum is the least noisy estimate."""
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        start = perf_counter()
+        fn()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def _throughput(
+    name: str, fn: Callable[[], None], ops: int, unit: str, repeat: int, **params: Any
+) -> BenchResult:
+    seconds = _best_of(fn, repeat)
+    return BenchResult(name, ops / max(seconds, 1e-12), unit, seconds, dict(params, ops=ops))
+
+
+def bench_load_parquet_series(tmp: Path, repeat: int, bars: int) -> BenchResult:
+    from trading.data.series_loader import load_parquet_series
+    from trading.data.synthetic import write_synthetic_bars
+
+    days = max(1, bars // 390)
+    end = pd.bdate_range("2024-01-02", periods=days)[-1].strftime("%Y-%m-%d")
+    write_synthetic_bars(["LOAD"], "1m", "2024-01-02", end, tmp, seed=1)
+    rows = len(load_parquet_series(tmp, "LOAD", "1m"))
+
+    def run() -> None:
+        load_parquet_series(tmp, "LOAD", "1m")
+
+    return _throughput("micro.load_parquet_series", run, rows, "rows/s", repeat)
+
+
+def bench_simulate_fill(repeat: int, ops: int) -> BenchResult:
+    from trading.execution.simulator import FillPolicy, SimpleExecutionSimulator
+
+    sim = SimpleExecutionSimulator(slippage_bps=1, fill_policy=FillPolicy(None))
+    order = Order("bench", "SPY", "buy", "market", 10)
+    ts = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    def run() -> None:
+        for _ in range(ops):
+            sim.simulate_fill(
+                order=order,
+                bar_close=100.0,
+                bar_high=101.0,
+                bar_low=99.0,
+                bar_volume=1000,
+                fill_ts=ts,
+            )
+
+    return _throughput("micro.simulate_fill", run, ops, "ops/s", repeat)
+
+
+def bench_apply_fill(repeat: int, ops: int) -> BenchResult:
+    from trading.portfolio.accounting import PortfolioState
+
+    ts = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    # Alternate buys and sells so the position stays bounded
+    fills = [Fill("b", ts, 10, 100.0, 1.0), Fill("s", ts, -10, 100.5, 1.0)]
+
+    def run() -> None:
+        portfolio = PortfolioState(cash=1e9)
+        for i in range(ops):
+            fill = fills[i & 1]
+            portfolio.apply_fill(fill, price=fill.price, symbol="SPY", commission=1.0)
+
+    return _throughput("micro.apply_fill", run, ops, "ops/s", repeat)
+
+
+def bench_snapshot(repeat: int, ops: int, positions: int = 50) -> BenchResult:
+    from trading.portfolio.accounting import PortfolioState
+
+    ts = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    portfolio = PortfolioState(cash=1e9)
+    marks: Dict[str, float] = {}
+    for i in range(positions):
+        sym = f"S{i:03d}"
+        portfolio.apply_fill(Fill(sym, ts, 10, 100.0, 0.0), price=100.0, symbol=sym, commission=0.0)
+        marks[sym] = 101.0
+
+    def run() -> None:
+        for _ in range(ops):
+            portfolio.snapshot(as_of=ts, marks=marks)
+
+    return _throughput("micro.snapshot", run, ops, "ops/s", repeat, positions=positions)
+
+
+def bench_validate(repeat: int, ops: int) -> BenchResult:
+    from trading.risk.manager import BasicRiskManager, RiskParams
+
+    risk = BasicRiskManager(
+        RiskParams(max_gross_exposure=1e9, per_symbol_notional_cap=25000.0),
+        get_gross_exposure=lambda: 0.0,
+        enable_session_gate=False,
+    )
+    order = Order("bench", "SPY", "buy", "limit", 10, limit_price=100.0)
+
+    def run() -> None:
+        for _ in range(ops):
+            risk.validate(order)
+
+    return _throughput("micro.validate", run, ops, "ops/s", repeat)
+
+
+def bench_compute_from_equity(repeat: int, rows: int) -> BenchResult:
+    from trading.backtest.metrics import compute_from_equity
+
+    rng = np.random.default_rng(1)
+    equity = pd.DataFrame(
+        {
+            "ts": pd.date_range("2020-01-01", periods=rows, freq="min", tz="UTC"),
+            "equity": 1e5 * np.exp(np.cumsum(rng.normal(0.0, 1e-4, rows))),
+        }
+    )
+
+    def run() -> None:
+        compute_from_equity(equity, "1m")
+
+    return _throughput("micro.compute_from_equity", run, rows, "rows/s", repeat)
+
+
+class _AccumulateStrategy(Strategy):
+    """Buys one share every ``every`` bars so macro runs exercise the order path."""
+
+    def __init__(self, symbol: str, every: int = 10) -> None:
+        self.symbol = symbol
+        self.every = every
+        self.seen = 0
+
+    def on_bar(self, bar: Bar) -> Optional[Order]:
+        self.seen += 1
+        if self.seen % self.every:
+            return None
+        return Order(f"{self.symbol}-{self.seen}", self.symbol, "buy", "market", 1)
+
+
+def bench_backtest(tmp: Path, symbols: int, interval: str, start: str, end: str) -> BenchResult:
+    """End-to-end event-loop backtest over a synthetic universe, in bars per second."""
+    from trading.backtest.engine import BacktestConfig, BacktestEngine
+    from trading.data.synthetic import SynthParams, synthetic_symbols, write_synthetic_bars
+
+    names = synthetic_symbols(symbols)
+    cache_dir = tmp / f"universe-{symbols}-{interval}"
+    write_synthetic_bars(
+        names, interval, start, end, cache_dir, params=SynthParams(missing_prob=0.01), seed=1
+    )
+    cfg = BacktestConfig(
+        symbols=names,
+        interval=interval,
+        cache_dir=cache_dir,
+        run_id=f"bench-{symbols}",
+        out_dir=tmp / "runs",
+        heartbeat_every=10**9,
+        profile_stages=False,
+    )
+    engine = BacktestEngine(
+        strategy_factory=_AccumulateStrategy, config=cfg, logger=logging.getLogger("trading.bench")
+    )
+    started = perf_counter()
+    engine.run()
+    seconds = perf_counter() - started
+    assert engine.summary is not None
+    bars = int(engine.summary["observability"]["counters"]["bars"])
+    return BenchResult(
+        f"macro.backtest.{interval}.{symbols}sym",
+        bars / max(seconds, 1e-12),
+        "bars/s",
+        seconds,
+        {"symbols": symbols, "interval": interval, "start": start, "end": end, "bars": bars},
+    )
+
+
+@dataclass
+class SuiteConfig:
+    """Sizes for one suite run; ``quick()`` is small enough for CI smoke checks."""
+
+    repeat: int = 5
+    micro_ops: int = 20000
+    micro_rows: int = 200000
+    universes: tuple[int, ...] = (1, 10, 100, 500)
+    interval: str = "1h"
+    start: str = "2023-01-01"
+    end: str = "2023-12-31"
+
+    @classmethod
+    def quick(cls) -> SuiteConfig:
+        return cls(
+            repeat=3,
+            micro_ops=2000,
+            micro_rows=20000,
+            universes=(1, 5),
+            start="2023-01-01",
+            end="2023-03-31",
+        )
+
+
+def run_suite(
+    config: Optional[SuiteConfig] = None, only: Optional[str] = None
+) -> list[BenchResult]:
+    """Run micro benchmarks then macro backtests of increasing universe size.
+
+    ``only`` filters benchmarks by name prefix (e.g. "micro" or "macro.backtest").
+    """
+    config = config or SuiteConfig()
+    cases: list[tuple[str, Callable[[Path], BenchResult]]] = [
+        (
+            "micro.load_parquet_series",
+            lambda tmp: bench_load_parquet_series(tmp, config.repeat, config.micro_rows),
+        ),
+        ("micro.simulate_fill", lambda tmp: bench_simulate_fill(config.repeat, config.micro_ops)),
+        ("micro.apply_fill", lambda tmp: bench_apply_fill(config.repeat, config.micro_ops)),
+        ("micro.snapshot", lambda tmp: bench_snapshot(config.repeat, config.micro_ops)),
+        ("micro.validate", lambda tmp: bench_validate(config.repeat, config.micro_ops)),
+        (
+            "micro.compute_from_equity",
+            lambda tmp: bench_compute_from_equity(config.repeat, config.micro_rows),
+        ),
+    ]
+
+    def macro(symbols: int) -> Callable[[Path], BenchResult]:
+        return lambda tmp: bench_backtest(tmp, symbols, config.interval, config.start, config.end)
+
+    for n in config.universes:
+        cases.append((f"macro.backtest.{config.interval}.{n}sym", macro(n)))
+    results: list[BenchResult] = []
+    with tempfile.TemporaryDirectory(prefix="trading-bench-") as tmp:
+        for name, case in cases:
+            if only is not None and not name.startswith(only):
+                continue
+            results.append(case(Path(tmp)))
+    return results
@@ -2,11 +2,13 @@ from typing import Optional
 import uuid
 from pathlib import Path
 import hashlib
+import json
 import typer
 
 app = typer.Typer(help="Trading CLI")
 fixtures_app = typer.Typer(help="Data fixtures utilities")
 ops_app = typer.Typer(help="Ops utilities")
+data_app = typer.Typer(help="Market data store utilities")
 
 
 def plan() -> None:
@@ -14,6 +16,46 @@ def plan() -> None:
     typer.echo("See PROJECT_PLAN.md and DETAILED_PHASE_PLAN.md")
 
 
+def _backtest_config(
+    settings, config_path: str, run_id: str, out_dir: Optional[str], heartbeat_every: int
+):
+    from trading.backtest.engine import BacktestConfig
+
+    interval = (
+        "1d"
+        if settings.timeframe.lower() in {"1d", "1day", "daily"}
+        else settings.timeframe.lower()
+    )
+    from trading.backtest.result_cache import strategy_code_version
+    from trading.strategy import resolve_strategy
+
+    strategy_version = (
+        f"{settings.strategy.name}:{json.dumps(settings.strategy.params, sort_keys=True)}"
+    )
+    # Third-party strategy code is not covered by the trading code version, so its own
+    # identity goes into the cache key and checkpoint fingerprint
+    try:
+        strategy_code = strategy_code_version(resolve_strategy(settings.strategy.name))
+    except (KeyError, TypeError):
+        strategy_code = None  # reported by the caller when it builds the strategy
+    if strategy_code is not None:
+        strategy_version = f"{strategy_version}@{strategy_code}"
+    return BacktestConfig(
+        symbols=settings.symbols,
+        interval=interval,
+        cache_dir=str(settings.data.cache_dir),
+        run_id=run_id,
+        out_dir=out_dir or "runs",
+        config_hash=hashlib.sha256(Path(config_path).read_bytes()).hexdigest()[:16],
+        slippage_bps=settings.execution.slippage_bps,
+        commission_fixed=settings.execution.commission_fixed,
+        per_symbol_notional_cap=settings.risk.per_symbol_notional_cap,
+        heartbeat_every=heartbeat_every,
+        strategy_version=strategy_version,
+        adjustment=settings.data.adjustment,
+    )
+
+
 def backtest(
     config: str = typer.Option(..., "--config", help="Path to YAML config"),
     run_id: Optional[str] = typer.Option(None, "--run-id", help="Explicit run id; default uuid4"),
@@ -30,42 +72,94 @@ def backtest(
     heartbeat_every: int = typer.Option(
         100, "--heartbeat-every", help="Emit heartbeat every N bars"
     ),
+    profile_stages: bool = typer.Option(
+        True,
+        "--profile-stages/--no-profile-stages",
+        help="Record per-stage hot-path timings in summary.json",
+    ),
+    result_cache_dir: Optional[str] = typer.Option(
+        None,
+        "--result-cache-dir",
+        help="Result cache directory (default '<out-dir>/.result_cache')",
+    ),
+    no_result_cache: bool = typer.Option(
+        False, "--no-result-cache", help="Always recompute instead of reusing cached results"
+    ),
+    checkpoint: bool = typer.Option(
+        False, "--checkpoint", help="Save engine state at the end of the run for --resume"
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue --run-id from its checkpoint, processing and appending only new bars",
+    ),
+    series_cache_dir: Optional[str] = typer.Option(
+        None,
+        "--series-cache-dir",
+        help="Memory-mapped validated series cache (default '<cache_dir>/.series_cache')",
+    ),
+    no_series_cache: bool = typer.Option(
+        False, "--no-series-cache", help="Always decode and validate Parquet sources"
+    ),
+    start: Optional[str] = typer.Option(
+        None, "--start", help="First bar end to include (UTC date/time, inclusive)"
+    ),
+    end: Optional[str] = typer.Option(
+        None, "--end", help="Bar ends before this are included (UTC date/time, exclusive)"
+    ),
+    adjust: Optional[str] = typer.Option(
+        None,
+        "--adjust",
+        help="Corporate-action adjustment: none, split or total_return (default: config)",
+    ),
+    offline_actions: bool = typer.Option(
+        False, "--offline-actions", help="Use stored corporate actions without refreshing"
+    ),
+    engine_mode: str = typer.Option(
+        "event",
+        "--engine",
+        help="event (bar by bar) or vectorized (array mode for SignalStrategy strategies)",
+    ),
 ) -> None:
     """Run a backtest using config (simple runner for Parquet cache)."""
     from trading.config import load_settings
-    from trading.backtest.engine import BacktestConfig, BacktestEngine
+    from trading.backtest.engine import BacktestEngine
     from trading.observability.logging import get_logger, configure_logging
 
     settings = load_settings(config)
     run = run_id or str(uuid.uuid4())
-    interval = (
-        "1d"
-        if settings.timeframe.lower() in {"1d", "1day", "daily"}
-        else settings.timeframe.lower()
-    )
-    cfg = BacktestConfig(
-        symbols=settings.symbols,
-        interval=interval,
-        cache_dir=str(settings.data.cache_dir),
-        run_id=run,
-        out_dir=out_dir or "runs",
-        config_hash=hashlib.sha256(Path(config).read_bytes()).hexdigest()[:16],
-        slippage_bps=settings.execution.slippage_bps,
-        commission_fixed=settings.execution.commission_fixed,
-        per_symbol_notional_cap=settings.risk.per_symbol_notional_cap,
-        heartbeat_every=heartbeat_every,
-    )
+    cfg = _backtest_config(settings, config, run, out_dir, heartbeat_every)
+    cfg.profile_stages = profile_stages
+    cfg.start, cfg.end = start, end
+    if adjust is not None:
+        cfg.adjustment = adjust
+    if offline_actions:
+        cfg.actions_ttl_days = None
+    if resume and run_id is None:
+        raise typer.BadParameter("--resume requires --run-id of a checkpointed run")
+    if engine_mode not in {"event", "vectorized"}:
+        raise typer.BadParameter(f"--engine must be event or vectorized, got {engine_mode!r}")
+    vectorized = engine_mode == "vectorized"
+    if vectorized and (checkpoint or resume):
+        raise typer.BadParameter("--checkpoint/--resume require --engine event")
+    # A resumed run keeps checkpointing so the next day's bars can be appended too
+    cfg.checkpoint = checkpoint or resume
+    if not no_result_cache:
+        cfg.result_cache_dir = result_cache_dir or str(Path(cfg.out_dir) / ".result_cache")
+    if not no_series_cache:
+        cfg.series_cache_dir = series_cache_dir or str(Path(cfg.cache_dir) / ".series_cache")
 
     # Auto-download missing caches into the configured cache_dir
     if not no_autodownload:
         try:
             from trading.data.fixtures import download_yf_bars
+            from trading.data.series_loader import series_exists
 
             cache_dir = Path(cfg.cache_dir)
             cache_dir.mkdir(parents=True, exist_ok=True)
             missing: list[str] = []
             for sym in cfg.symbols:
-                if not (cache_dir / f"{sym}_{cfg.interval}.parquet").exists():
+                if not series_exists(cache_dir, sym, cfg.interval):
                     missing.append(sym)
             if missing:
                 logger = get_logger("trading.backtest")
@@ -80,18 +174,26 @@ def backtest(
             logger = get_logger("trading.backtest")
             logger.warning("auto-download skipped", extra={"error": str(exc)})
 
-    from trading.core.contracts import Strategy as StrategyABC
+    from trading.core.contracts import SignalStrategy, Strategy as StrategyABC
 
-    def strategy_factory(symbol: str) -> StrategyABC:
-        # Use a no-op strategy placeholder; users will plug in real ones later
-        from trading.core.contracts import Strategy
-        from trading.core.models import Bar
+    from trading.strategy import create_strategy, get_signal_strategy, get_strategy
+
+    try:
+        if vectorized:
+            signal_cls = get_signal_strategy(settings.strategy.name)
+        else:
+            strategy_cls = get_strategy(settings.strategy.name)
+    except (KeyError, TypeError) as exc:
+        raise typer.BadParameter(str(exc.args[0])) from None
+    strategy_params = dict(settings.strategy.params)
 
-        class NoopStrategy(Strategy):
-            def on_bar(self, bar: Bar):
-                return None
+    def signal_factory(symbol: str) -> SignalStrategy:
+        return create_strategy(signal_cls, symbol, strategy_params)
 
-        return NoopStrategy()
+    def strategy_factory(symbol: str) -> StrategyABC:
+        # Registered strategies are module-level classes, so their state pickles into
+        # checkpoints
+        return create_strategy(strategy_cls, symbol, strategy_params)
 
     # Logger
     import logging as _logging
@@ -101,8 +203,13 @@ def backtest(
     logger = get_logger("trading.backtest").bind(run_id=run)
     logger.info("starting_backtest", symbols=cfg.symbols, interval=cfg.interval)
 
-    engine = BacktestEngine(strategy_factory=strategy_factory, config=cfg, logger=logger)
-    engine.run()
+    if vectorized:
+        from trading.backtest.vectorized import VectorizedBacktestEngine
+
+        VectorizedBacktestEngine(strategy_factory=signal_factory, config=cfg, logger=logger).run()
+    else:
+        engine = BacktestEngine(strategy_factory=strategy_factory, config=cfg, logger=logger)
+        engine.run(resume=resume)
     logger.info("backtest_finished", out_dir=str(cfg.out_dir))
     # Generate HTML report
     try:
@@ -114,6 +221,54 @@ def backtest(
         logger.warning("report_generation_failed", error=str(exc))
 
 
+def sweep(
+    config: str = typer.Option(..., "--config", help="Path to YAML config"),
+    sweep_id: Optional[str] = typer.Option(
+        None, "--sweep-id", help="Explicit sweep id; default uuid4"
+    ),
+    out_dir: Optional[str] = typer.Option(
+        None, "--out-dir", help="Output base directory for sweep artifacts (default 'runs')"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", help="Worker processes (default: CPU count; 1 runs in-process)"
+    ),
+    sort_by: str = typer.Option("sharpe", "--sort-by", help="Leaderboard sort metric"),
+    log_level: str = typer.Option(
+        "INFO", "--log-level", help="Logging level: DEBUG, INFO, WARNING, ERROR"
+    ),
+) -> None:
+    """Run a parameter sweep over the list-valued entries of strategy.params."""
+    from trading.config import load_settings
+    from trading.backtest.sweep import expand_param_grid, run_sweep
+    from trading.observability.logging import get_logger, configure_logging
+
+    import logging as _logging
+
+    settings = load_settings(config)
+    sid = sweep_id or str(uuid.uuid4())
+    base = _backtest_config(settings, config, sid, out_dir, heartbeat_every=1_000_000_000)
+    # Spawned workers map the validated series instead of re-decoding Parquet
+    base.series_cache_dir = str(Path(base.cache_dir) / ".series_cache")
+
+    level = getattr(_logging, str(log_level).upper(), _logging.INFO)
+    configure_logging(level=level)
+    logger = get_logger("trading.sweep").bind(sweep_id=sid)
+    logger.info(
+        "starting_sweep",
+        strategy=settings.strategy.name,
+        param_sets=len(expand_param_grid(settings.strategy.params)),
+    )
+    out = run_sweep(
+        base,
+        settings.strategy.name,
+        settings.strategy.params,
+        sweep_id=sid,
+        max_workers=workers,
+        sort_by=sort_by,
+    )
+    logger.info("sweep_finished", leaderboard=str(out))
+
+
 def live(
     config: str = typer.Option(..., "--config", help="Path to YAML config"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Do not actually place orders"),
@@ -167,10 +322,26 @@ def fixtures_download(
     start: str | None = typer.Option(None, "--start", help="Start date YYYY-MM-DD"),
     end: str | None = typer.Option(None, "--end", help="End date YYYY-MM-DD"),
     out_dir: str = typer.Option("data/cache/yf", "--out-dir", help="Output directory"),
+    workers: int = typer.Option(8, "--workers", help="Symbols downloaded concurrently"),
+    rate: float = typer.Option(2.0, "--rate", help="Max provider requests per second"),
+    retries: int = typer.Option(3, "--retries", help="Attempts per symbol before skipping"),
+    incremental: bool = typer.Option(
+        False, "--incremental", help="Fetch only bars after each cached series' last end"
+    ),
 ) -> None:
     from trading.data.fixtures import download_yf_bars
 
-    paths = download_yf_bars(symbols, interval=interval, start=start, end=end, out_dir=out_dir)
+    paths = download_yf_bars(
+        symbols,
+        interval=interval,
+        start=start,
+        end=end,
+        out_dir=out_dir,
+        max_workers=workers,
+        rate_per_sec=rate,
+        retries=retries,
+        incremental=incremental,
+    )
     if not paths:
         print("No data downloaded (check symbols/interval)")
     else:
@@ -178,10 +349,220 @@ def fixtures_download(
             print(f"Saved {p}")
 
 
+def fixtures_synth(
+    symbols: Optional[list[str]] = typer.Argument(
+        None, help="Symbols to generate; default --count names like SYN0000"
+    ),
+    count: int = typer.Option(10, "--count", help="Number of symbols when none are given"),
+    interval: str = typer.Option("1d", "--interval", help="Interval: 1d, 1h, 15m, 1m, ..."),
+    start: str = typer.Option("2020-01-01", "--start", help="Start date YYYY-MM-DD"),
+    end: str = typer.Option("2024-12-31", "--end", help="End date YYYY-MM-DD"),
+    out_dir: str = typer.Option("data/cache/synth", "--out-dir", help="Output directory"),
+    seed: int = typer.Option(0, "--seed", help="Random seed; same seed, same bars"),
+    drift: float = typer.Option(0.05, "--drift", help="Annualized drift"),
+    volatility: float = typer.Option(0.2, "--volatility", help="Annualized volatility"),
+    jump_intensity: float = typer.Option(0.0, "--jump-intensity", help="Jumps per year"),
+    jump_std: float = typer.Option(0.05, "--jump-std", help="Std of log jump size"),
+    regime_switch_prob: float = typer.Option(
+        0.0, "--regime-switch-prob", help="Per-bar probability of a volatility regime switch"
+    ),
+    gap_prob: float = typer.Option(
+        0.0, "--gap-prob", help="Per-session probability of an opening gap"
+    ),
+    missing_prob: float = typer.Option(0.0, "--missing-prob", help="Fraction of bars dropped"),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Writer threads"),
+) -> None:
+    """Write seeded synthetic bars as Parquet caches (offline fixtures at any scale)."""
+    from trading.data.synthetic import SynthParams, synthetic_symbols, write_synthetic_bars
+
+    params = SynthParams(
+        drift=drift,
+        volatility=volatility,
+        jump_intensity=jump_intensity,
+        jump_std=jump_std,
+        regime_switch_prob=regime_switch_prob,
+        gap_prob=gap_prob,
+        missing_prob=missing_prob,
+    )
+    names = symbols or synthetic_symbols(count)
+    paths = write_synthetic_bars(
+        names,
+        interval=interval,
+        start=start,
+        end=end,
+        out_dir=out_dir,
+        params=params,
+        seed=seed,
+        max_workers=workers,
+    )
+    print(f"Saved {len(paths)} synthetic series ({interval}) to {out_dir}")
+
+
+def bench(
+    quick: bool = typer.Option(False, "--quick", help="Small sizes for a fast smoke run"),
+    only: Optional[str] = typer.Option(
+        None, "--only", help="Run benchmarks whose name starts with this, e.g. 'micro'"
+    ),
+    history: Optional[str] = typer.Option(
+        None,
+        "--history",
+        help="JSON history file of past results (default 'bench/history.json')",
+    ),
+    baseline: Optional[str] = typer.Option(
+        None, "--baseline", help="Git SHA (prefix) to compare with; default latest other commit"
+    ),
+    threshold: float = typer.Option(
+        0.1, "--threshold", help="Flag throughput drops larger than this fraction"
+    ),
+    record: bool = typer.Option(True, "--record/--no-record", help="Append results to history"),
+    universes: Optional[str] = typer.Option(
+        None, "--universes", help="Comma-separated symbol counts for macro backtests, e.g. 1,100"
+    ),
+) -> None:
+    """Run the benchmark suite and flag regressions against a recorded baseline."""
+    from trading.bench.history import (
+        DEFAULT_HISTORY,
+        append_history,
+        compare,
+        find_baseline,
+        load_history,
+        make_entry,
+    )
+    from trading.bench.suite import SuiteConfig, run_suite
+    from trading.util.git import git_sha
+
+    history_path = history or DEFAULT_HISTORY
+    suite = SuiteConfig.quick() if quick else SuiteConfig()
+    if universes:
+        suite.universes = tuple(int(n) for n in universes.split(","))
+    results = run_suite(suite, only=only)
+    sha = git_sha()
+    base = find_baseline(load_history(history_path), sha, baseline)
+    previous = base.get("results", {}) if base else {}
+    for r in results:
+        line = f"{r.name:<36} {r.value:>14,.0f} {r.unit:<7} ({r.seconds:.3f}s)"
+        if r.name in previous and previous[r.name].get("value"):
+            line += f"  {r.value / float(previous[r.name]['value']) - 1.0:+.1%}"
+        typer.echo(line)
+    if record:
+        append_history(history_path, make_entry(results, sha))
+    if base is None:
+        typer.echo("No baseline in history for this machine; nothing to compare")
+        return
+    regressions = compare(base, results, threshold)
+    for reg in regressions:
+        typer.echo(
+            f"REGRESSION {reg.name}: {reg.current:,.0f} vs {reg.baseline:,.0f} {reg.unit} "
+            f"({reg.change:+.1%}) against {base.get('git_sha')}",
+            err=True,
+        )
+    if regressions:
+        raise typer.Exit(code=1)
+    typer.echo(f"No regressions beyond {threshold:.0%} against {base.get('git_sha')}")
+
+
+def data_partition(
+    cache_dir: str = typer.Option("data/cache", "--cache-dir", help="Flat Parquet cache dir"),
+    out_dir: Optional[str] = typer.Option(
+        None, "--out-dir", help="Partitioned store root (default: --cache-dir)"
+    ),
+    row_group_size: int = typer.Option(
+        65536, "--row-group-size", help="Rows per Parquet row group (pushdown granularity)"
+    ),
+) -> None:
+    """Convert {symbol}_{interval}.parquet caches into a symbol/interval/year store."""
+    from trading.data.partitioned import partition_flat_cache
+
+    paths = partition_flat_cache(cache_dir, out_dir, row_group_size=row_group_size)
+    print(f"Wrote {len(paths)} year partitions under {out_dir or cache_dir}")
+
+
+def data_resample(
+    symbols: str = typer.Option(..., "--symbols", help="Comma-separated symbols"),
+    interval: str = typer.Option(
+        "5m,15m,1h,1d", "--interval", help="Comma-separated target intervals"
+    ),
+    cache_dir: str = typer.Option("data/cache", "--cache-dir", help="Cache holding 1m bars"),
+    calendar: str = typer.Option("XNYS", "--calendar", help="Exchange calendar for sessions"),
+) -> None:
+    """Derive coarser bars from cached 1m bars; unchanged sources are not rebuilt."""
+    from trading.data.resample import ensure_resampled
+
+    for sym in [s.strip() for s in symbols.split(",") if s.strip()]:
+        for iv in [i.strip() for i in interval.split(",") if i.strip()]:
+            path = ensure_resampled(cache_dir, sym, iv, calendar=calendar)
+            print(f"{sym} {iv}: {path}")
+
+
+def data_actions(
+    symbols: str = typer.Option(..., "--symbols", help="Comma-separated symbols"),
+    cache_dir: str = typer.Option("data/cache", "--cache-dir", help="Cache holding the store"),
+    ttl_days: float = typer.Option(7.0, "--ttl-days", help="Refresh symbols older than N days"),
+    force: bool = typer.Option(False, "--force", help="Refresh every symbol regardless of age"),
+) -> None:
+    """Refresh the local corporate-action store (splits and dividends) for symbols."""
+    import pandas as pd
+
+    from trading.data.action_store import CorporateActionStore
+
+    store = CorporateActionStore.for_cache(cache_dir, ttl=pd.Timedelta(days=ttl_days))
+    wanted = [s.strip() for s in symbols.split(",") if s.strip()]
+    stale = wanted if force else store.stale(wanted)
+    done = store.refresh(stale)
+    events = store.actions()
+    events = events[events["symbol"].isin(wanted)]
+    print(
+        f"Refreshed {len(done)}/{len(stale)} stale symbols; "
+        f"{len(events)} events stored for {len(wanted)} symbols in {store.root}"
+    )
+
+
+def data_check(
+    cache_dir: str = typer.Option("data/cache", "--cache-dir", help="Cache directory to scan"),
+    out: Optional[str] = typer.Option(
+        None, "--out", help="JSON report path (default '<cache-dir>/quality_report.json')"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", help="Worker processes (default: CPU count)"
+    ),
+    calendar: str = typer.Option("XNYS", "--calendar", help="Exchange calendar for gaps"),
+    outlier_z: float = typer.Option(
+        10.0, "--outlier-z", help="Robust z-score of a return flagged as an outlier"
+    ),
+    zero_volume_run: int = typer.Option(
+        3, "--zero-volume-run", help="Consecutive zero-volume bars reported as a run"
+    ),
+    fail_on_error: bool = typer.Option(
+        True, "--fail-on-error/--no-fail-on-error", help="Exit 1 when any series has errors"
+    ),
+) -> None:
+    """Scan every cached series for gaps, duplicates, bad OHLC, zero volume and outliers."""
+    from trading.data.quality import QualityThresholds, scan_cache, write_report
+
+    thresholds = QualityThresholds(outlier_z=outlier_z, zero_volume_run=zero_volume_run)
+    reports = scan_cache(cache_dir, calendar=calendar, thresholds=thresholds, max_workers=workers)
+    path = write_report(reports, out or str(Path(cache_dir) / "quality_report.json"))
+    failing = [r for r in reports if not r.ok]
+    for r in reports:
+        status = "FAIL" if not r.ok else "ok"
+        print(
+            f"{status:4} {r.symbol}_{r.interval}: rows={r.rows} nan={r.nan_rows} "
+            f"dupes={r.duplicate_ends} ohlc={r.ohlc_violations} "
+            f"missing_bars={r.missing_bars} zero_vol_runs={r.zero_volume_runs} "
+            f"outliers={r.outliers}" + (f" error={r.read_error}" if r.read_error else "")
+        )
+    print(f"Checked {len(reports)} series, {len(failing)} failing; report: {path}")
+    if failing and fail_on_error:
+        raise typer.Exit(code=1)
+
+
 def prune(
     target: str = typer.Argument(..., help="'runs' or 'cache'"),
     keep_days: int = typer.Option(30, "--keep-days", help="Keep items newer than N days"),
     apply: bool = typer.Option(False, "--apply", help="Actually delete (default is dry-run)"),
+    series_cache_gb: float = typer.Option(
+        8.0, "--series-cache-gb", help="Size budget of the series cache under 'cache'"
+    ),
 ) -> None:
     from trading.core.retention import prune_directories
 
@@ -191,7 +572,22 @@ def prune(
     }.get(target)
     if base is None:
         raise typer.BadParameter("target must be 'runs' or 'cache'")
-    removed = prune_directories(base, keep_days=keep_days, apply=apply)
+    removed: list[Path] = []
+    if target == "runs":
+        from trading.backtest.result_cache import ResultCache
+
+        # Restores refresh an entry, so unused entries age out on their own clock
+        removed += ResultCache(Path(base) / ".result_cache").gc(keep_days, apply=apply)
+    if target == "cache":
+        from trading.data.series_cache import SeriesCache
+
+        # New entries keep the directory's mtime fresh, so it is collected by content
+        removed += SeriesCache(Path(base) / ".series_cache").gc(
+            int(series_cache_gb * 2**30), apply=apply
+        )
+    removed += prune_directories(
+        base, keep_days=keep_days, apply=apply, exclude=[".series_cache", ".result_cache"]
+    )
     action = "Removed" if apply else "Would remove"
     for path in removed:
         print(f"{action}: {path}")
@@ -199,10 +595,18 @@ def prune(
 
 app.add_typer(fixtures_app, name="fixtures")
 app.add_typer(ops_app, name="ops")
+app.add_typer(data_app, name="data")
 
 # Register commands to satisfy mypy without decorator complaints
 app.command()(plan)
 app.command()(backtest)
+app.command()(sweep)
 app.command()(live)
+app.command()(bench)
 fixtures_app.command("download")(fixtures_download)
+fixtures_app.command("synth")(fixtures_synth)
 ops_app.command("prune")(prune)
+data_app.command("partition")(data_partition)
+data_app.command("resample")(data_resample)
+data_app.command("actions")(data_actions)
+data_app.command("check")(data_check)
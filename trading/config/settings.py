@@ -5,8 +5,7 @@ from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import importlib
-
-yaml = importlib.import_module("yaml")
+import re
 
 
 class StrategyConfig(BaseModel):
@@ -17,10 +16,20 @@ class StrategyConfig(BaseModel):
 class DataConfig(BaseModel):
     source: str
     cache_dir: Path
+    # Corporate-action adjustment of cached bars: none, split or total_return
+    adjustment: str = "none"
     ib_host: Optional[str] = None
     ib_port: Optional[int] = None
     ib_client_id: Optional[int] = None
 
+    @field_validator("adjustment")
+    @classmethod
+    def _known_adjustment(cls, v: str) -> str:
+        norm = v.strip().lower()
+        if norm not in {"none", "split", "total_return"}:
+            raise ValueError("adjustment must be one of: none, split, total_return")
+        return norm
+
 
 class RiskConfig(BaseModel):
     max_gross_exposure: float
@@ -69,12 +78,14 @@ class AppSettings(BaseSettings):
         norm = v.strip().lower()
         aliases = {"1day": "1d", "daily": "1d", "60m": "1h"}
         norm = aliases.get(norm, norm)
-        if norm not in {"1d", "1h", "1m"}:
-            raise ValueError("timeframe must be one of: 1d, 1h, 1m")
+        # Intervals other than 1d/1h/1m are resampled from the 1m cache
+        if norm != "1d" and re.fullmatch(r"[1-9]\d*[mh]", norm) is None:
+            raise ValueError("timeframe must be 1d or N minutes/hours, e.g. 1m, 15m, 1h")
         return norm
 
 
 def load_settings(path: str | Path) -> AppSettings:
+    yaml = importlib.import_module("yaml")
     with open(path, "r", encoding="utf-8") as f:
         raw: Dict[str, Any] = yaml.safe_load(f)
     # Return type is AppSettings; some mypy envs misinfer Any for BaseSettings
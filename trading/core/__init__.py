@@ -1,5 +1,13 @@
 from .models import Bar, Order, Fill, Position, PortfolioSnapshot, Instrument
-from .contracts import DataAdapter, BrokerAdapter, Strategy, RiskManager, ExecutionEngine, Portfolio
+from .contracts import (
+    DataAdapter,
+    BrokerAdapter,
+    Strategy,
+    SignalStrategy,
+    RiskManager,
+    ExecutionEngine,
+    Portfolio,
+)
 
 __all__ = [
     "Instrument",
@@ -11,6 +19,7 @@ __all__ = [
     "DataAdapter",
     "BrokerAdapter",
     "Strategy",
+    "SignalStrategy",
     "RiskManager",
     "ExecutionEngine",
     "Portfolio",
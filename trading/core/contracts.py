@@ -1,15 +1,25 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
 
 from .models import Bar, Order
 
+if TYPE_CHECKING:  # pragma: no cover - typing only; keeps core free of heavy imports
+    import numpy as np
+    import pandas as pd
+
 
 class DataAdapter(ABC):
     @abstractmethod
     def latest_completed_bar(self, symbol: str, timeframe: str) -> Optional[Bar]:
         raise NotImplementedError
 
+    def latest_completed_bars(
+        self, symbols: Iterable[str], timeframe: str
+    ) -> Dict[str, Optional[Bar]]:
+        """Batch variant; adapters override it when they can serve symbols more cheaply."""
+        return {sym: self.latest_completed_bar(sym, timeframe) for sym in symbols}
+
 
 class BrokerAdapter(ABC):
     @abstractmethod
@@ -26,6 +36,24 @@ class Strategy(ABC):
     def on_bar(self, bar: Bar) -> Optional[Order]:
         raise NotImplementedError
 
+    def prepare(self, bars: pd.DataFrame) -> None:
+        """Optional hook: the backtest engine passes the symbol's whole series once
+        before the bar loop, so indicator columns can be precomputed (e.g. through
+        ``trading.indicators.cache``). Values used at a bar must depend only on bars up
+        to it. Called again after a resume; live trading never calls it."""
+
+
+class SignalStrategy(ABC):
+    """Strategy for the vectorized backtest mode.
+
+    Receives a symbol's whole bar series (as returned by ``load_parquet_series``) and
+    returns an array of target positions in shares, one per bar.
+    """
+
+    @abstractmethod
+    def target_positions(self, bars: pd.DataFrame) -> np.ndarray:
+        raise NotImplementedError
+
 
 class RiskManager(ABC):
     @abstractmethod
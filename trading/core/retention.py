@@ -1,16 +1,23 @@
 from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
 
 
-def prune_directories(base_dir: str | Path, keep_days: int, apply: bool = False) -> List[Path]:
+def prune_directories(
+    base_dir: str | Path, keep_days: int, apply: bool = False, exclude: Iterable[str] = ()
+) -> List[Path]:
+    """Children of ``base_dir`` not modified for ``keep_days``, except the ``exclude``
+    names (caches that garbage-collect themselves: their mtime says nothing about use)."""
     base = Path(base_dir)
     if not base.exists():
         return []
     cutoff = datetime.now(timezone.utc) - timedelta(days=keep_days)
+    skip = set(exclude)
     to_remove: List[Path] = []
     for child in sorted(base.iterdir()):
+        if child.name in skip:
+            continue
         try:
             mtime = datetime.fromtimestamp(child.stat().st_mtime, tz=timezone.utc)
         except FileNotFoundError:
@@ -0,0 +1,161 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+import logging
+import os
+import uuid
+
+import pandas as pd
+
+from trading.data.corporate_actions import ACTION_COLUMNS, fetch_yf_actions
+from trading.data.fixtures import TokenBucket
+
+
+# Store layout under {cache_dir}/corporate_actions/
+STORE_DIR = "corporate_actions"
+ACTIONS_FILE = "actions.parquet"
+REFRESHED_FILE = "refreshed.parquet"
+DEFAULT_TTL = pd.Timedelta(days=7)
+
+
+def _utcnow() -> pd.Timestamp:
+    return pd.Timestamp.now(tz="UTC")
+
+
+def _write_atomic(df: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+
+class CorporateActionStore:
+    """Splits and dividends for every symbol in one local Parquet table.
+
+    ``lookup`` answers for a whole symbol list from disk. Symbols never fetched, or last
+    fetched more than ``ttl`` ago, are refreshed through ``fetcher`` first (concurrently,
+    rate limited); with ``ttl=None`` the store is offline and never fetches. A failed
+    refresh keeps the previously stored events, so lookups work without a network.
+
+    ``refreshed.parquet`` records when each symbol was last fetched, including symbols
+    with no events. ``actions.parquet`` is rewritten only when events actually change,
+    so its content hash is a stable input for result caching.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        ttl: Optional[pd.Timedelta] = DEFAULT_TTL,
+        fetcher: Callable[[str], pd.DataFrame] = fetch_yf_actions,
+        max_workers: int = 8,
+        rate_per_sec: float = 2.0,
+        clock: Callable[[], pd.Timestamp] = _utcnow,
+        logger: Optional[Any] = None,
+    ) -> None:
+        self.root = Path(root)
+        self.ttl = ttl
+        self.fetcher = fetcher
+        self.max_workers = max_workers
+        self.rate_per_sec = rate_per_sec
+        self._clock = clock
+        self._log = logger or logging.getLogger("trading.data.action_store")
+
+    @classmethod
+    def for_cache(cls, cache_dir: str | Path, **kwargs: Any) -> "CorporateActionStore":
+        return cls(Path(cache_dir) / STORE_DIR, **kwargs)
+
+    @property
+    def actions_path(self) -> Path:
+        return self.root / ACTIONS_FILE
+
+    @property
+    def refreshed_path(self) -> Path:
+        return self.root / REFRESHED_FILE
+
+    def actions(self) -> pd.DataFrame:
+        """Every stored event in the ``ACTION_COLUMNS`` format."""
+        if not self.actions_path.exists():
+            empty = pd.DataFrame(columns=ACTION_COLUMNS)
+            empty["date"] = pd.to_datetime(empty["date"], utc=True)
+            return empty
+        df = pd.read_parquet(self.actions_path)
+        df["date"] = pd.to_datetime(df["date"], utc=True)
+        return df[ACTION_COLUMNS]
+
+    def refreshed(self) -> pd.Series:
+        """Last fetch time per symbol (UTC)."""
+        if not self.refreshed_path.exists():
+            return pd.Series(dtype="datetime64[ns, UTC]")
+        df = pd.read_parquet(self.refreshed_path)
+        return pd.Series(
+            pd.DatetimeIndex(pd.to_datetime(df["fetched_at"], utc=True)),
+            index=pd.Index(df["symbol"]),
+        )
+
+    def stale(self, symbols: Iterable[str]) -> list[str]:
+        """Symbols that ``lookup`` would fetch: never fetched or older than ``ttl``."""
+        if self.ttl is None:
+            return []
+        fetched = self.refreshed()
+        cutoff = self._clock() - self.ttl
+        return [
+            sym
+            for sym in dict.fromkeys(symbols)
+            if sym not in fetched.index or fetched[sym] <= cutoff
+        ]
+
+    def refresh(self, symbols: Iterable[str]) -> list[str]:
+        """Fetch events for ``symbols`` and store them; returns the symbols that succeeded."""
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return []
+        bucket = TokenBucket(self.rate_per_sec)
+
+        def fetch_one(symbol: str) -> Optional[pd.DataFrame]:
+            bucket.acquire()
+            try:
+                return self.fetcher(symbol)
+            except Exception as exc:
+                self._log.warning(
+                    "corporate action fetch failed", extra={"symbol": symbol, "error": str(exc)}
+                )
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+            results = dict(zip(symbols, pool.map(fetch_one, symbols)))
+        done = [sym for sym, df in results.items() if df is not None]
+        if not done:
+            return []
+
+        current = self.actions()
+        kept = current[~current["symbol"].isin(done)]
+        fresh = [df[ACTION_COLUMNS] for df in results.values() if df is not None and not df.empty]
+        parts = [df for df in (kept, *fresh) if not df.empty]
+        merged = pd.concat(parts, ignore_index=True) if parts else current.iloc[0:0].copy()
+        merged["date"] = pd.to_datetime(merged["date"], utc=True)
+        merged = merged.sort_values(["symbol", "date", "kind"], kind="stable").reset_index(
+            drop=True
+        )
+        if not merged.equals(current.reset_index(drop=True)):
+            _write_atomic(merged, self.actions_path)
+
+        fetched = self.refreshed()
+        now = self._clock()
+        for sym in done:
+            fetched[sym] = now
+        _write_atomic(
+            pd.DataFrame({"symbol": list(fetched.index), "fetched_at": list(fetched)}),
+            self.refreshed_path,
+        )
+        return done
+
+    def lookup(self, symbols: Iterable[str]) -> pd.DataFrame:
+        """Events for ``symbols``, refreshing stale ones first unless offline."""
+        symbols = list(dict.fromkeys(symbols))
+        stale = self.stale(symbols)
+        if stale:
+            self.refresh(stale)
+        df = self.actions()
+        return df[df["symbol"].isin(symbols)].reset_index(drop=True)
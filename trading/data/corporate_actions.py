@@ -1,16 +1,34 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Sequence
+from pathlib import Path
+from typing import Any, Iterable, List, Sequence
+import hashlib
+import json
 
+import numpy as np
 import pandas as pd
 
+from trading.data.derived import is_current, source_stamp, write_derived
+from trading.data.hashing import file_sha256
+from trading.data.partitioned import DEFAULT_ROW_GROUP_SIZE
+
 try:
     import yfinance as yf  # optional; used only if available
 except Exception:  # pragma: no cover
     yf = None
 
 
+# "split" back-adjusts for splits only; "total_return" also reinvests dividends
+ADJUSTMENT_MODES = ("none", "split", "total_return")
+# Long format shared by every symbol: kind is "split" (value=ratio) or "dividend" (value=cash)
+ACTION_COLUMNS = ["symbol", "date", "kind", "value"]
+# Adjusted series live under {base_dir}/adjusted/{mode}/{symbol}_{interval}.parquet
+ADJUSTED_DIR = "adjusted"
+# Bump when the adjustment rules change so stale adjusted files are rebuilt
+_FORMAT_VERSION = 1
+
+
 @dataclass(frozen=True)
 class SplitEvent:
     """Represents a stock split event.
@@ -22,6 +40,27 @@ class SplitEvent:
     ratio: float
 
 
+@dataclass(frozen=True)
+class DividendEvent:
+    """Cash dividend of ``amount`` per share going ex on ``date``."""
+
+    date: datetime
+    amount: float
+
+
+def actions_frame(
+    symbol: str,
+    splits: Iterable[SplitEvent] = (),
+    dividends: Iterable[DividendEvent] = (),
+) -> pd.DataFrame:
+    """Events of one symbol in the long ``ACTION_COLUMNS`` format."""
+    rows = [(symbol, e.date, "split", float(e.ratio)) for e in splits]
+    rows += [(symbol, e.date, "dividend", float(e.amount)) for e in dividends]
+    df = pd.DataFrame(rows, columns=ACTION_COLUMNS)
+    df["date"] = pd.to_datetime(df["date"], utc=True)
+    return df.sort_values(["symbol", "date"], kind="stable").reset_index(drop=True)
+
+
 def fetch_yf_splits(symbol: str) -> List[SplitEvent]:
     """Fetch split events via yfinance for a symbol.
 
@@ -42,6 +81,133 @@ def fetch_yf_splits(symbol: str) -> List[SplitEvent]:
     return events
 
 
+def fetch_yf_dividends(symbol: str) -> List[DividendEvent]:
+    """Fetch cash dividends (ex-date, split-adjusted amount) via yfinance for a symbol."""
+    if yf is None:
+        return []
+    s = yf.Ticker(symbol).dividends
+    if s is None or len(s) == 0:
+        return []
+    events = [
+        DividendEvent(date=pd.to_datetime(ts, utc=True).to_pydatetime(), amount=float(amount))
+        for ts, amount in s.items()
+    ]
+    events.sort(key=lambda e: e.date)
+    return events
+
+
+def fetch_yf_actions(symbol: str) -> pd.DataFrame:
+    """Splits and dividends for a symbol via yfinance in the ``ACTION_COLUMNS`` format."""
+    return actions_frame(symbol, fetch_yf_splits(symbol), fetch_yf_dividends(symbol))
+
+
+def _group_keys(bars: pd.DataFrame, actions: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, int]:
+    """Sortable int64 keys ordering bars and events by (symbol, time), plus group width.
+
+    ``key // width`` is the symbol's group. Bars without a ``symbol`` column form a
+    single group that every event applies to. Events for symbols absent from ``bars``
+    get key -1.
+    """
+    bar_ns = (
+        pd.DatetimeIndex(pd.to_datetime(bars["end"], utc=True))
+        .to_numpy("datetime64[ns]")
+        .view("int64")
+    )
+    act_ns = (
+        pd.DatetimeIndex(pd.to_datetime(actions["date"], utc=True))
+        .to_numpy("datetime64[ns]")
+        .view("int64")
+    )
+    if "symbol" in bars.columns:
+        symbols = pd.Index(pd.unique(bars["symbol"]))
+        bar_code = symbols.get_indexer(bars["symbol"]).astype(np.int64)
+        act_code = symbols.get_indexer(actions["symbol"]).astype(np.int64)
+    else:
+        bar_code = np.zeros(len(bars), dtype=np.int64)
+        act_code = np.zeros(len(actions), dtype=np.int64)
+    # Dense time ranks keep code * width + rank within int64 for any universe size
+    times = np.unique(np.concatenate([bar_ns, act_ns]))
+    width = len(times) + 1
+    bar_key = bar_code * width + np.searchsorted(times, bar_ns)
+    act_key = np.where(act_code >= 0, act_code * width + np.searchsorted(times, act_ns), -1)
+    return bar_key, act_key, width
+
+
+def _suffix_products(
+    bar_key: np.ndarray, event_key: np.ndarray, group_width: int, factors: np.ndarray
+) -> np.ndarray:
+    """Per bar, the product of ``factors`` of its group's events strictly after the bar.
+
+    ``event_key`` must be sorted ascending. One searchsorted locates each bar's first
+    later event; a reversed per-group cumulative product gives the rest.
+    """
+    if len(event_key) == 0:
+        return np.ones(len(bar_key))
+    event_group = event_key // group_width
+    suffix = pd.Series(factors[::-1]).groupby(event_group[::-1]).cumprod().to_numpy()[::-1]
+    nxt = np.searchsorted(event_key, bar_key, side="right")
+    clipped = np.minimum(nxt, len(event_key) - 1)
+    hit = (nxt < len(event_key)) & (event_group[clipped] == bar_key // group_width)
+    return np.where(hit, suffix[clipped], 1.0)
+
+
+def adjust_bars(bars: pd.DataFrame, actions: pd.DataFrame, mode: str = "split") -> pd.DataFrame:
+    """Back-adjust bars of one or many symbols for corporate actions in a single pass.
+
+    - ``split``: prices before a split are divided by the product of the later split
+      ratios; volumes are multiplied by it
+    - ``total_return``: additionally, prices before each dividend's ex-date are scaled
+      by ``1 - amount / close`` using the split-adjusted close of the last bar before
+      the ex-date, so returns include reinvested dividends
+
+    ``bars`` needs end, open, high, low, close, volume (and symbol when it holds several
+    symbols); ``actions`` uses ``ACTION_COLUMNS``. Returns bars sorted by (symbol, end).
+    """
+    if mode not in ADJUSTMENT_MODES:
+        raise ValueError(f"Unknown adjustment mode '{mode}'; expected one of {ADJUSTMENT_MODES}")
+    if "end" not in bars.columns:
+        raise ValueError("bars must include an 'end' column")
+    df = bars.copy()
+    df["end"] = pd.to_datetime(df["end"], utc=True)
+    if df.empty or actions.empty or mode == "none":
+        by = ["symbol", "end"] if "symbol" in df.columns else ["end"]
+        return df.sort_values(by, kind="stable").reset_index(drop=True)
+
+    bar_key, act_key, width = _group_keys(df, actions)
+    order = np.argsort(bar_key, kind="stable")
+    df = df.iloc[order].reset_index(drop=True)
+    bar_key = bar_key[order]
+
+    kinds = actions["kind"].to_numpy()
+    values = actions["value"].to_numpy(dtype=np.float64)
+    is_split = (kinds == "split") & (act_key >= 0)
+    split_order = np.argsort(act_key[is_split], kind="stable")
+    ratios = values[is_split][split_order]
+    if (ratios <= 0).any():
+        raise ValueError("split ratios must be positive")
+    split_factor = _suffix_products(bar_key, act_key[is_split][split_order], width, ratios)
+
+    dividend_factor = np.ones(len(df))
+    if mode == "total_return":
+        is_div = (kinds == "dividend") & (act_key >= 0)
+        div_order = np.argsort(act_key[is_div], kind="stable")
+        div_key = act_key[is_div][div_order]
+        amounts = values[is_div][div_order]
+        close = df["close"].to_numpy(dtype=np.float64) / split_factor
+        prev = np.searchsorted(bar_key, div_key, side="left") - 1
+        valid = (prev >= 0) & (bar_key[np.maximum(prev, 0)] // width == div_key // width)
+        ratio = np.ones(len(div_key))
+        ratio[valid] = 1.0 - amounts[valid] / close[prev[valid]]
+        if (ratio <= 0).any():
+            raise ValueError("dividend amount exceeds the prior close")
+        dividend_factor = _suffix_products(bar_key, div_key, width, ratio)
+
+    for col in ["open", "high", "low", "close"]:
+        df[col] = df[col].to_numpy(dtype=np.float64) / split_factor * dividend_factor
+    df["volume"] = np.round(df["volume"].to_numpy(dtype=np.float64) * split_factor).astype(np.int64)
+    return df
+
+
 def apply_split_adjustments(bars: pd.DataFrame, splits: Sequence[SplitEvent]) -> pd.DataFrame:
     """Back-adjust prices and volumes for given split events.
 
@@ -51,27 +217,56 @@ def apply_split_adjustments(bars: pd.DataFrame, splits: Sequence[SplitEvent]) ->
     bars must include: end (datetime), open, high, low, close, volume
     Returns a new DataFrame with the same columns adjusted.
     """
-    if bars.empty or not splits:
-        return bars.copy()
+    # Events apply to a single series, so tag them with the bars' own symbol
+    symbol = str(bars["symbol"].iloc[0]) if "symbol" in bars.columns and len(bars) else ""
+    return adjust_bars(bars, actions_frame(symbol, splits), mode="split")
 
-    df = bars.copy()
-    if "end" not in df.columns:
-        raise ValueError("bars must include an 'end' column")
 
-    df["end"] = pd.to_datetime(df["end"], utc=True)
-    df = df.sort_values("end").reset_index(drop=True)
+def adjusted_path(base_dir: str | Path, symbol: str, interval: str, mode: str) -> Path:
+    return Path(base_dir) / ADJUSTED_DIR / mode / f"{symbol}_{interval}.parquet"
 
-    # Build cumulative factors for each bar
-    factors = pd.Series(1.0, index=df.index)
-    cumulative = 1.0
-    for event in sorted(splits, key=lambda e: e.date):
-        cumulative *= float(event.ratio)
-        mask = df["end"] < pd.to_datetime(event.date, utc=True)
-        factors.loc[mask] = cumulative
 
-    # Adjust prices and volume
-    for col in ["open", "high", "low", "close"]:
-        df[col] = df[col] / factors
-    df["volume"] = (df["volume"] * factors).round().astype(int)
+def _event_rows(symbol: str, actions: pd.DataFrame) -> list[list[Any]]:
+    events = actions.loc[actions["symbol"] == symbol, ACTION_COLUMNS].sort_values(
+        ["date", "kind"], kind="stable"
+    )
+    return [[str(d), k, float(v)] for _, d, k, v in events.itertuples(index=False)]
 
-    return df
+
+def _fingerprint(files: Sequence[Path], rows: list[list[Any]]) -> str:
+    digests = [file_sha256(f) for f in files]
+    blob = json.dumps([digests, rows, _FORMAT_VERSION])
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def ensure_adjusted(
+    base_dir: str | Path,
+    symbol: str,
+    interval: str,
+    actions: pd.DataFrame,
+    mode: str = "split",
+    *,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> Path:
+    """Path of the adjusted copy of a cached series, built next to the raw cache.
+
+    The file records a fingerprint of the raw source files and the symbol's events and
+    is reused while both are unchanged, so backtests read adjusted bars directly
+    instead of re-adjusting at load time. Raw files are only hashed after their
+    (size, mtime) stamp changes.
+    """
+    from trading.data.series_loader import load_parquet_series, source_files
+
+    if mode not in ADJUSTMENT_MODES or mode == "none":
+        raise ValueError(f"Adjusted series need a mode in {ADJUSTMENT_MODES[1:]}, got '{mode}'")
+    files = source_files(base_dir, symbol, interval)
+    rows = _event_rows(symbol, actions)
+    stamp = source_stamp(files, rows, _FORMAT_VERSION)
+    path = adjusted_path(base_dir, symbol, interval, mode)
+    if path.exists() and is_current(path, stamp, lambda: _fingerprint(files, rows)):
+        return path
+    raw = load_parquet_series(base_dir, symbol, interval)
+    df = adjust_bars(raw, actions[actions["symbol"] == symbol], mode)
+    return write_derived(
+        df, path, _fingerprint(files, rows), stamp=stamp, row_group_size=row_group_size
+    )
@@ -0,0 +1,94 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence
+import json
+import os
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from trading.data.partitioned import DEFAULT_ROW_GROUP_SIZE
+from trading.data.synthetic import SERIES_SCHEMA
+
+
+# Parquet footer key holding the fingerprint of the inputs a derived series was built from
+_SOURCE_KEY = b"trading.derived.source"
+# Footer key holding the (path, size, mtime) stamp of those inputs, checked before hashing
+_STAMP_KEY = b"trading.derived.stamp"
+
+
+def source_stamp(files: Sequence[Path], *extra: Any) -> str:
+    """Cheap identity of source files from a stat each (path, size, mtime), plus ``extra``."""
+    stats = []
+    for f in files:
+        st = f.stat()
+        stats.append([str(f.resolve()), st.st_size, st.st_mtime_ns])
+    return json.dumps([stats, *extra], default=str)
+
+
+def _footer(path: Path) -> dict[bytes, bytes]:
+    try:
+        return pq.read_schema(path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return {}
+
+
+def stored_fingerprint(path: Path) -> Optional[str]:
+    """Fingerprint recorded in a derived series file, None if missing or unreadable."""
+    value = _footer(path).get(_SOURCE_KEY)
+    return value.decode("utf-8") if value is not None else None
+
+
+def is_current(path: Path, stamp: str, fingerprint: Callable[[], str]) -> bool:
+    """Whether the derived file at ``path`` was built from the current inputs.
+
+    The stored stamp is compared first, so unchanged sources cost a stat per file. Only
+    when it differs are the sources content-hashed through ``fingerprint``; if the
+    content still matches (sources touched or copied) the file is re-stamped so the
+    next check is cheap again.
+    """
+    footer = _footer(path)
+    stored = footer.get(_SOURCE_KEY)
+    if stored is None:
+        return False
+    if footer.get(_STAMP_KEY) == stamp.encode("utf-8"):
+        return True
+    if stored.decode("utf-8") != fingerprint():
+        return False
+    _replace_table(path, pq.read_table(path), {_STAMP_KEY: stamp.encode("utf-8")})
+    return True
+
+
+def write_derived(
+    df: pd.DataFrame,
+    path: Path,
+    fingerprint: str,
+    *,
+    stamp: Optional[str] = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> Path:
+    """Write a bar series with its input fingerprint (and stamp) in the footer, replacing
+    atomically."""
+    table = pa.Table.from_pandas(df, schema=SERIES_SCHEMA, preserve_index=False)
+    meta = {_SOURCE_KEY: fingerprint.encode("utf-8")}
+    if stamp is not None:
+        meta[_STAMP_KEY] = stamp.encode("utf-8")
+    return _replace_table(path, table, meta, row_group_size=row_group_size)
+
+
+def _replace_table(
+    path: Path,
+    table: pa.Table,
+    meta: dict[bytes, bytes],
+    *,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> Path:
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **meta})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per writer: parallel sweep workers may derive the same series at once
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    pq.write_table(table, tmp, row_group_size=row_group_size)
+    os.replace(tmp, path)
+    return path
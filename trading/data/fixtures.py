@@ -1,27 +1,43 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable, Optional, Protocol
+import logging
+import os
+import threading
+import time
 
 import pandas as pd
-import yfinance as yf
+import pyarrow.parquet as pq
+from tenacity import Retrying, stop_after_attempt, wait_random_exponential
 
+from trading.data.partitioned import has_partitions, write_partitioned
+from trading.data.series_loader import stored_files
 
-def download_yf_bars(
-    symbols: Iterable[str],
-    interval: str = "1d",
-    start: str | None = None,
-    end: str | None = None,
-    out_dir: str | Path = "data/cache/yf",
-) -> list[Path]:
-    out = Path(out_dir)
-    out.mkdir(parents=True, exist_ok=True)
-    saved: list[Path] = []
 
-    for symbol in symbols:
+_COLUMNS = ["symbol", "end", "open", "high", "low", "close", "volume"]
+
+
+class BarProvider(Protocol):
+    """Source of historical bars; the seam between the downloader and the network."""
+
+    def fetch(
+        self, symbol: str, interval: str, start: Optional[str], end: Optional[str]
+    ) -> pd.DataFrame:
+        """Bars in the cache schema (symbol, end UTC, open, high, low, close, volume)."""
+        ...
+
+
+class YFinanceProvider:
+    def fetch(
+        self, symbol: str, interval: str, start: Optional[str], end: Optional[str]
+    ) -> pd.DataFrame:
+        import yfinance as yf
+
         ticker = yf.Ticker(symbol)
         df = ticker.history(interval=interval, start=start, end=end, auto_adjust=False)
         if df.empty:
-            continue
+            return pd.DataFrame(columns=_COLUMNS)
         df = df.rename(
             columns={
                 "Open": "open",
@@ -43,11 +59,153 @@ def download_yf_bars(
                 if df["end"].dt.tz is not None
                 else df["end"].dt.tz_localize("UTC")
             )
+        return df[_COLUMNS]
 
-        out_path = out / f"{symbol}_{interval}.parquet"
-        df[["symbol", "end", "open", "high", "low", "close", "volume"]].to_parquet(
-            out_path, index=False
-        )
-        saved.append(out_path)
 
-    return saved
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` requests per second with bursts up to ``capacity``."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            # Sleep outside the lock so other threads can refill-check concurrently
+            self._sleep(wait)
+
+
+def last_cached_end(out_dir: str | Path, symbol: str, interval: str) -> Optional[pd.Timestamp]:
+    """Greatest ``end`` already cached for the series, reading only the ``end`` column."""
+    files = stored_files(out_dir, symbol, interval)
+    if not files or not files[-1].exists():
+        return None
+    path = files[-1]
+    ends = pq.ParquetFile(path).read(columns=["end"]).column("end").to_pandas()
+    if ends.empty:
+        return None
+    last = pd.to_datetime(ends, utc=True).max()
+    return None if pd.isna(last) else pd.Timestamp(last)
+
+
+def merge_bars(*frames: pd.DataFrame) -> pd.DataFrame:
+    """Sorted union of bar frames; on the same ``end`` the later frame's bar wins."""
+    non_empty = [df[_COLUMNS] for df in frames if not df.empty]
+    merged = pd.concat(non_empty, ignore_index=True) if non_empty else frames[-1][_COLUMNS]
+    merged["end"] = pd.to_datetime(merged["end"], utc=True)
+    merged = merged.drop_duplicates("end", keep="last").sort_values("end")
+    return merged.reset_index(drop=True)
+
+
+def _write_flat(path: Path, df: pd.DataFrame) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+
+def download_bars(
+    symbols: Iterable[str],
+    interval: str = "1d",
+    start: str | None = None,
+    end: str | None = None,
+    out_dir: str | Path = "data/cache/yf",
+    *,
+    provider: Optional[BarProvider] = None,
+    max_workers: int = 8,
+    rate_per_sec: float = 2.0,
+    burst: Optional[float] = None,
+    retries: int = 3,
+    retry_max_wait: float = 30.0,
+    incremental: bool = False,
+    logger: Optional[Any] = None,
+) -> list[Path]:
+    """Fetch bars for many symbols concurrently and write them to the Parquet cache.
+
+    Up to ``max_workers`` symbols are in flight; every provider call (retries included)
+    first takes a token from a bucket shared by all threads, so the provider sees at most
+    ``rate_per_sec`` requests per second on average. Failed calls are retried with
+    jittered exponential backoff; symbols that still fail are logged and skipped.
+
+    With ``incremental=True`` only bars from the cached series' last ``end`` onward are
+    fetched and merged into the existing data (the last cached bar is re-fetched so a
+    bar that was still forming gets replaced). The partitioned store is updated in place
+    when the series lives there; otherwise ``{symbol}_{interval}.parquet`` is rewritten.
+    """
+    provider = provider or YFinanceProvider()
+    log = logger or logging.getLogger("trading.data.fixtures")
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    bucket = TokenBucket(rate_per_sec, burst)
+
+    def fetch(symbol: str, fetch_start: Optional[str]) -> pd.DataFrame:
+        for attempt in Retrying(
+            stop=stop_after_attempt(max(1, retries)),
+            wait=wait_random_exponential(multiplier=min(1.0, retry_max_wait), max=retry_max_wait),
+            reraise=True,
+        ):
+            with attempt:
+                bucket.acquire()
+                return provider.fetch(symbol, interval, fetch_start, end)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def download_one(symbol: str) -> Optional[Path]:
+        last = last_cached_end(out, symbol, interval) if incremental else None
+        fetch_start = last.strftime("%Y-%m-%d") if last is not None else start
+        try:
+            df = fetch(symbol, fetch_start)
+        except Exception as exc:
+            log.warning("download failed", extra={"symbol": symbol, "error": str(exc)})
+            return None
+        if df.empty:
+            return None
+        df = merge_bars(df)
+        if last is not None:
+            df = df[df["end"] >= last]
+        if has_partitions(out, symbol, interval):
+            written = write_partitioned(df, out, symbol, interval)
+            return written[-1] if written else None
+        path = out / f"{symbol}_{interval}.parquet"
+        if last is not None:
+            df = merge_bars(pd.read_parquet(path), df)
+        _write_flat(path, df)
+        return path
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        results = list(pool.map(download_one, list(symbols)))
+    return [p for p in results if p is not None]
+
+
+def download_yf_bars(
+    symbols: Iterable[str],
+    interval: str = "1d",
+    start: str | None = None,
+    end: str | None = None,
+    out_dir: str | Path = "data/cache/yf",
+    **kwargs: Any,
+) -> list[Path]:
+    """Download Yahoo Finance bars; see ``download_bars`` for concurrency options."""
+    return download_bars(
+        symbols, interval, start, end, out_dir, provider=YFinanceProvider(), **kwargs
+    )
@@ -0,0 +1,28 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Tuple
+import hashlib
+
+
+_DIGEST_CACHE: Dict[Tuple[str, int, int], str] = {}
+
+
+def file_sha256(path: str | Path, chunk_size: int = 1 << 20) -> str:
+    """Content hash of a file, memoized in-process by (path, size, mtime).
+
+    Re-hashing a multi-GB minute cache on every call would defeat the caches built on
+    top of this, so unchanged files (same size and mtime) are hashed once per process.
+    """
+    p = Path(path)
+    st = p.stat()
+    key = (str(p.resolve()), st.st_size, st.st_mtime_ns)
+    cached = _DIGEST_CACHE.get(key)
+    if cached is not None:
+        return cached
+    h = hashlib.sha256()
+    with open(p, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            h.update(block)
+    digest = h.hexdigest()
+    _DIGEST_CACHE[key] = digest
+    return digest
@@ -0,0 +1,157 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from trading.data.series_loader import load_parquet_series
+
+
+PANEL_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def end_ns(df: pd.DataFrame) -> np.ndarray:
+    """The ``end`` column as int64 epoch nanoseconds (UTC), whatever its dtype."""
+    end = df["end"]
+    if pd.api.types.is_integer_dtype(end.dtype):
+        return np.asarray(end.to_numpy(dtype=np.int64), dtype=np.int64)
+    if not pd.api.types.is_datetime64_any_dtype(end.dtype):
+        end = pd.to_datetime(end, utc=True)
+    # Converting to datetime64[ns] yields UTC for tz-aware values and normalizes the
+    # unit; to_datetime on them would iterate element-wise
+    ns: np.ndarray = pd.DatetimeIndex(end).to_numpy("datetime64[ns]").view("int64")
+    return ns
+
+
+def union_timeline(ends: Iterable[np.ndarray]) -> np.ndarray:
+    """Sorted unique union of epoch-ns timestamp arrays."""
+    arrays = [np.asarray(e, dtype=np.int64) for e in ends]
+    if not arrays:
+        return np.empty(0, dtype=np.int64)
+    return np.unique(np.concatenate(arrays))
+
+
+@dataclass
+class Panel:
+    """Bars of many symbols aligned on one timeline as (time x symbol) arrays.
+
+    ``fields`` maps each loaded column to a 2-D array whose column ``j`` belongs to
+    ``symbols[j]``. ``valid[t, j]`` is False where the symbol has no bar at ``end[t]``;
+    prices there are NaN and volume is 0.
+    """
+
+    symbols: list[str]
+    end: np.ndarray
+    fields: Dict[str, np.ndarray]
+    valid: np.ndarray
+    missing: list[str] = field(default_factory=list)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.fields[name]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.end), len(self.symbols)
+
+    def column(self, symbol: str) -> int:
+        return self.symbols.index(symbol)
+
+    @classmethod
+    def from_series(
+        cls,
+        series: Mapping[str, pd.DataFrame],
+        *,
+        fields: Sequence[str] = PANEL_FIELDS,
+        price_dtype: Any = np.float64,
+    ) -> "Panel":
+        """Align per-symbol frames sorted by unique ``end`` (as the loader returns them)."""
+        symbols = list(series)
+        ends = [end_ns(series[sym]) for sym in symbols]
+        timeline = union_timeline(ends)
+        shape = (len(timeline), len(symbols))
+        valid = np.zeros(shape, dtype=bool)
+        arrays: Dict[str, np.ndarray] = {}
+        for name in fields:
+            if name == "volume":
+                arrays[name] = np.zeros(shape, dtype=np.int64)
+            else:
+                arrays[name] = np.full(shape, np.nan, dtype=price_dtype)
+        for j, sym in enumerate(symbols):
+            # Every series timestamp is in the union, so searchsorted gives its exact row
+            rows = np.searchsorted(timeline, ends[j])
+            valid[rows, j] = True
+            df = series[sym]
+            for name, arr in arrays.items():
+                arr[rows, j] = df[name].to_numpy(dtype=arr.dtype)
+        return cls(symbols=symbols, end=timeline, fields=arrays, valid=valid)
+
+
+def load_many(
+    symbols: Iterable[str],
+    load: Callable[[str], pd.DataFrame],
+    *,
+    max_workers: int = 8,
+) -> tuple[Dict[str, pd.DataFrame], list[str]]:
+    """Call ``load(symbol)`` concurrently; returns frames in symbol order and the
+    symbols whose load raised FileNotFoundError.
+
+    Parquet decoding in pyarrow releases the GIL, so threads overlap the I/O and
+    decompression of different files.
+    """
+    symbols = list(dict.fromkeys(symbols))
+
+    def attempt(sym: str) -> Optional[pd.DataFrame]:
+        try:
+            return load(sym)
+        except FileNotFoundError:
+            return None
+
+    if max_workers <= 1 or len(symbols) <= 1:
+        results = [attempt(sym) for sym in symbols]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(attempt, symbols))
+    frames = {sym: df for sym, df in zip(symbols, results) if df is not None}
+    missing = [sym for sym, df in zip(symbols, results) if df is None]
+    return frames, missing
+
+
+def load_panel(
+    base_dir: str | Path,
+    symbols: Iterable[str],
+    interval: str,
+    start: Any = None,
+    end: Any = None,
+    *,
+    fields: Sequence[str] = PANEL_FIELDS,
+    price_dtype: Any = np.float64,
+    series_cache_dir: Optional[str | Path] = None,
+    max_workers: int = 16,
+) -> Panel:
+    """Load many symbols concurrently and align them into a ``Panel``.
+
+    Only ``end`` and ``fields`` are read from Parquet. Symbols without a cache are
+    skipped and listed in ``Panel.missing``.
+    """
+    unknown = [f for f in fields if f not in PANEL_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown panel fields {unknown}; expected a subset of {PANEL_FIELDS}")
+    loader: Callable[..., pd.DataFrame] = load_parquet_series
+    if series_cache_dir is not None:
+        from trading.data.series_cache import SeriesCache
+
+        loader = SeriesCache(series_cache_dir).load
+
+    # Compact frames hold float32 prices, which only a float32 panel can use losslessly
+    compact = np.dtype(price_dtype) == np.float32
+
+    def load(sym: str) -> pd.DataFrame:
+        return loader(base_dir, sym, interval, start, end, columns=list(fields), compact=compact)
+
+    frames, missing = load_many(symbols, load, max_workers=max_workers)
+    panel = Panel.from_series(frames, fields=fields, price_dtype=price_dtype)
+    panel.missing = missing
+    return panel
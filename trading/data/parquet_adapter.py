@@ -1,11 +1,17 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 from trading.core.contracts import DataAdapter
 from trading.core.models import Bar
+from trading.data.partitioned import to_utc
+from trading.data.series_loader import stored_files
 
 
 _TIMEFRAME_MAP = {
@@ -16,41 +22,110 @@ _TIMEFRAME_MAP = {
     "60m": "1h",
 }
 
+# (path, mtime_ns, size): a rewritten or appended file always changes at least one
+_FileKey = Tuple[str, int, int]
+
 
 class ParquetLatestBarAdapter(DataAdapter):
     """Reads latest completed bar for a symbol from a Parquet cache.
 
-    Expected file layout: {base_dir}/{symbol}_{interval}.parquet where interval in {1d,1h,1m}.
+    Expected file layout: the partitioned store (symbol=/interval=/year=), where only the
+    latest year is read, else {base_dir}/{symbol}_{interval}.parquet where interval in
+    {1d,1h,1m}. Partitions win over a flat file next to them, as in ``load_parquet_series``.
     Columns required: symbol, end (UTC), open, high, low, close, volume
+
+    Only the row group whose footer statistics hold the greatest ``end`` is decoded. Results
+    are cached per (symbol, interval) and reused until the file's mtime or size changes, so
+    polling an unchanged cache costs one ``stat`` per symbol.
     """
 
-    def __init__(self, base_dir: str | Path = "data/cache/yf") -> None:
+    def __init__(self, base_dir: str | Path = "data/cache/yf", max_workers: int = 8) -> None:
         self.base_dir = Path(base_dir)
+        self.max_workers = max_workers
+        self._cache: Dict[Tuple[str, str], Tuple[_FileKey, Optional[Bar]]] = {}
+
+    def _resolve(self, symbol: str, interval: str) -> Optional[Path]:
+        # Same precedence as load_parquet_series: partitions first, then the flat file
+        files = stored_files(self.base_dir, symbol, interval)
+        if not files or not files[-1].exists():
+            return None
+        return files[-1]
 
     def latest_completed_bar(self, symbol: str, timeframe: str) -> Optional[Bar]:
         interval = _TIMEFRAME_MAP.get(timeframe, timeframe)
-        file_path = self.base_dir / f"{symbol}_{interval}.parquet"
-        if not file_path.exists():
+        file_path = self._resolve(symbol, interval)
+        if file_path is None:
             return None
+        st = file_path.stat()
+        key: _FileKey = (str(file_path), st.st_mtime_ns, st.st_size)
+        cached = self._cache.get((symbol, interval))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        bar = _read_last_bar(file_path)
+        self._cache[(symbol, interval)] = (key, bar)
+        return bar
 
-        df = pd.read_parquet(file_path)
-        if df.empty:
-            return None
+    def latest_completed_bars(
+        self, symbols: Iterable[str], timeframe: str
+    ) -> Dict[str, Optional[Bar]]:
+        """Latest bar for many symbols; cache misses are read concurrently."""
+        symbols = list(symbols)
+        if len(symbols) <= 1 or self.max_workers <= 1:
+            return {sym: self.latest_completed_bar(sym, timeframe) for sym in symbols}
+        # Parquet decoding releases the GIL; each symbol touches only its own cache slot
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            bars = pool.map(lambda sym: self.latest_completed_bar(sym, timeframe), symbols)
+            return dict(zip(symbols, bars))
 
-        # Ensure correct dtypes
-        if "end" not in df.columns:
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Drop cached bars for one symbol, or all of them."""
+        if symbol is None:
+            self._cache.clear()
+        else:
+            for key in [k for k in self._cache if k[0] == symbol]:
+                del self._cache[key]
+
+
+def _last_row_group(pf: pq.ParquetFile) -> Optional[int]:
+    """Row group holding the greatest ``end`` per footer statistics, if usable."""
+    names = pf.schema_arrow.names
+    if "end" not in names or not pa.types.is_timestamp(pf.schema_arrow.field("end").type):
+        return None
+    col = names.index("end")
+    best: Optional[int] = None
+    best_max = None
+    for i in range(pf.metadata.num_row_groups):
+        stats = pf.metadata.row_group(i).column(col).statistics
+        if stats is None or not stats.has_min_max:
             return None
-        if df["end"].dtype != "datetime64[ns, UTC]":
-            df["end"] = pd.to_datetime(df["end"], utc=True)
-
-        # Pick the last completed bar by timestamp
-        last = df.sort_values("end").iloc[-1]
-        return Bar(
-            symbol=str(last["symbol"]),
-            end=pd.to_datetime(last["end"]).to_pydatetime(),
-            open=float(last["open"]),
-            high=float(last["high"]),
-            low=float(last["low"]),
-            close=float(last["close"]),
-            volume=int(last["volume"]),
-        )
+        if best_max is None or stats.max > best_max:
+            best, best_max = i, stats.max
+    return best
+
+
+def _read_last_bar(file_path: Path) -> Optional[Bar]:
+    pf = pq.ParquetFile(file_path)
+    if pf.metadata.num_rows == 0:
+        return None
+    group = _last_row_group(pf)
+    # Without timestamp statistics (e.g. string timestamps) fall back to a full read
+    table = pf.read() if group is None else pf.read_row_group(group)
+    if "end" not in table.column_names or table.num_rows == 0:
+        return None
+    end = table.column("end")
+    if not pa.types.is_timestamp(end.type):
+        end = pa.array(pd.to_datetime(end.to_pandas(), utc=True))
+    # Argmax instead of sorting: only the last bar is needed
+    idx = int(pc.index(end, pc.max(end)).as_py())
+    last = table.slice(idx, 1).to_pylist()[0]
+    ts = to_utc(end[idx].as_py())
+    assert ts is not None
+    return Bar(
+        symbol=str(last["symbol"]),
+        end=ts.to_pydatetime(),
+        open=float(last["open"]),
+        high=float(last["high"]),
+        low=float(last["low"]),
+        close=float(last["close"]),
+        volume=int(last["volume"]),
+    )
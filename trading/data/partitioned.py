@@ -0,0 +1,142 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Optional
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+
+# Row groups are the unit of predicate pushdown; smaller groups skip more data for
+# short windows at the cost of slightly larger files
+DEFAULT_ROW_GROUP_SIZE = 65536
+PART_FILE = "part-0.parquet"
+
+
+def partition_dir(base_dir: str | Path, symbol: str, interval: str) -> Path:
+    """Hive-style directory holding one ``year=YYYY`` partition per calendar year."""
+    return Path(base_dir) / f"symbol={symbol}" / f"interval={interval}"
+
+
+def has_partitions(base_dir: str | Path, symbol: str, interval: str) -> bool:
+    return any(partition_dir(base_dir, symbol, interval).glob(f"year=*/{PART_FILE}"))
+
+
+def to_utc(value: Any) -> Optional[pd.Timestamp]:
+    """Parse a window bound (string, datetime, Timestamp) as a UTC Timestamp."""
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+def partition_files(
+    base_dir: str | Path,
+    symbol: str,
+    interval: str,
+    start: Any = None,
+    end: Any = None,
+) -> list[Path]:
+    """Year partition files overlapping the half-open window ``[start, end)``."""
+    lo, hi = to_utc(start), to_utc(end)
+    files: list[Path] = []
+    for path in sorted(partition_dir(base_dir, symbol, interval).glob(f"year=*/{PART_FILE}")):
+        year = int(path.parent.name.split("=", 1)[1])
+        if lo is not None and year < lo.year:
+            continue
+        if hi is not None and (year > hi.year or (year == hi.year and hi == _year_start(year))):
+            continue
+        files.append(path)
+    return files
+
+
+def _year_start(year: int) -> pd.Timestamp:
+    return pd.Timestamp(year=year, month=1, day=1, tz="UTC")
+
+
+def read_partitioned(
+    base_dir: str | Path,
+    symbol: str,
+    interval: str,
+    start: Any = None,
+    end: Any = None,
+    columns: Optional[list[str]] = None,
+) -> pa.Table:
+    """Read ``[start, end)`` from the partitioned store.
+
+    Years outside the window are never opened, and the ``end`` predicate is pushed down
+    to Parquet row-group statistics so only overlapping row groups are decoded.
+    """
+    files = partition_files(base_dir, symbol, interval, start, end)
+    if not files:
+        raise FileNotFoundError(
+            f"No partitions for {symbol} {interval} under {partition_dir(base_dir, symbol, interval)}"
+        )
+    dataset = ds.dataset([str(f) for f in files], format="parquet")
+    lo, hi = to_utc(start), to_utc(end)
+    predicate: Optional[ds.Expression] = None
+    if lo is not None:
+        predicate = ds.field("end") >= pa.scalar(lo.value, pa.timestamp("ns", tz="UTC"))
+    if hi is not None:
+        upper = ds.field("end") < pa.scalar(hi.value, pa.timestamp("ns", tz="UTC"))
+        predicate = upper if predicate is None else predicate & upper
+    return dataset.to_table(columns=columns, filter=predicate)
+
+
+def write_partitioned(
+    df: pd.DataFrame,
+    base_dir: str | Path,
+    symbol: str,
+    interval: str,
+    *,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> list[Path]:
+    """Merge bars into the store, one sorted file per year.
+
+    Existing rows of the touched years are kept unless a new row has the same ``end``,
+    in which case the new row wins. Each year file is replaced atomically.
+    """
+    if df.empty:
+        return []
+    frame = df[["symbol", "end", "open", "high", "low", "close", "volume"]].copy()
+    frame["end"] = pd.to_datetime(frame["end"], utc=True)
+    frame["volume"] = frame["volume"].astype("int64")
+    written: list[Path] = []
+    for year, part in frame.groupby(frame["end"].dt.year, sort=True):
+        path = partition_dir(base_dir, symbol, interval) / f"year={int(year)}" / PART_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            # ParquetFile reads just the file; read_table would add hive keys from the path
+            existing = pq.ParquetFile(path).read().to_pandas()
+            part = pd.concat([existing, part], ignore_index=True)
+        part = part.drop_duplicates("end", keep="last").sort_values("end")
+        table = pa.Table.from_pandas(part, preserve_index=False)
+        tmp = path.with_name(path.name + ".tmp")
+        pq.write_table(table, tmp, row_group_size=row_group_size)
+        os.replace(tmp, path)
+        written.append(path)
+    return written
+
+
+def partition_flat_cache(
+    base_dir: str | Path,
+    out_dir: Optional[str | Path] = None,
+    *,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> list[Path]:
+    """Convert every ``{symbol}_{interval}.parquet`` under ``base_dir`` into partitions.
+
+    ``out_dir`` defaults to ``base_dir`` so the loader finds both layouts in one place.
+    """
+    target = Path(out_dir) if out_dir is not None else Path(base_dir)
+    written: list[Path] = []
+    for path in sorted(Path(base_dir).glob("*_*.parquet")):
+        symbol, interval = path.stem.rsplit("_", 1)
+        written.extend(
+            write_partitioned(
+                pd.read_parquet(path), target, symbol, interval, row_group_size=row_group_size
+            )
+        )
+    return written
@@ -0,0 +1,298 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+import json
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from trading.data.partitioned import has_partitions, read_partitioned
+from trading.data.resample import DEFAULT_CALENDAR, session_schedule
+from trading.data.synthetic import interval_minutes
+
+
+_REQUIRED = ["symbol", "end", "open", "high", "low", "close", "volume"]
+_PRICES = ["open", "high", "low", "close"]
+_NS_PER_DAY = 86_400 * 10**9
+# 1.4826 * MAD estimates the standard deviation of normally distributed returns
+_MAD_SCALE = 1.4826
+
+
+@dataclass(frozen=True)
+class QualityThresholds:
+    outlier_z: float = 10.0  # robust z-score of a log return flagged as an outlier
+    zero_volume_run: int = 3  # consecutive zero-volume bars reported as a run
+    max_examples: int = 5  # example timestamps kept per issue
+
+
+@dataclass
+class SeriesReport:
+    """Data quality findings for one cached series.
+
+    Errors (missing columns, NaNs, duplicates, inconsistent OHLC, non-positive prices)
+    make ``load_parquet_series`` fail or corrupt results; the remaining counts are
+    warnings worth reviewing before a series feeds many backtests.
+    """
+
+    symbol: str
+    interval: str
+    source: str
+    rows: int = 0
+    first_end: Optional[str] = None
+    last_end: Optional[str] = None
+    read_error: Optional[str] = None
+    missing_columns: list[str] = field(default_factory=list)
+    nan_rows: int = 0
+    duplicate_ends: int = 0
+    ohlc_violations: int = 0
+    nonpositive_prices: int = 0
+    missing_bars: int = 0
+    missing_sessions: int = 0
+    off_calendar_bars: int = 0
+    zero_volume_runs: int = 0
+    longest_zero_volume_run: int = 0
+    outliers: int = 0
+    examples: Dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not (
+            self.read_error
+            or self.missing_columns
+            or self.nan_rows
+            or self.duplicate_ends
+            or self.ohlc_violations
+            or self.nonpositive_prices
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "ok": self.ok}
+
+
+def discover_series(base_dir: str | Path) -> list[tuple[str, str]]:
+    """(symbol, interval) of every flat file and partitioned series under ``base_dir``."""
+    base = Path(base_dir)
+    found = {tuple(p.stem.rsplit("_", 1)) for p in base.glob("*_*.parquet")}
+    for part in base.glob("symbol=*/interval=*"):
+        if part.is_dir():
+            found.add((part.parent.name.split("=", 1)[1], part.name.split("=", 1)[1]))
+    return sorted((sym, iv) for sym, iv in found)
+
+
+@lru_cache(maxsize=8)
+def _calendar_tz(calendar: str) -> str:
+    import pandas_market_calendars as mcal
+
+    return str(mcal.get_calendar(calendar).tz)
+
+
+def _examples(ends: pd.Series, mask: np.ndarray, limit: int) -> list[str]:
+    return [str(ts) for ts in ends[mask].head(limit)]
+
+
+def _check_gaps(report: SeriesReport, ends: pd.Series, calendar: str, limit: int) -> None:
+    """Compare bars per exchange session with the calendar's expected count.
+
+    Bars are matched to sessions by time for intraday intervals (so both start- and
+    end-stamped bars count) and by local date for daily bars. Only sessions between
+    the first and last bar are considered.
+    """
+    try:
+        minutes = interval_minutes(report.interval)
+    except ValueError:
+        return
+    ns = pd.DatetimeIndex(ends).to_numpy("datetime64[ns]").view("int64")
+    first = ends.iloc[0] - pd.Timedelta(days=1)
+    last = ends.iloc[-1] + pd.Timedelta(days=1)
+    days, opens, closes = session_schedule(first, last, calendar)
+    if len(days) == 0:
+        report.off_calendar_bars = len(ns)
+        return
+    if minutes is None:
+        local = pd.DatetimeIndex(ends).tz_convert(_calendar_tz(calendar)).tz_localize(None)
+        bar_days = local.normalize().to_numpy("datetime64[ns]").view("int64") // _NS_PER_DAY
+        idx = np.searchsorted(days, bar_days)
+        clipped = np.minimum(idx, len(days) - 1)
+        matched = (idx < len(days)) & (days[clipped] == bar_days)
+        expected = np.ones(len(days), dtype=np.int64)
+    else:
+        idx = np.searchsorted(closes, ns, side="left")
+        clipped = np.minimum(idx, len(days) - 1)
+        matched = (idx < len(days)) & (ns >= opens[clipped])
+        step = minutes * 60 * 10**9
+        expected = -((opens - closes) // step)  # ceil((close - open) / step)
+    report.off_calendar_bars = int((~matched).sum())
+    if report.off_calendar_bars:
+        report.examples["off_calendar"] = _examples(ends, ~matched, limit)
+    if not matched.any():
+        return
+    sessions = idx[matched]
+    counts = np.bincount(sessions, minlength=len(days))
+    lo, hi = int(sessions.min()), int(sessions.max()) + 1
+    short = np.clip(expected[lo:hi] - counts[lo:hi], 0, None)
+    report.missing_bars = int(short.sum())
+    empty = np.flatnonzero(counts[lo:hi] == 0) + lo
+    report.missing_sessions = len(empty)
+    if len(empty):
+        labels = pd.to_datetime(days[empty[:limit]] * _NS_PER_DAY)
+        report.examples["missing_sessions"] = [d.strftime("%Y-%m-%d") for d in labels]
+
+
+def _zero_volume_runs(volume: np.ndarray, min_run: int) -> tuple[int, int, np.ndarray]:
+    """Number of zero-volume runs of at least ``min_run`` bars, longest run, run starts."""
+    zero = np.r_[False, volume == 0, False].astype(np.int8)
+    edges = np.diff(zero)
+    starts, stops = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    lengths = stops - starts
+    long_runs = lengths >= min_run
+    longest = int(lengths.max()) if len(lengths) else 0
+    return int(long_runs.sum()), longest, starts[long_runs]
+
+
+def check_frame(
+    df: pd.DataFrame,
+    report: SeriesReport,
+    *,
+    calendar: str = DEFAULT_CALENDAR,
+    thresholds: QualityThresholds = QualityThresholds(),
+) -> SeriesReport:
+    """Fill ``report`` with every finding for a raw (unvalidated) bar frame."""
+    limit = thresholds.max_examples
+    report.rows = len(df)
+    report.missing_columns = [c for c in _REQUIRED if c not in df.columns]
+    if report.missing_columns or df.empty:
+        return report
+
+    ends = df["end"]
+    if isinstance(ends.dtype, pd.DatetimeTZDtype):
+        ends = ends.dt.tz_convert("UTC")
+    else:
+        ends = pd.to_datetime(ends, utc=True, errors="coerce")
+    values = df[_PRICES + ["volume"]].apply(pd.to_numeric, errors="coerce")
+    nan = (values.isna().any(axis=1) | ends.isna()).to_numpy()
+    report.nan_rows = int(nan.sum())
+    if report.nan_rows:
+        report.examples["nan_rows"] = [str(i) for i in np.flatnonzero(nan)[:limit]]
+
+    # Remaining checks run on the parseable rows in time order
+    keep = ~nan
+    order = np.argsort(
+        pd.DatetimeIndex(ends[keep]).to_numpy("datetime64[ns]").view("int64"), kind="stable"
+    )
+    ends = ends[keep].iloc[order].reset_index(drop=True)
+    values = values[keep].iloc[order].reset_index(drop=True)
+    if ends.empty:
+        return report
+    report.first_end, report.last_end = str(ends.iloc[0]), str(ends.iloc[-1])
+
+    dup = ends.duplicated().to_numpy()
+    report.duplicate_ends = int(dup.sum())
+    if report.duplicate_ends:
+        report.examples["duplicate_ends"] = _examples(ends, dup, limit)
+
+    o, h, lo, c = (values[col].to_numpy(dtype=np.float64) for col in _PRICES)
+    bad = (h < lo) | (o > h) | (o < lo) | (c > h) | (c < lo)
+    report.ohlc_violations = int(bad.sum())
+    if report.ohlc_violations:
+        report.examples["ohlc_violations"] = _examples(ends, bad, limit)
+    nonpositive = (values[_PRICES] <= 0).any(axis=1).to_numpy()
+    report.nonpositive_prices = int(nonpositive.sum())
+    if report.nonpositive_prices:
+        report.examples["nonpositive_prices"] = _examples(ends, nonpositive, limit)
+
+    volume = values["volume"].to_numpy(dtype=np.float64)
+    runs, longest, starts = _zero_volume_runs(volume, thresholds.zero_volume_run)
+    report.zero_volume_runs, report.longest_zero_volume_run = runs, longest
+    if runs:
+        report.examples["zero_volume_runs"] = [str(ends.iloc[i]) for i in starts[:limit]]
+
+    if len(c) > 2 and not nonpositive.any():
+        returns = np.diff(np.log(c))
+        mad = float(np.median(np.abs(returns - np.median(returns))))
+        if mad > 0:
+            z = np.abs(returns - np.median(returns)) / (_MAD_SCALE * mad)
+            outlier = np.r_[False, z > thresholds.outlier_z]
+            report.outliers = int(outlier.sum())
+            if report.outliers:
+                report.examples["outliers"] = _examples(ends, outlier, limit)
+
+    _check_gaps(report, ends[~dup].reset_index(drop=True), calendar, limit)
+    return report
+
+
+def check_series(
+    base_dir: str | Path,
+    symbol: str,
+    interval: str,
+    *,
+    calendar: str = DEFAULT_CALENDAR,
+    thresholds: QualityThresholds = QualityThresholds(),
+) -> SeriesReport:
+    """Scan one cached series without the loader's fail-fast validation."""
+    if has_partitions(base_dir, symbol, interval):
+        source = Path(base_dir) / f"symbol={symbol}" / f"interval={interval}"
+    else:
+        source = Path(base_dir) / f"{symbol}_{interval}.parquet"
+    report = SeriesReport(symbol=symbol, interval=interval, source=str(source))
+    try:
+        if source.is_dir():
+            df = read_partitioned(base_dir, symbol, interval).to_pandas()
+        else:
+            df = pd.read_parquet(source)
+    except Exception as exc:
+        report.read_error = f"{type(exc).__name__}: {exc}"
+        return report
+    return check_frame(df, report, calendar=calendar, thresholds=thresholds)
+
+
+def _check_job(args: tuple[str, str, str, str, QualityThresholds]) -> SeriesReport:
+    base_dir, symbol, interval, calendar, thresholds = args
+    return check_series(base_dir, symbol, interval, calendar=calendar, thresholds=thresholds)
+
+
+def scan_cache(
+    base_dir: str | Path,
+    *,
+    series: Optional[Iterable[tuple[str, str]]] = None,
+    calendar: str = DEFAULT_CALENDAR,
+    thresholds: QualityThresholds = QualityThresholds(),
+    max_workers: Optional[int] = None,
+) -> list[SeriesReport]:
+    """Check every series in a cache directory, one worker process per CPU by default.
+
+    With ``max_workers == 1`` everything runs in-process.
+    """
+    targets = list(series) if series is not None else discover_series(base_dir)
+    jobs = [(str(base_dir), sym, iv, calendar, thresholds) for sym, iv in targets]
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        return [_check_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(_check_job, jobs, chunksize=max(1, len(jobs) // (4 * workers))))
+
+
+def write_report(reports: list[SeriesReport], path: str | Path) -> Path:
+    """Write a JSON report: a summary plus one entry per series, replaced atomically."""
+    out = Path(path)
+    failing = [r for r in reports if not r.ok]
+    warning_fields = ["missing_bars", "off_calendar_bars", "zero_volume_runs", "outliers"]
+    payload = {
+        "generated_at": pd.Timestamp.now(tz="UTC").isoformat(),
+        "summary": {
+            "series": len(reports),
+            "failing": len(failing),
+            "with_warnings": sum(1 for r in reports if any(getattr(r, f) for f in warning_fields)),
+            "failing_series": [f"{r.symbol}_{r.interval}" for r in failing],
+        },
+        "series": [r.to_dict() for r in reports],
+    }
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(f".{out.name}.{uuid.uuid4().hex[:8]}.tmp")
+    tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(tmp, out)
+    return out
@@ -0,0 +1,180 @@
+from __future__ import annotations
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+
+from trading.data.derived import is_current, source_stamp, write_derived
+from trading.data.hashing import file_sha256
+from trading.data.partitioned import DEFAULT_ROW_GROUP_SIZE
+from trading.data.series_loader import load_parquet_series, source_files
+from trading.data.synthetic import interval_minutes
+
+
+SOURCE_INTERVAL = "1m"
+DEFAULT_CALENDAR = "XNYS"
+# Derived series live under {base_dir}/resampled/{calendar}/{symbol}_{interval}.parquet
+DERIVED_DIR = "resampled"
+_NS_PER_DAY = 86_400 * 10**9
+# Bump when the aggregation rules change so stale derived files are rebuilt
+_FORMAT_VERSION = 1
+
+
+def can_resample(interval: str) -> bool:
+    """True when ``interval`` is coarser than 1m and can be derived from minute bars."""
+    try:
+        minutes = interval_minutes(interval)
+    except ValueError:
+        return False
+    return minutes is None or minutes > 1
+
+
+@lru_cache(maxsize=16)
+def _year_sessions(
+    calendar: str, first_year: int, last_year: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    import pandas_market_calendars as mcal
+
+    schedule = mcal.get_calendar(calendar).schedule(
+        start_date=f"{first_year}-01-01", end_date=f"{last_year}-12-31"
+    )
+    days = pd.DatetimeIndex(schedule.index).to_numpy("datetime64[ns]").view("int64") // _NS_PER_DAY
+    opens = pd.DatetimeIndex(schedule["market_open"]).to_numpy("datetime64[ns]").view("int64")
+    closes = pd.DatetimeIndex(schedule["market_close"]).to_numpy("datetime64[ns]").view("int64")
+    days.flags.writeable = opens.flags.writeable = closes.flags.writeable = False
+    return days, opens, closes
+
+
+def session_schedule(
+    start: pd.Timestamp, end: pd.Timestamp, calendar: str = DEFAULT_CALENDAR
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Exchange sessions overlapping ``[start, end]``: local session date (days since
+    the epoch), open and close (UTC epoch ns).
+
+    Building a calendar schedule costs far more than aggregating a symbol's bars, so
+    schedules are memoized per whole-year range and shared across symbols.
+    """
+    days, opens, closes = _year_sessions(calendar, start.year, end.year)
+    lo = np.searchsorted(closes, start.value, side="left")
+    hi = np.searchsorted(opens, end.value, side="right")
+    return days[lo:hi], opens[lo:hi], closes[lo:hi]
+
+
+def session_bounds(
+    start: pd.Timestamp, end: pd.Timestamp, calendar: str = DEFAULT_CALENDAR
+) -> tuple[np.ndarray, np.ndarray]:
+    """Open and close (UTC epoch ns) of every exchange session between two timestamps."""
+    _, opens, closes = session_schedule(start, end, calendar)
+    return opens, closes
+
+
+def resample_bars(
+    df: pd.DataFrame,
+    interval: str,
+    *,
+    calendar: str = DEFAULT_CALENDAR,
+    complete_only: bool = True,
+) -> pd.DataFrame:
+    """Aggregate 1m bars (as returned by ``load_parquet_series``) into ``interval`` bars.
+
+    Buckets are anchored at each session's open and never span sessions: the last
+    intraday bucket of a session is truncated at the close (early closes included),
+    and daily bars end at the close. Bars outside regular sessions are dropped.
+    Aggregation is open=first, high=max, low=min, close=last, volume=sum over the
+    minute bars ending in ``(bucket start, bucket end]``.
+
+    With ``complete_only`` a trailing bucket whose end lies after the last source
+    bar is dropped, since more minute bars may still arrive for it.
+    """
+    minutes = interval_minutes(interval)
+    columns = ["symbol", "end", "open", "high", "low", "close", "volume"]
+    if df.empty:
+        return df[columns].iloc[0:0].reset_index(drop=True)
+    ends = pd.DatetimeIndex(df["end"]).to_numpy("datetime64[ns]").view("int64")
+    first = pd.Timestamp(int(ends.min()), tz="UTC") - pd.Timedelta(days=1)
+    last = pd.Timestamp(int(ends.max()), tz="UTC") + pd.Timedelta(days=1)
+    opens, closes = session_bounds(first, last, calendar)
+    if len(closes) == 0:
+        return df[columns].iloc[0:0].reset_index(drop=True)
+
+    # A minute bar belongs to the first session closing at or after its end
+    session = np.searchsorted(closes, ends, side="left")
+    clipped = np.minimum(session, len(closes) - 1)
+    inside = (session < len(closes)) & (ends > opens[clipped])
+    ends, session = ends[inside], session[inside]
+    if len(ends) == 0:
+        return df[columns].iloc[0:0].reset_index(drop=True)
+    session_open, session_close = opens[session], closes[session]
+    if minutes is None:
+        bucket_end = session_close
+    else:
+        step = minutes * 60 * 10**9
+        bucket = (ends - session_open - 1) // step
+        bucket_end = np.minimum(session_open + (bucket + 1) * step, session_close)
+
+    # The loader returns bars sorted by end, so every bucket is a contiguous run
+    starts = np.flatnonzero(np.r_[True, bucket_end[1:] != bucket_end[:-1]])
+    stops = np.r_[starts[1:] - 1, len(bucket_end) - 1]
+    o = df["open"].to_numpy(dtype=np.float64)[inside]
+    h = df["high"].to_numpy(dtype=np.float64)[inside]
+    lo = df["low"].to_numpy(dtype=np.float64)[inside]
+    c = df["close"].to_numpy(dtype=np.float64)[inside]
+    v = df["volume"].to_numpy(dtype=np.int64)[inside]
+    out = pd.DataFrame(
+        {
+            "symbol": df["symbol"].iloc[0],
+            "end": pd.to_datetime(bucket_end[starts], utc=True),
+            "open": o[starts],
+            "high": np.maximum.reduceat(h, starts),
+            "low": np.minimum.reduceat(lo, starts),
+            "close": c[stops],
+            "volume": np.add.reduceat(v, starts),
+        }
+    )
+    if complete_only and int(bucket_end[-1]) > int(ends[-1]):
+        out = out.iloc[:-1]
+    return out.reset_index(drop=True)
+
+
+def derived_path(
+    base_dir: str | Path, symbol: str, interval: str, calendar: str = DEFAULT_CALENDAR
+) -> Path:
+    return Path(base_dir) / DERIVED_DIR / calendar / f"{symbol}_{interval}.parquet"
+
+
+def source_fingerprint(base_dir: str | Path, symbol: str) -> str:
+    """Hash of the 1m source files' content; changes whenever the minute cache does."""
+    digests = [file_sha256(f) for f in source_files(base_dir, symbol, SOURCE_INTERVAL)]
+    blob = json.dumps([digests, _FORMAT_VERSION])
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def ensure_resampled(
+    base_dir: str | Path,
+    symbol: str,
+    interval: str,
+    *,
+    calendar: str = DEFAULT_CALENDAR,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> Path:
+    """Path of ``symbol``'s ``interval`` series derived from its 1m cache.
+
+    The derived file records the fingerprint of the minute data it was built from and
+    is reused while that fingerprint matches; otherwise it is rebuilt and replaced
+    atomically. A (size, mtime) stamp of the minute files is checked first, so they
+    are only hashed after they change on disk. Raises FileNotFoundError when there is
+    no 1m cache for the symbol.
+    """
+    if not can_resample(interval):
+        raise ValueError(f"Cannot derive '{interval}' bars from {SOURCE_INTERVAL} bars")
+    stamp = source_stamp(source_files(base_dir, symbol, SOURCE_INTERVAL), _FORMAT_VERSION)
+    path = derived_path(base_dir, symbol, interval, calendar)
+    if path.exists() and is_current(path, stamp, lambda: source_fingerprint(base_dir, symbol)):
+        return path
+    fingerprint = source_fingerprint(base_dir, symbol)
+    minute = load_parquet_series(base_dir, symbol, SOURCE_INTERVAL)
+    df = resample_bars(minute, interval, calendar=calendar)
+    return write_derived(df, path, fingerprint, stamp=stamp, row_group_size=row_group_size)
@@ -0,0 +1,223 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Optional, Sequence
+import hashlib
+import json
+import os
+import time
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+
+from trading.data.hashing import file_sha256
+from trading.data.series_loader import load_parquet_series, source_files
+
+
+# Bump when the validated layout produced by load_parquet_series changes
+_FORMAT_VERSION = 1
+_POINTER_DIR = "by-stat"
+DEFAULT_MAX_BYTES = 8 * 2**30
+# Temp files this old belong to writers that died
+_TMP_GRACE_SECONDS = 3600.0
+
+
+class SeriesCache:
+    """Validated bar series stored as uncompressed Arrow IPC files, memory-mapped on load.
+
+    ``load`` returns the same frame as ``load_parquet_series`` but only decodes, coerces
+    and validates a source once: the result is written to ``{cache_dir}/{key}.arrow``
+    where ``key`` hashes the source files' content and the window. Later loads map the
+    file instead, so numeric columns come straight from the OS page cache, shared by
+    every process reading the same series.
+
+    Content hashing a large source costs a full read, so a small pointer file per
+    (path, size, mtime) remembers the key; unchanged sources are resolved with a stat.
+    ``gc`` drops entries whose sources changed and bounds the cache's size.
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def _stat_pointer(
+        self, stats: list[list[Any]], symbol: str, interval: str, window: list[Any]
+    ) -> Path:
+        blob = json.dumps([stats, symbol, interval, window, _FORMAT_VERSION], default=str)
+        return self.cache_dir / _POINTER_DIR / hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def key(
+        self,
+        base_dir: str | Path,
+        symbol: str,
+        interval: str,
+        start: Any = None,
+        end: Any = None,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        compact: bool = False,
+    ) -> str:
+        files = source_files(base_dir, symbol, interval, start, end)
+        window: list[Any] = [
+            None if start is None else str(start),
+            None if end is None else str(end),
+        ]
+        # Projection and dtypes change the stored frame, so they are part of the key
+        window += [None if columns is None else list(columns), compact]
+        stats = [_stat(f) for f in files]
+        pointer = self._stat_pointer(stats, symbol, interval, window) if files else None
+        if pointer is not None and pointer.exists():
+            found = _read_pointer(pointer)[0]
+            if found is not None:
+                return found
+        payload = [[file_sha256(f) for f in files], symbol, interval, window, _FORMAT_VERSION]
+        key = hashlib.sha256(json.dumps(payload).encode("utf-8")).hexdigest()
+        if pointer is not None:
+            # The stats let gc tell when the sources behind the key have changed
+            _atomic_write(pointer, json.dumps({"key": key, "files": stats}).encode("utf-8"))
+        return key
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.arrow"
+
+    def load(
+        self,
+        base_dir: str | Path,
+        symbol: str,
+        interval: str,
+        start: Any = None,
+        end: Any = None,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        compact: bool = False,
+    ) -> pd.DataFrame:
+        """Same frame as ``load_parquet_series`` with the same arguments."""
+        opts: dict[str, Any] = {"columns": columns, "compact": compact}
+        # Missing sources raise FileNotFoundError here, exactly like the plain loader
+        files = source_files(base_dir, symbol, interval, start, end)
+        if not files or not all(f.exists() for f in files):
+            return load_parquet_series(base_dir, symbol, interval, start, end, **opts)
+        path = self.path_for(self.key(base_dir, symbol, interval, start, end, **opts))
+        cached = _read_mapped(path)
+        if cached is not None:
+            _touch(path)
+            return cached
+        df = load_parquet_series(base_dir, symbol, interval, start, end, **opts)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        tmp = _tmp_path(path)
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, path)
+        return df
+
+    def gc(self, max_bytes: int = DEFAULT_MAX_BYTES, *, apply: bool = True) -> list[Path]:
+        """Drop what no load can use any more and keep the rest within ``max_bytes``.
+
+        Pointers whose source files changed or vanished go first, then entries no
+        remaining pointer references (and pointers without an entry), then the least
+        recently loaded entries until the cache fits the budget. Returns the removed
+        paths; with ``apply=False`` they are only listed.
+        """
+        if not self.cache_dir.exists():
+            return []
+        removed: list[Path] = []
+        pointers: dict[str, list[Path]] = {}
+        for pointer in sorted((self.cache_dir / _POINTER_DIR).glob("[!.]*")):
+            key, stats = _read_pointer(pointer)
+            if key is None or stats is None or not _unchanged(stats):
+                removed.append(pointer)
+            else:
+                pointers.setdefault(key, []).append(pointer)
+        entries: list[tuple[int, int, Path]] = []
+        for path in sorted(self.cache_dir.glob("[!.]*.arrow")):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.stem in pointers:
+                entries.append((st.st_mtime_ns, st.st_size, path))
+            else:
+                removed.append(path)
+        kept = {path.stem for _, _, path in entries}
+        for key, refs in pointers.items():
+            if key not in kept:
+                removed.extend(refs)
+        total = sum(size for _, size, _ in entries)
+        # Oldest mtime first: loads touch the entries they map
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            removed.append(path)
+            removed.extend(pointers[path.stem])
+            total -= size
+        cutoff = time.time() - _TMP_GRACE_SECONDS
+        for tmp in self.cache_dir.rglob(".*.tmp"):
+            try:
+                if tmp.stat().st_mtime < cutoff:
+                    removed.append(tmp)
+            except FileNotFoundError:
+                continue
+        if apply:
+            for path in removed:
+                path.unlink(missing_ok=True)
+        return removed
+
+
+def _stat(path: Path) -> list[Any]:
+    st = path.stat()
+    return [str(path.resolve()), st.st_size, st.st_mtime_ns]
+
+
+def _unchanged(stats: list[list[Any]]) -> bool:
+    try:
+        return all(_stat(Path(name)) == [name, size, mtime] for name, size, mtime in stats)
+    except OSError:
+        return False
+
+
+def _read_pointer(path: Path) -> tuple[Optional[str], Optional[list[list[Any]]]]:
+    """(key, source stats) of a pointer; pointers from before the stats were recorded
+    hold just the key."""
+    try:
+        text = path.read_text("utf-8").strip()
+    except OSError:
+        return None, None
+    if not text.startswith("{"):
+        return text or None, None
+    try:
+        data = json.loads(text)
+        return str(data["key"]), list(data["files"])
+    except (ValueError, KeyError, TypeError):
+        return None, None
+
+
+def _touch(path: Path) -> None:
+    # Marks the entry as recently used for gc; a read-only cache just loses LRU order
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _read_mapped(path: Path) -> Optional[pd.DataFrame]:
+    if not path.exists():
+        return None
+    try:
+        with pa.memory_map(str(path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid):
+        # Truncated or foreign file: rebuild it from the source
+        return None
+    # split_blocks keeps columns unconsolidated so numeric ones need no copy
+    return table.to_pandas(split_blocks=True)
+
+
+def _tmp_path(path: Path) -> Path:
+    # Unique per writer so concurrent processes never clobber each other's temp file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = _tmp_path(path)
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
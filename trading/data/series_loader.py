@@ -1,29 +1,134 @@
 from __future__ import annotations
 from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 from pandas.api.types import is_datetime64_any_dtype
 
+from trading.data.partitioned import (
+    has_partitions,
+    partition_dir,
+    partition_files,
+    read_partitioned,
+    to_utc,
+)
+
+
+_COLUMNS = ("symbol", "end", "open", "high", "low", "close", "volume")
+_NUMERIC = ("open", "high", "low", "close", "volume")
+
+
+def _stored(base_dir: str | Path, symbol: str, interval: str) -> bool:
+    flat = Path(base_dir) / f"{symbol}_{interval}.parquet"
+    return flat.exists() or has_partitions(base_dir, symbol, interval)
+
+
+def _derivable(base_dir: str | Path, symbol: str, interval: str) -> bool:
+    """True when the series is not stored but can be resampled from the 1m cache."""
+    from trading.data.resample import SOURCE_INTERVAL, can_resample
+
+    return (
+        can_resample(interval)
+        and not _stored(base_dir, symbol, interval)
+        and _stored(base_dir, symbol, SOURCE_INTERVAL)
+    )
+
+
+def series_exists(base_dir: str | Path, symbol: str, interval: str) -> bool:
+    """True when the series is cached (flat or partitioned) or derivable from 1m bars."""
+    return _stored(base_dir, symbol, interval) or _derivable(base_dir, symbol, interval)
+
+
+def source_files(
+    base_dir: str | Path, symbol: str, interval: str, start: Any = None, end: Any = None
+) -> list[Path]:
+    """Files ``load_parquet_series`` reads for the series and window.
+
+    For the partitioned store only year partitions overlapping ``[start, end)`` count.
+    A series derived from the 1m cache reports the minute files it is built from.
+    """
+    if _derivable(base_dir, symbol, interval):
+        from trading.data.resample import SOURCE_INTERVAL
+
+        return source_files(base_dir, symbol, SOURCE_INTERVAL)
+    return stored_files(base_dir, symbol, interval, start, end)
+
 
-def load_parquet_series(base_dir: str | Path, symbol: str, interval: str) -> pd.DataFrame:
-    """Load a historical bar series for a symbol/interval from a Parquet file.
+def stored_files(
+    base_dir: str | Path, symbol: str, interval: str, start: Any = None, end: Any = None
+) -> list[Path]:
+    """Files holding the stored (not derived) series, in year order.
+
+    The Hive partitions take precedence: ``data partition`` leaves the flat file in
+    place and incremental downloads then only extend the partitions, so a flat file
+    next to them may be stale. The flat path is returned even when it does not exist.
+    """
+    if has_partitions(base_dir, symbol, interval):
+        return partition_files(base_dir, symbol, interval, start, end)
+    return [Path(base_dir) / f"{symbol}_{interval}.parquet"]
+
+
+def load_parquet_series(
+    base_dir: str | Path,
+    symbol: str,
+    interval: str,
+    start: Any = None,
+    end: Any = None,
+    *,
+    columns: Optional[Sequence[str]] = None,
+    compact: bool = False,
+) -> pd.DataFrame:
+    """Load a historical bar series for a symbol/interval from the Parquet cache.
+
+    Reads the Hive-partitioned store (``symbol=/interval=/year=``) when present, else the
+    flat ``{symbol}_{interval}.parquet`` file. ``start``/``end`` select the half-open
+    window ``[start, end)`` on ``end`` and are pushed down to Parquet row groups.
+    Intervals missing from the cache are resampled from the symbol's 1m bars when those
+    exist (see ``trading.data.resample``); the derived file is reused until they change.
+
+    ``columns`` reads and returns only those columns (``end`` is always included, first).
+    ``compact`` drops ``symbol`` (the file already identifies it) and returns ``end`` as
+    int64 epoch nanoseconds, float32 prices and int32 volume (int64 if it would overflow).
 
     Expects columns: symbol, end (UTC), open, high, low, close, volume
     Returns DataFrame sorted by end ascending with UTC timestamps.
     """
-    path = Path(base_dir) / f"{symbol}_{interval}.parquet"
-    df = pd.read_parquet(path)
-    # Schema validation
-    required = ["symbol", "end", "open", "high", "low", "close", "volume"]
-    missing = [c for c in required if c not in df.columns]
-    if missing:
-        raise ValueError(f"Parquet schema invalid for {path}: missing columns {missing}")
+    wanted = list(_COLUMNS) if columns is None else ["end"] + [c for c in columns if c != "end"]
+    unknown = [c for c in wanted if c not in _COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown columns {unknown}; expected a subset of {_COLUMNS}")
+    if compact:
+        wanted = [c for c in wanted if c != "symbol"]
+    if _derivable(base_dir, symbol, interval):
+        from trading.data.resample import ensure_resampled
+
+        base_dir = ensure_resampled(base_dir, symbol, interval).parent
+    if has_partitions(base_dir, symbol, interval):
+        path = partition_dir(base_dir, symbol, interval)
+        files = stored_files(base_dir, symbol, interval, start, end)
+        _check_schema(files[0] if files else None, path, wanted)
+        df = read_partitioned(base_dir, symbol, interval, start, end, columns=wanted).to_pandas()
+    else:
+        path = Path(base_dir) / f"{symbol}_{interval}.parquet"
+        _check_schema(path, path, wanted)
+        filters: list[tuple[str, str, Any]] = []
+        lo, hi = to_utc(start), to_utc(end)
+        if lo is not None:
+            filters.append(("end", ">=", lo))
+        if hi is not None:
+            filters.append(("end", "<", hi))
+        df = pd.read_parquet(path, columns=wanted, filters=filters or None)
     # Coerce dtypes
     if not is_datetime64_any_dtype(df["end"]):
         df["end"] = pd.to_datetime(df["end"], utc=True, errors="coerce")
-    for col in ["open", "high", "low", "close"]:
+    numeric = [c for c in _NUMERIC if c in wanted]
+    for col in numeric:
         df[col] = pd.to_numeric(df[col], errors="coerce")
-    df["volume"] = pd.to_numeric(df["volume"], errors="coerce").astype("Int64")
-    if df[["open", "high", "low", "close", "volume"]].isnull().any().any():
+    if "volume" in wanted:
+        df["volume"] = df["volume"].astype("Int64")
+    if df[numeric].isnull().any().any():
         raise ValueError(f"Parquet data has invalid dtypes or NaNs for {path}")
     df = df.sort_values("end").reset_index(drop=True)
     # Enforce strictly increasing timestamps (no duplicates)
@@ -32,4 +137,30 @@ def load_parquet_series(base_dir: str | Path, symbol: str, interval: str) -> pd.
         raise ValueError(
             f"Parquet data has duplicate timestamps for {symbol} {interval}; examples: {dupes}"
         )
-    return df[["symbol", "end", "open", "high", "low", "close", "volume"]]
+    df = df[wanted]
+    return _compact(df) if compact else df
+
+
+def _check_schema(file: Optional[Path], path: Path, wanted: list[str]) -> None:
+    if file is None or not file.exists():
+        # Let the reader raise its usual FileNotFoundError
+        return
+    names = pq.read_schema(file).names
+    missing = [c for c in wanted if c not in names]
+    if missing:
+        raise ValueError(f"Parquet schema invalid for {path}: missing columns {missing}")
+
+
+def _compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Epoch-ns ``end``, float32 prices and int32 volume (kept int64 if it overflows)."""
+    out = pd.DataFrame(
+        {"end": pd.DatetimeIndex(df["end"]).to_numpy("datetime64[ns]").view("int64")}
+    )
+    for col in df.columns:
+        if col in ("open", "high", "low", "close"):
+            out[col] = df[col].to_numpy(dtype=np.float32)
+        elif col == "volume":
+            volume = df[col].to_numpy(dtype=np.int64)
+            fits = len(volume) == 0 or np.abs(volume).max() <= np.iinfo(np.int32).max
+            out[col] = volume.astype(np.int32) if fits else volume
+    return out
@@ -0,0 +1,204 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from math import ceil, sqrt
+from pathlib import Path
+from typing import Iterable, Optional
+import re
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from trading.data.partitioned import DEFAULT_ROW_GROUP_SIZE
+
+
+# Same column layout and types that ``load_parquet_series`` returns
+SERIES_SCHEMA = pa.schema(
+    [
+        ("symbol", pa.string()),
+        ("end", pa.timestamp("ns", tz="UTC")),
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+        ("volume", pa.int64()),
+    ]
+)
+
+_SESSION_TZ = "America/New_York"
+_SESSION_OPEN = pd.Timedelta(hours=9, minutes=30)
+_SESSION_MINUTES = 390
+_TRADING_DAYS = 252
+_INTERVAL_RE = re.compile(r"^(\d+)(m|h|d)$")
+
+
+@dataclass
+class SynthParams:
+    """Price process for synthetic bars.
+
+    Log prices follow a geometric Brownian motion with annualized ``drift`` and
+    ``volatility``, plus optional Poisson jumps, a two-state volatility regime and
+    overnight gaps at session opens. ``missing_prob`` drops bars at random.
+    """
+
+    start_price: float = 100.0
+    drift: float = 0.05
+    volatility: float = 0.2
+    jump_intensity: float = 0.0  # expected jumps per year
+    jump_mean: float = 0.0  # mean log jump size
+    jump_std: float = 0.05
+    regime_switch_prob: float = 0.0  # per-bar probability of flipping regime
+    high_vol_multiplier: float = 3.0
+    gap_prob: float = 0.0  # per-session probability of an opening gap
+    gap_std: float = 0.02
+    missing_prob: float = 0.0
+    base_volume: int = 1_000_000  # average shares per session
+
+
+def interval_minutes(interval: str) -> Optional[int]:
+    """Minutes per bar for intraday intervals ("1m", "15m", "1h"), None for "1d"."""
+    match = _INTERVAL_RE.match(interval.lower())
+    if match is None:
+        raise ValueError(f"Unsupported interval '{interval}'; expected e.g. 1m, 5m, 1h or 1d")
+    n, unit = int(match.group(1)), match.group(2)
+    if unit == "d":
+        if n != 1:
+            raise ValueError("Only the 1d daily interval is supported")
+        return None
+    return n * 60 if unit == "h" else n
+
+
+def session_timeline(interval: str, start: str, end: str) -> tuple[np.ndarray, np.ndarray]:
+    """Bar end timestamps (UTC epoch ns) for weekday sessions in ``[start, end]``.
+
+    Sessions run 09:30-16:00 New York time; the last intraday bar of a session is
+    truncated at the close. Daily bars end at the close. Also returns a boolean mask
+    marking the first bar of each session.
+    """
+    days = pd.bdate_range(start, end)
+    opens = (days + _SESSION_OPEN).tz_localize(_SESSION_TZ).tz_convert("UTC")
+    open_ns = opens.to_numpy("datetime64[ns]").view("int64")
+    close_offset = _SESSION_MINUTES * 60 * 10**9
+    minutes = interval_minutes(interval)
+    if minutes is None:
+        ends = open_ns + close_offset
+        return ends, np.ones(len(ends), dtype=bool)
+    per_session = ceil(_SESSION_MINUTES / minutes)
+    offsets = np.minimum(
+        np.arange(1, per_session + 1, dtype=np.int64) * minutes * 60 * 10**9, close_offset
+    )
+    ends = (open_ns[:, None] + offsets[None, :]).ravel()
+    first = np.zeros((len(open_ns), per_session), dtype=bool)
+    first[:, 0] = True
+    return ends, first.ravel()
+
+
+def synth_bars(
+    symbol: str,
+    ends: np.ndarray,
+    session_start: np.ndarray,
+    params: SynthParams,
+    rng: np.random.Generator,
+) -> pa.Table:
+    """Simulate one symbol's OHLCV bars on the given timeline as an Arrow table."""
+    n = len(ends)
+    bars_per_session = max(1, int(round(n / max(1, int(session_start.sum())))))
+    dt = 1.0 / (_TRADING_DAYS * bars_per_session)
+
+    sigma = np.full(n, params.volatility)
+    if params.regime_switch_prob > 0:
+        regime = np.cumsum(rng.random(n) < params.regime_switch_prob) % 2
+        sigma = np.where(regime == 1, sigma * params.high_vol_multiplier, sigma)
+    step = sigma * sqrt(dt)
+    log_ret = (params.drift - 0.5 * sigma**2) * dt + step * rng.standard_normal(n)
+    if params.jump_intensity > 0:
+        jumps = rng.poisson(params.jump_intensity * dt, n)
+        hit = jumps > 0
+        log_ret[hit] += rng.normal(
+            params.jump_mean * jumps[hit], params.jump_std * np.sqrt(jumps[hit])
+        )
+
+    # Opening gaps move the open away from the previous close; the first bar has none
+    gap = np.zeros(n)
+    if params.gap_prob > 0:
+        gapped = session_start & (rng.random(n) < params.gap_prob)
+        gapped[0] = False
+        gap[gapped] = rng.normal(0.0, params.gap_std, int(gapped.sum()))
+
+    log_close = np.log(params.start_price) + np.cumsum(gap + log_ret)
+    close = np.exp(log_close)
+    # Each bar opens at the previous close, moved by the opening gap if any
+    open_ = np.empty(n)
+    open_[0] = params.start_price
+    open_[1:] = close[:-1]
+    if params.gap_prob > 0:
+        open_[gapped] *= np.exp(gap[gapped])
+    wick = step * np.abs(rng.standard_normal((2, n))) * 0.5
+    high = np.maximum(open_, close) * np.exp(wick[0])
+    low = np.minimum(open_, close) * np.exp(-wick[1])
+    volume = np.maximum(
+        1,
+        (params.base_volume / bars_per_session * rng.lognormal(0.0, 0.5, n)).astype(np.int64),
+    )
+
+    keep = np.ones(n, dtype=bool)
+    if params.missing_prob > 0:
+        keep = rng.random(n) >= params.missing_prob
+        keep[0] = True
+    kept = int(keep.sum())
+    return pa.Table.from_arrays(
+        [
+            pa.array(np.full(kept, symbol)),
+            pa.array(ends[keep], type=pa.int64()).cast(SERIES_SCHEMA.field("end").type),
+            pa.array(open_[keep]),
+            pa.array(high[keep]),
+            pa.array(low[keep]),
+            pa.array(close[keep]),
+            pa.array(volume[keep]),
+        ],
+        schema=SERIES_SCHEMA,
+    )
+
+
+def synthetic_symbols(count: int, prefix: str = "SYN") -> list[str]:
+    width = max(4, len(str(count - 1)))
+    return [f"{prefix}{i:0{width}d}" for i in range(count)]
+
+
+def write_synthetic_bars(
+    symbols: Iterable[str],
+    interval: str = "1d",
+    start: str = "2020-01-01",
+    end: str = "2024-12-31",
+    out_dir: str | Path = "data/cache/synth",
+    *,
+    params: Optional[SynthParams] = None,
+    seed: int = 0,
+    max_workers: Optional[int] = None,
+) -> list[Path]:
+    """Write ``{symbol}_{interval}.parquet`` caches of seeded synthetic bars.
+
+    Files use the ``load_parquet_series`` schema, so they are drop-in replacements for
+    downloaded fixtures. Each symbol draws from its own child of ``seed``, so a symbol's
+    series depends only on the seed and its position in ``symbols``.
+    """
+    params = params or SynthParams()
+    symbols = list(symbols)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    ends, session_start = session_timeline(interval, start, end)
+    if len(ends) == 0:
+        raise ValueError(f"No sessions between {start} and {end}")
+    seeds = np.random.SeedSequence(seed).spawn(len(symbols))
+
+    def _write(i: int) -> Path:
+        table = synth_bars(symbols[i], ends, session_start, params, np.random.default_rng(seeds[i]))
+        path = out / f"{symbols[i]}_{interval}.parquet"
+        pq.write_table(table, path, row_group_size=DEFAULT_ROW_GROUP_SIZE)
+        return path
+
+    # NumPy and Parquet encoding release the GIL, so threads scale across symbols
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_write, range(len(symbols))))
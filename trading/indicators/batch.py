@@ -0,0 +1,201 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from math import sqrt
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# Every indicator takes a 1-D series or a 2-D (time x symbol) panel, works along axis 0
+# and returns float64 arrays of the same shape. Rows before an indicator has a full
+# window ("warm-up") are NaN. Rolling indicators are NaN for any window containing a
+# NaN input; exponential ones are NaN on NaN rows and carry their state across them,
+# so the NaN-filled gaps of a ``Panel`` never produce made-up values.
+
+
+@dataclass(frozen=True)
+class BollingerBands:
+    middle: np.ndarray
+    upper: np.ndarray
+    lower: np.ndarray
+
+
+@dataclass(frozen=True)
+class MACD:
+    macd: np.ndarray
+    signal: np.ndarray
+    histogram: np.ndarray
+
+
+def _values(x: Any) -> np.ndarray:
+    arr = np.asarray(x, dtype=np.float64)
+    if arr.ndim not in (1, 2):
+        raise ValueError(f"Expected a 1-D series or 2-D (time x symbol) panel, got {arr.ndim}-D")
+    return arr
+
+
+def _check_window(window: int, name: str = "window") -> int:
+    if int(window) != window or window < 1:
+        raise ValueError(f"{name} must be a positive integer, got {window!r}")
+    return int(window)
+
+
+def _pandas(arr: np.ndarray, op: Callable[[pd.DataFrame], pd.DataFrame]) -> np.ndarray:
+    """Run a pandas window kernel column-wise over ``arr`` and return the same shape."""
+    out: np.ndarray = op(pd.DataFrame(arr.reshape(len(arr), -1))).to_numpy(dtype=np.float64)
+    return out.reshape(arr.shape)
+
+
+def _ewm(arr: np.ndarray, alpha: float, min_periods: int) -> np.ndarray:
+    # Recursive smoothing seeded with the first valid value of each column; NaN rows are
+    # skipped rather than decaying the state, matching the streaming indicators
+    out = _pandas(
+        arr,
+        lambda df: df.ewm(
+            alpha=alpha, adjust=False, min_periods=min_periods, ignore_na=True
+        ).mean(),
+    )
+    out[np.isnan(arr)] = np.nan
+    return out
+
+
+def _shift(arr: np.ndarray, periods: int = 1) -> np.ndarray:
+    out = np.full_like(arr, np.nan)
+    out[periods:] = arr[:-periods]
+    return out
+
+
+def sma(x: Any, window: int) -> np.ndarray:
+    """Simple moving average over the last ``window`` rows."""
+    arr = _values(x)
+    window = _check_window(window)
+    nan = np.isnan(arr)
+    # Prefix sums are O(n); subtracting the first row keeps their magnitude small
+    base = np.nan_to_num(arr[:1]) if len(arr) else 0.0
+    csum = np.cumsum(np.where(nan, 0.0, arr - base), axis=0)
+    cnan = np.cumsum(nan, axis=0)
+    out = np.full_like(arr, np.nan)
+    if len(arr) < window:
+        return out
+    total = csum[window - 1 :].copy()
+    total[1:] -= csum[:-window]
+    holes = cnan[window - 1 :].copy()
+    holes[1:] -= cnan[:-window]
+    out[window - 1 :] = np.where(holes > 0, np.nan, total / window + base)
+    return out
+
+
+def wma(x: Any, window: int) -> np.ndarray:
+    """Linearly weighted moving average; the newest row has weight ``window``."""
+    arr = _values(x)
+    window = _check_window(window)
+    out = np.full_like(arr, np.nan)
+    if len(arr) < window:
+        return out
+    weights = np.arange(1, window + 1, dtype=np.float64)
+    windows = sliding_window_view(arr, window, axis=0)
+    out[window - 1 :] = windows @ (weights / weights.sum())
+    return out
+
+
+def ema(x: Any, window: int) -> np.ndarray:
+    """Exponential moving average with ``alpha = 2 / (window + 1)``.
+
+    The recursion starts at each column's first valid value and the first
+    ``window - 1`` valid rows are treated as warm-up.
+    """
+    window = _check_window(window)
+    return _ewm(_values(x), 2.0 / (window + 1), window)
+
+
+def rolling_min(x: Any, window: int) -> np.ndarray:
+    window = _check_window(window)
+    return _pandas(_values(x), lambda df: df.rolling(window, min_periods=window).min())
+
+
+def rolling_max(x: Any, window: int) -> np.ndarray:
+    window = _check_window(window)
+    return _pandas(_values(x), lambda df: df.rolling(window, min_periods=window).max())
+
+
+def rolling_std(x: Any, window: int, *, ddof: int = 1) -> np.ndarray:
+    window = _check_window(window)
+    return _pandas(_values(x), lambda df: df.rolling(window, min_periods=window).std(ddof=ddof))
+
+
+def zscore(x: Any, window: int) -> np.ndarray:
+    """Distance of each row from its rolling mean in rolling (population) standard
+    deviations; NaN where the window is flat."""
+    arr = _values(x)
+    std = rolling_std(arr, window, ddof=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(std > 0, (arr - sma(arr, window)) / std, np.nan)
+
+
+def bollinger(x: Any, window: int = 20, k: float = 2.0) -> BollingerBands:
+    """Bollinger bands: SMA plus/minus ``k`` population standard deviations."""
+    arr = _values(x)
+    middle = sma(arr, window)
+    width = k * rolling_std(arr, window, ddof=0)
+    return BollingerBands(middle=middle, upper=middle + width, lower=middle - width)
+
+
+def macd(x: Any, fast: int = 12, slow: int = 26, signal: int = 9) -> MACD:
+    """MACD line (fast EMA minus slow EMA), its signal EMA and their difference."""
+    if _check_window(fast, "fast") >= _check_window(slow, "slow"):
+        raise ValueError(f"fast ({fast}) must be shorter than slow ({slow})")
+    arr = _values(x)
+    line = ema(arr, fast) - ema(arr, slow)
+    sig = ema(line, signal)
+    return MACD(macd=line, signal=sig, histogram=line - sig)
+
+
+def _wilder(arr: np.ndarray, window: int) -> np.ndarray:
+    return _ewm(arr, 1.0 / window, window)
+
+
+def rsi(x: Any, window: int = 14) -> np.ndarray:
+    """Relative strength index (0-100) with Wilder smoothing of gains and losses."""
+    window = _check_window(window)
+    arr = _values(x)
+    delta = arr - _shift(arr)
+    gain = _wilder(np.maximum(delta, 0.0), window)
+    loss = _wilder(np.maximum(-delta, 0.0), window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out: np.ndarray = 100.0 - 100.0 / (1.0 + gain / loss)
+    # No losses in the window: 100 when there were gains, neutral 50 when flat
+    flat = loss == 0
+    out[flat] = np.where(gain[flat] > 0, 100.0, 50.0)
+    return out
+
+
+def true_range(high: Any, low: Any, close: Any) -> np.ndarray:
+    """Largest of high-low and the gaps from the previous close; high-low alone where
+    there is no previous close."""
+    h, lo, c = _values(high), _values(low), _values(close)
+    if not h.shape == lo.shape == c.shape:
+        raise ValueError(f"high/low/close shapes differ: {h.shape}, {lo.shape}, {c.shape}")
+    prev = _shift(c)
+    gap = np.maximum(np.abs(h - prev), np.abs(lo - prev))
+    tr: np.ndarray = np.where(np.isnan(prev), h - lo, np.maximum(h - lo, gap))
+    return tr
+
+
+def atr(high: Any, low: Any, close: Any, window: int = 14) -> np.ndarray:
+    """Average true range with Wilder smoothing."""
+    window = _check_window(window)
+    return _wilder(true_range(high, low, close), window)
+
+
+def rolling_volatility(
+    x: Any, window: int, *, periods_per_year: Optional[float] = None
+) -> np.ndarray:
+    """Sample standard deviation of simple returns over ``window`` returns, annualized
+    with ``sqrt(periods_per_year)`` when given (see ``metrics.periods_per_year``)."""
+    arr = _values(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = arr / _shift(arr) - 1.0
+    vol = rolling_std(returns, window, ddof=1)
+    return vol * sqrt(periods_per_year) if periods_per_year is not None else vol
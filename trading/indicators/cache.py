@@ -0,0 +1,184 @@
+from __future__ import annotations
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+import hashlib
+import json
+import os
+import threading
+import uuid
+
+import numpy as np
+
+from trading.indicators import batch
+
+
+# Array-valued batch indicators the cache can compute by name
+INDICATORS: Dict[str, Callable[..., np.ndarray]] = {
+    "sma": batch.sma,
+    "ema": batch.ema,
+    "wma": batch.wma,
+    "rsi": batch.rsi,
+    "atr": batch.atr,
+    "true_range": batch.true_range,
+    "zscore": batch.zscore,
+    "rolling_min": batch.rolling_min,
+    "rolling_max": batch.rolling_max,
+    "rolling_std": batch.rolling_std,
+    "rolling_volatility": batch.rolling_volatility,
+}
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+
+def array_fingerprint(*arrays: Any) -> str:
+    """Content hash of one or more arrays (dtype, shape and bytes)."""
+    h = hashlib.sha256()
+    for item in arrays:
+        arr = np.ascontiguousarray(item)
+        h.update(f"{arr.dtype.str}{arr.shape}".encode("utf-8"))
+        h.update(arr.data)
+    return h.hexdigest()
+
+
+class IndicatorCache:
+    """Memoizes indicator columns by (input content hash, indicator, params).
+
+    Results live in an LRU bounded by ``max_bytes``. With ``spill_dir`` evicted
+    results are written there as ``.npy`` files and read back on a later miss, so
+    several processes (e.g. sweep workers) pointing at one directory also share work.
+    Returned arrays are read-only because every caller shares them.
+    """
+
+    def __init__(
+        self, max_bytes: int = DEFAULT_MAX_BYTES, spill_dir: Optional[str | Path] = None
+    ) -> None:
+        self.max_bytes = int(max_bytes)
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.spill_hits = 0
+        self.evictions = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "spill_hits": self.spill_hits,
+            "evictions": self.evictions,
+        }
+
+    @staticmethod
+    def key(fingerprint: str, name: str, params: Dict[str, Any]) -> str:
+        blob = json.dumps([fingerprint, name, params], sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        name: str,
+        *inputs: Any,
+        fingerprint: Optional[str] = None,
+        **params: Any,
+    ) -> np.ndarray:
+        """``INDICATORS[name](*inputs, **params)``, computed at most once per content.
+
+        Pass ``fingerprint`` (from ``array_fingerprint``) when requesting several
+        indicators of the same inputs to hash them only once.
+        """
+        try:
+            fn = INDICATORS[name]
+        except KeyError:
+            raise KeyError(
+                f"Unknown indicator '{name}'; available: {', '.join(sorted(INDICATORS))}"
+            ) from None
+        fp = fingerprint or array_fingerprint(*inputs)
+        return self.get_or_compute(self.key(fp, name, params), lambda: fn(*inputs, **params))
+
+    def get_or_compute(self, key: str, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """Memoize an arbitrary array-valued computation under a caller-built key."""
+        with self._lock:
+            found = self._entries.get(key)
+            if found is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return found
+        found = self._read_spilled(key)
+        if found is not None:
+            self.spill_hits += 1
+        else:
+            self.misses += 1
+            found = np.asarray(compute())
+        found.flags.writeable = False
+        self._put(key, found)
+        return found
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _put(self, key: str, value: np.ndarray) -> None:
+        evicted: list[tuple[str, np.ndarray]] = []
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = value
+            self._bytes += value.nbytes
+            # Keep at least the newest entry even when it alone exceeds the budget
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                old_key, old = self._entries.popitem(last=False)
+                self._bytes -= old.nbytes
+                self.evictions += 1
+                evicted.append((old_key, old))
+        for old_key, old in evicted:
+            self._spill(old_key, old)
+
+    def _spill_path(self, key: str) -> Optional[Path]:
+        return None if self.spill_dir is None else self.spill_dir / f"{key}.npy"
+
+    def _spill(self, key: str, value: np.ndarray) -> None:
+        path = self._spill_path(key)
+        if path is None or path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, value, allow_pickle=False)
+        os.replace(tmp, path)
+
+    def _read_spilled(self, key: str) -> Optional[np.ndarray]:
+        path = self._spill_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return np.asarray(np.load(path, allow_pickle=False))
+        except (OSError, ValueError):
+            return None
+
+
+_DEFAULT: Optional[IndicatorCache] = None
+
+
+def default_cache() -> IndicatorCache:
+    """Process-wide cache shared by strategies; created on first use."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = IndicatorCache()
+    return _DEFAULT
+
+
+def set_default_cache(cache: Optional[IndicatorCache]) -> None:
+    """Replace the process-wide cache (``None`` resets it to a fresh default)."""
+    global _DEFAULT
+    _DEFAULT = cache
@@ -0,0 +1,229 @@
+from __future__ import annotations
+from collections import deque
+from math import fsum, isnan, nan
+from typing import Any, Dict, Type, TypeVar
+
+
+# Incremental counterparts of ``trading.indicators.batch``: each ``update`` is O(1)
+# (amortized for the ring-sum resync and the rolling extremes) and returns the value
+# the batch function gives for that row, NaN during warm-up. NaN inputs follow the
+# batch rules too: they invalidate rolling windows and are skipped by the
+# exponential indicators.
+
+_T = TypeVar("_T", bound="StreamingIndicator")
+_INDICATORS: Dict[str, Type["StreamingIndicator"]] = {}
+
+
+def _slots(cls: type) -> list[str]:
+    names: list[str] = []
+    for klass in reversed(cls.__mro__):
+        names.extend(getattr(klass, "__slots__", ()))
+    return names
+
+
+def _dump(item: Any) -> Any:
+    if isinstance(item, StreamingIndicator):
+        return {"indicator": type(item).__name__, "state": item.state()}
+    if isinstance(item, (list, deque)):
+        return [list(x) if isinstance(x, tuple) else x for x in item]
+    return item
+
+
+def _load(item: Any, as_deque: bool) -> Any:
+    if isinstance(item, dict):
+        return _INDICATORS[item["indicator"]].from_state(item["state"])
+    if as_deque:
+        return deque(tuple(x) for x in item)
+    return list(item) if isinstance(item, list) else item
+
+
+class StreamingIndicator:
+    """Base class: ``value`` is the latest output and ``state``/``from_state`` round-trip
+    an indicator through plain Python data (JSON-compatible), so a live session can
+    persist its indicators and resume them. Instances also pickle."""
+
+    __slots__ = ("window", "_count", "_value")
+
+    def __init__(self, window: int) -> None:
+        if int(window) != window or window < 1:
+            raise ValueError(f"window must be a positive integer, got {window!r}")
+        self.window = int(window)
+        self._count = 0
+        self._value = nan
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _INDICATORS[cls.__name__] = cls
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @property
+    def ready(self) -> bool:
+        return not isnan(self._value)
+
+    def state(self) -> Dict[str, Any]:
+        return {name: _dump(getattr(self, name)) for name in _slots(type(self))}
+
+    @classmethod
+    def from_state(cls: Type[_T], state: Dict[str, Any]) -> _T:
+        obj = cls.__new__(cls)
+        for name in _slots(cls):
+            setattr(obj, name, _load(state[name], name == "_extremes"))
+        return obj
+
+
+class StreamingSMA(StreamingIndicator):
+    """Simple moving average over a ring buffer with a running sum.
+
+    The sum is rebuilt with ``fsum`` whenever the ring wraps, so rounding error never
+    builds up past one window.
+    """
+
+    __slots__ = ("_ring", "_pos", "_sum", "_last_nan")
+
+    def __init__(self, window: int) -> None:
+        super().__init__(window)
+        self._ring: list[float] = [0.0] * self.window
+        self._pos = 0
+        self._sum = 0.0
+        self._last_nan = -1
+
+    def update(self, value: float) -> float:
+        value = float(value)
+        if isnan(value):
+            self._last_nan = self._count
+            value = 0.0
+        self._sum += value - self._ring[self._pos]
+        self._ring[self._pos] = value
+        self._pos += 1
+        if self._pos == self.window:
+            self._pos = 0
+            self._sum = fsum(self._ring)
+        self._count += 1
+        full = self._count >= self.window and self._last_nan < self._count - self.window
+        self._value = self._sum / self.window if full else nan
+        return self._value
+
+
+class StreamingEMA(StreamingIndicator):
+    """Exponential moving average seeded with the first value; ``alpha`` defaults to
+    ``2 / (window + 1)`` and the first ``window - 1`` values are warm-up."""
+
+    __slots__ = ("alpha", "_ema")
+
+    def __init__(self, window: int, alpha: float | None = None) -> None:
+        super().__init__(window)
+        self.alpha = 2.0 / (self.window + 1) if alpha is None else float(alpha)
+        self._ema = nan
+
+    def update(self, value: float) -> float:
+        value = float(value)
+        if isnan(value):
+            self._value = nan
+            return nan
+        self._count += 1
+        if self._count == 1:
+            self._ema = value
+        else:
+            self._ema += self.alpha * (value - self._ema)
+        self._value = self._ema if self._count >= self.window else nan
+        return self._value
+
+
+class StreamingRSI(StreamingIndicator):
+    """Relative strength index (0-100) with Wilder-smoothed gains and losses."""
+
+    __slots__ = ("_prev", "_gain", "_loss")
+
+    def __init__(self, window: int = 14) -> None:
+        super().__init__(window)
+        self._prev = nan
+        self._gain = StreamingEMA(self.window, alpha=1.0 / self.window)
+        self._loss = StreamingEMA(self.window, alpha=1.0 / self.window)
+
+    def update(self, value: float) -> float:
+        value = float(value)
+        delta = value - self._prev
+        self._prev = value
+        if isnan(delta):
+            self._gain.update(nan)
+            self._value = self._loss.update(nan)
+            return self._value
+        gain = self._gain.update(max(delta, 0.0))
+        loss = self._loss.update(max(-delta, 0.0))
+        if isnan(gain):
+            self._value = nan
+        elif loss == 0.0:
+            # No losses in the window: 100 when there were gains, neutral 50 when flat
+            self._value = 100.0 if gain > 0.0 else 50.0
+        else:
+            self._value = 100.0 - 100.0 / (1.0 + gain / loss)
+        return self._value
+
+
+class StreamingATR(StreamingIndicator):
+    """Average true range with Wilder smoothing; ``update`` takes high, low and close."""
+
+    __slots__ = ("_prev_close", "_tr")
+
+    def __init__(self, window: int = 14) -> None:
+        super().__init__(window)
+        self._prev_close = nan
+        self._tr = StreamingEMA(self.window, alpha=1.0 / self.window)
+
+    def update(self, high: float, low: float, close: float) -> float:
+        high, low, prev = float(high), float(low), self._prev_close
+        self._prev_close = float(close)
+        tr = high - low
+        if not isnan(prev) and not isnan(tr):
+            tr = max(tr, abs(high - prev), abs(low - prev))
+        self._value = self._tr.update(tr)
+        return self._value
+
+
+class _StreamingExtreme(StreamingIndicator):
+    """Rolling extreme via a monotonic deque of (index, value): each value is pushed and
+    popped at most once, so updates are amortized O(1)."""
+
+    __slots__ = ("_extremes", "_last_nan")
+
+    def __init__(self, window: int) -> None:
+        super().__init__(window)
+        self._extremes: deque[tuple[int, float]] = deque()
+        self._last_nan = -1
+
+    def _dominates(self, new: float, old: float) -> bool:
+        raise NotImplementedError
+
+    def update(self, value: float) -> float:
+        value = float(value)
+        i = self._count
+        self._count += 1
+        if isnan(value):
+            self._last_nan = i
+        else:
+            extremes = self._extremes
+            while extremes and self._dominates(value, extremes[-1][1]):
+                extremes.pop()
+            extremes.append((i, value))
+        while self._extremes and self._extremes[0][0] <= i - self.window:
+            self._extremes.popleft()
+        full = self._count >= self.window and self._last_nan <= i - self.window
+        self._value = self._extremes[0][1] if full else nan
+        return self._value
+
+
+class StreamingMin(_StreamingExtreme):
+    __slots__ = ()
+
+    def _dominates(self, new: float, old: float) -> bool:
+        return new <= old
+
+
+class StreamingMax(_StreamingExtreme):
+    __slots__ = ()
+
+    def _dominates(self, new: float, old: float) -> bool:
+        return new >= old
@@ -0,0 +1,123 @@
+from __future__ import annotations
+from bisect import bisect_left
+from itertools import accumulate
+from math import ceil, frexp, ldexp
+from typing import Dict
+
+
+class LatencyHistogram:
+    """Fixed-memory, log-bucketed (HDR-style) histogram for latency samples.
+
+    Each power-of-two range between ``lowest`` and ``highest`` is split into
+    ``sub_buckets`` linear buckets, so any recorded value is reported with a relative
+    error of at most ``1 / sub_buckets`` while memory stays constant no matter how many
+    samples are recorded. Values outside the range are clamped into the edge buckets;
+    exact count, sum, min and max are tracked alongside.
+
+    Units are up to the caller (the backtest engine records milliseconds). Histograms
+    with the same layout can be merged, e.g. across sweep workers or live-loop intervals.
+    """
+
+    __slots__ = (
+        "lowest",
+        "highest",
+        "sub_buckets",
+        "_min_exp",
+        "_counts",
+        "count",
+        "total",
+        "_min",
+        "_max",
+    )
+
+    def __init__(self, lowest: float = 1e-6, highest: float = 1e7, sub_buckets: int = 128) -> None:
+        if not 0 < lowest < highest:
+            raise ValueError("histogram range must satisfy 0 < lowest < highest")
+        if sub_buckets < 1:
+            raise ValueError("sub_buckets must be >= 1")
+        self.lowest = float(lowest)
+        self.highest = float(highest)
+        self.sub_buckets = int(sub_buckets)
+        self._min_exp = frexp(self.lowest)[1]
+        n_exp = frexp(self.highest)[1] - self._min_exp + 1
+        self._counts: list[int] = [0] * (n_exp * self.sub_buckets)
+        self.count = 0
+        self.total = 0.0
+        self._min = float("inf")
+        self._max = float("-inf")
+
+    def _index(self, value: float) -> int:
+        if value <= self.lowest:
+            return 0
+        if value >= self.highest:
+            return len(self._counts) - 1
+        mantissa, exp = frexp(value)  # value = mantissa * 2**exp, mantissa in [0.5, 1)
+        sub = int((mantissa * 2.0 - 1.0) * self.sub_buckets)
+        return (exp - self._min_exp) * self.sub_buckets + sub
+
+    def _upper_bound(self, index: int) -> float:
+        exp, sub = divmod(index, self.sub_buckets)
+        return ldexp(1.0 + (sub + 1) / self.sub_buckets, exp + self._min_exp - 1)
+
+    def record(self, value: float, count: int = 1) -> None:
+        self._counts[self._index(value)] += count
+        self.count += count
+        self.total += value * count
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def merge(self, other: LatencyHistogram) -> None:
+        if (other.lowest, other.highest, other.sub_buckets) != (
+            self.lowest,
+            self.highest,
+            self.sub_buckets,
+        ):
+            raise ValueError("cannot merge histograms with different bucket layouts")
+        self._counts = [a + b for a, b in zip(self._counts, other._counts)]
+        self.count += other.count
+        self.total += other.total
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+    @property
+    def min(self) -> float:
+        return self._min if self.count else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max if self.count else 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile for ``p`` in [0, 1], within the bucket resolution."""
+        return self.percentiles([p])[0]
+
+    def percentiles(self, ps: list[float]) -> list[float]:
+        if not self.count:
+            return [0.0 for _ in ps]
+        cumulative = list(accumulate(self._counts))
+        out: list[float] = []
+        for p in ps:
+            rank = max(1, ceil(min(max(p, 0.0), 1.0) * self.count))
+            # First bucket whose cumulative count reaches the rank
+            index = bisect_left(cumulative, rank)
+            out.append(min(max(self._upper_bound(index), self._min), self._max))
+        return out
+
+    def to_dict(self) -> Dict[str, float]:
+        p50, p95, p99, p999 = self.percentiles([0.5, 0.95, 0.99, 0.999])
+        return {
+            "count": self.count,
+            "avg": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+            "p999": p999,
+        }
@@ -0,0 +1,55 @@
+from __future__ import annotations
+from time import perf_counter
+from typing import Dict
+
+from trading.observability.histogram import LatencyHistogram
+
+
+# Hot-path stages of the backtest bar loop, in execution order
+STAGES = (
+    "bar_lookup",
+    "record",
+    "on_bar",
+    "risk_validate",
+    "simulate_fill",
+    "apply_fill",
+    "snapshot",
+    "exposure_scan",
+    "logging",
+)
+
+
+class StageProfiler:
+    """Lap timer attributing hot-path wall time to named stages.
+
+    Call ``start()`` before a timed section and ``lap(stage)`` after each stage; the time
+    since the previous mark is charged to that stage. Callers guard calls with
+    ``if profiler.enabled`` so a disabled profiler costs one boolean check per stage.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._hists: Dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in STAGES}
+        self._mark = 0.0
+
+    def start(self) -> None:
+        self._mark = perf_counter()
+
+    def lap(self, stage: str) -> None:
+        now = perf_counter()
+        self._hists[stage].record((now - self._mark) * 1000.0)
+        self._mark = now
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage count, cumulative/avg/max ms, p50..p999 and share of profiled time."""
+        grand_total = sum(hist.total for hist in self._hists.values())
+        out: Dict[str, Dict[str, float]] = {}
+        for stage, hist in self._hists.items():
+            if not hist.count:
+                continue
+            out[stage] = {
+                "total_ms": hist.total,
+                **hist.to_dict(),
+                "share": hist.total / grand_total if grand_total > 0 else 0.0,
+            }
+        return out
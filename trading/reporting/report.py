@@ -25,9 +25,10 @@ def _compute_drawdown(equity: pd.Series) -> pd.Series:
 def load_report_inputs(run_dir: Path) -> ReportInputs:
     with open(run_dir / "summary.json", "r", encoding="utf-8") as f:
         summary = json.load(f)
-    import pyarrow.parquet as pq  # lazy import
+    from trading.backtest.recorders import read_ledger  # lazy import
 
-    equity = pq.read_table(run_dir / "equity.parquet").to_pandas()
+    # Resumed runs append their equity as extra segments
+    equity = read_ledger(run_dir / "equity.parquet").to_pandas()
     equity = equity.sort_values("ts").reset_index(drop=True)
     return ReportInputs(run_dir=run_dir, summary=summary, equity=equity)
 
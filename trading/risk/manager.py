@@ -1,14 +1,13 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Callable, Optional
-import pandas as pd
-
-import pandas_market_calendars as mcal
+from time import perf_counter
+from typing import Any, Callable, Optional
 
 from trading.core.contracts import RiskManager
 import logging
 from trading.core.models import Order
+from trading.observability.histogram import LatencyHistogram
 
 
 @dataclass
@@ -32,15 +31,28 @@ class BasicRiskManager(RiskManager):
         get_gross_exposure: Optional[Callable[[], float]] = None,
         get_daily_realized_pnl: Optional[Callable[[], float]] = None,
         enable_session_gate: bool = True,
+        latency_histogram: Optional[LatencyHistogram] = None,
     ) -> None:
         self.params = params
         self._get_gross_exposure = get_gross_exposure
         self._get_daily_realized_pnl = get_daily_realized_pnl
-        self._calendar = mcal.get_calendar(params.market_calendar)
+        # Built on first session check; backtests disable the gate and never need it
+        self._calendar: Any = None
         # In backtests and unit tests, wall-clock session gating should be disabled
         self._enable_session_gate = enable_session_gate
+        # Optional validate() latency in ms; shared histogram type with the engine/live loop
+        self.latency_histogram = latency_histogram
 
     def validate(self, proposed_order: Order) -> Optional[Order]:
+        if self.latency_histogram is None:
+            return self._validate(proposed_order)
+        start = perf_counter()
+        try:
+            return self._validate(proposed_order)
+        finally:
+            self.latency_histogram.record((perf_counter() - start) * 1000.0)
+
+    def _validate(self, proposed_order: Order) -> Optional[Order]:
         now = datetime.now(timezone.utc)
         if self._enable_session_gate and not self._is_session_open(now):
             return None
@@ -82,6 +94,12 @@ class BasicRiskManager(RiskManager):
         return proposed_order
 
     def _is_session_open(self, now: datetime) -> bool:
+        import pandas as pd
+
+        if self._calendar is None:
+            import pandas_market_calendars as mcal
+
+            self._calendar = mcal.get_calendar(self.params.market_calendar)
         day = pd.Timestamp(now).tz_convert("UTC").normalize()
         sched = self._calendar.schedule(start_date=day.date(), end_date=day.date())
         if sched.empty:
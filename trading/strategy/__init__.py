@@ -1,7 +1,21 @@
-from .registry import register_strategy, get_strategy_names
+from .registry import (
+    create_strategy,
+    get_signal_strategy,
+    get_strategy,
+    get_strategy_names,
+    register_strategy,
+    register_strategy_path,
+    resolve_strategy,
+)
 
-# Import built-in example strategies so they register on import
-from .examples import ma_crossover as _ma_crossover  # noqa: F401
-from .examples import momentum as _momentum  # noqa: F401
+# Strategies are imported on first lookup by name (see registry), not here
 
-__all__ = ["register_strategy", "get_strategy_names"]
+__all__ = [
+    "register_strategy",
+    "register_strategy_path",
+    "get_strategy",
+    "get_signal_strategy",
+    "resolve_strategy",
+    "get_strategy_names",
+    "create_strategy",
+]
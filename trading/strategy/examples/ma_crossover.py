@@ -1,26 +1,121 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from math import isnan
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from trading.core.contracts import Strategy
+from trading.core.contracts import SignalStrategy, Strategy
 from trading.core.models import Bar, Order
+from trading.indicators.streaming import StreamingSMA
 from trading.strategy.registry import register_strategy
+from trading.strategy.sizing import rebalance_order, target_shares
+
+if TYPE_CHECKING:  # numpy/pandas are only needed by the backtest entry points
+    import numpy as np
+    import pandas as pd
 
 
 @dataclass
 class MACrossoverState:
     fast: float | None = None
     slow: float | None = None
+    position: int = 0
+    bars: int = 0
+    orders: int = 0
+    fast_sma: Optional[StreamingSMA] = field(default=None, repr=False)
+    slow_sma: Optional[StreamingSMA] = field(default=None, repr=False)
 
 
 @register_strategy("ma_crossover")
-class MovingAverageCrossover(Strategy):
-    def __init__(self, fast: int = 20, slow: int = 50, symbol: str | None = None) -> None:
+class MovingAverageCrossover(Strategy, SignalStrategy):
+    """Long while the fast SMA of closes is above the slow SMA, flat otherwise.
+
+    Averages are updated incrementally (O(1) per bar) on every bar, so they always
+    hold the full history. In backtests ``prepare`` also takes both columns from the
+    shared indicator cache, whose values are used for the bars they cover so sweeps
+    over fast/slow pairs compute each SMA once per symbol; bars past the prepared range
+    (e.g. a live session continuing a backtest) fall back to the streaming values.
+    Positions are ``quantity`` shares, or ``notional // close`` shares when
+    ``notional`` is set. ``target_positions`` computes the same positions for the
+    vectorized engine.
+    """
+
+    def __init__(
+        self,
+        fast: int = 20,
+        slow: int = 50,
+        symbol: str | None = None,
+        quantity: int = 100,
+        notional: float | None = None,
+    ) -> None:
+        if not 0 < fast < slow:
+            raise ValueError(f"ma_crossover needs 0 < fast < slow, got fast={fast}, slow={slow}")
         self.fast_window = fast
         self.slow_window = slow
         self.symbol = symbol
-        self.state = MACrossoverState()
+        self.quantity = quantity
+        self.notional = notional
+        self.state = MACrossoverState(fast_sma=StreamingSMA(fast), slow_sma=StreamingSMA(slow))
+        self._fast_col: Optional[np.ndarray] = None
+        self._slow_col: Optional[np.ndarray] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # prepare() rebuilds the columns on resume; pickled into checkpoints they would
+        # grow with the length of the history
+        state = dict(self.__dict__)
+        state["_fast_col"] = state["_slow_col"] = None
+        return state
+
+    def _sma_columns(self, close: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        from trading.indicators.cache import array_fingerprint, default_cache
+
+        cache, fp = default_cache(), array_fingerprint(close)
+        fast = cache.get("sma", close, fingerprint=fp, window=self.fast_window)
+        slow = cache.get("sma", close, fingerprint=fp, window=self.slow_window)
+        return fast, slow
+
+    def prepare(self, bars: pd.DataFrame) -> None:
+        import numpy as np
+
+        close = bars["close"].to_numpy(dtype=np.float64)
+        self._fast_col, self._slow_col = self._sma_columns(close)
+
+    def target_positions(self, bars: pd.DataFrame) -> np.ndarray:
+        import numpy as np
+        import pandas as pd
+
+        close = bars["close"].to_numpy(dtype=np.float64)
+        fast, slow = self._sma_columns(close)
+        long = fast > slow  # False while either average is still NaN
+        if self.notional is None:
+            return np.where(long, int(self.quantity), 0)
+        positive = close > 0.0
+        shares = np.where(
+            positive, np.floor_divide(self.notional, np.where(positive, close, 1.0)), 0
+        )
+        # As in on_bar, the size is taken on the first bar of a long stretch that buys at
+        # least one share and held until the averages cross back
+        stretch = np.cumsum(long & ~np.concatenate(([False], long[:-1])))
+        entry = long & (shares > 0)
+        first = entry & (pd.Series(entry).groupby(stretch).cumsum().to_numpy() == 1)
+        held = pd.Series(np.where(first, shares, np.nan)).groupby(stretch).ffill()
+        targets: np.ndarray = np.where(long, held.fillna(0.0).to_numpy(), 0.0).astype(np.int64)
+        return targets
 
     def on_bar(self, bar: Bar) -> Optional[Order]:
-        # Placeholder: no actual MA calculation; returns no orders in stub
-        return None
+        st = self.state
+        i = st.bars
+        st.bars += 1
+        assert st.fast_sma is not None and st.slow_sma is not None
+        st.fast, st.slow = st.fast_sma.update(bar.close), st.slow_sma.update(bar.close)
+        if self._fast_col is not None and self._slow_col is not None and i < len(self._fast_col):
+            st.fast, st.slow = float(self._fast_col[i]), float(self._slow_col[i])
+        if isnan(st.fast) or isnan(st.slow):  # still warming up
+            return None
+        target = target_shares(bar.close, self.quantity, self.notional) if st.fast > st.slow else 0
+        if (target > 0) == (st.position > 0):
+            return None
+        symbol = self.symbol or bar.symbol
+        st.orders += 1
+        order = rebalance_order(symbol, f"{symbol}-ma-{st.orders}", st.position, target)
+        st.position = target
+        return order
@@ -1,17 +1,54 @@
 from __future__ import annotations
+from collections import deque
 from typing import Optional
 
 from trading.core.contracts import Strategy
 from trading.core.models import Bar, Order
 from trading.strategy.registry import register_strategy
+from trading.strategy.sizing import rebalance_order, target_shares
 
 
 @register_strategy("momentum")
 class MomentumStrategy(Strategy):
-    def __init__(self, lookback: int = 10, symbol: str | None = None) -> None:
+    """Long while the ``lookback``-bar return exceeds ``threshold``, flat otherwise.
+
+    Keeps only the last ``lookback + 1`` closes, so each bar costs O(1). Sized like
+    ``ma_crossover``: ``quantity`` shares, or ``notional // close`` when set.
+    """
+
+    def __init__(
+        self,
+        lookback: int = 10,
+        symbol: str | None = None,
+        threshold: float = 0.0,
+        quantity: int = 100,
+        notional: float | None = None,
+    ) -> None:
+        if lookback < 1:
+            raise ValueError(f"momentum lookback must be >= 1, got {lookback}")
         self.lookback = lookback
         self.symbol = symbol
+        self.threshold = threshold
+        self.quantity = quantity
+        self.notional = notional
+        self.closes: deque[float] = deque(maxlen=lookback + 1)
+        self.position = 0
+        self.orders = 0
 
     def on_bar(self, bar: Bar) -> Optional[Order]:
-        # Placeholder: returns no orders in stub
-        return None
+        self.closes.append(bar.close)
+        if len(self.closes) <= self.lookback or self.closes[0] <= 0.0:
+            return None
+        momentum = bar.close / self.closes[0] - 1.0
+        target = (
+            target_shares(bar.close, self.quantity, self.notional)
+            if momentum > self.threshold
+            else 0
+        )
+        if (target > 0) == (self.position > 0):
+            return None
+        symbol = self.symbol or bar.symbol
+        self.orders += 1
+        order = rebalance_order(symbol, f"{symbol}-mom-{self.orders}", self.position, target)
+        self.position = target
+        return order
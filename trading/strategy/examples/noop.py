@@ -0,0 +1,17 @@
+from __future__ import annotations
+from typing import Optional
+
+from trading.core.contracts import Strategy
+from trading.core.models import Bar, Order
+from trading.strategy.registry import register_strategy
+
+
+@register_strategy("noop")
+class NoopStrategy(Strategy):
+    """Never trades; the default backtest placeholder."""
+
+    def __init__(self, symbol: str | None = None) -> None:
+        self.symbol = symbol
+
+    def on_bar(self, bar: Bar) -> Optional[Order]:
+        return None
@@ -1,22 +1,125 @@
 from __future__ import annotations
-from typing import Callable, Dict, Type
+from typing import Any, Callable, Dict, Mapping, Type, TypeVar
+import importlib
+import inspect
 
-from trading.core.contracts import Strategy
+from trading.core.contracts import SignalStrategy, Strategy
 
 
-_STRATEGY_REGISTRY: Dict[str, Type[Strategy]] = {}
+# Third-party packages expose strategies under this entry-point group, e.g. in
+# pyproject.toml: [project.entry-points."trading.strategies"] my_strat = "pkg.mod:MyStrategy"
+ENTRY_POINT_GROUP = "trading.strategies"
 
+# Built-in strategies by import path; a module is imported only when its name is requested
+_BUILTIN_STRATEGIES: Dict[str, str] = {
+    "ma_crossover": "trading.strategy.examples.ma_crossover:MovingAverageCrossover",
+    "momentum": "trading.strategy.examples.momentum:MomentumStrategy",
+    "noop": "trading.strategy.examples.noop:NoopStrategy",
+}
 
-def register_strategy(name: str) -> Callable[[Type[Strategy]], Type[Strategy]]:
-    def decorator(cls: Type[Strategy]) -> Type[Strategy]:
+_T = TypeVar("_T")
+_C = TypeVar("_C", bound=type)
+
+# Event-driven (Strategy) and vectorized-mode (SignalStrategy) classes share one namespace
+_STRATEGY_REGISTRY: Dict[str, type] = {}
+_STRATEGY_PATHS: Dict[str, str] = dict(_BUILTIN_STRATEGIES)
+_entry_points_loaded = False
+
+
+def _path_of(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def register_strategy(name: str) -> Callable[[_C], _C]:
+    def decorator(cls: _C) -> _C:
         key = name.lower()
-        if key in _STRATEGY_REGISTRY:
+        path = _STRATEGY_PATHS.get(key)
+        # A lazily registered path resolves to the class being decorated here
+        if key in _STRATEGY_REGISTRY or (path is not None and path != _path_of(cls)):
             raise ValueError(f"Strategy '{name}' already registered")
         _STRATEGY_REGISTRY[key] = cls
+        _STRATEGY_PATHS[key] = _path_of(cls)
         return cls
 
     return decorator
 
 
+def register_strategy_path(name: str, path: str) -> None:
+    """Register ``name`` as ``"package.module:ClassName"`` without importing it."""
+    key = name.lower()
+    module, _, attr = path.partition(":")
+    if not module or not attr:
+        raise ValueError(f"Strategy path must look like 'package.module:Class', got {path!r}")
+    if _STRATEGY_PATHS.get(key, path) != path:
+        raise ValueError(f"Strategy '{name}' already registered")
+    _STRATEGY_PATHS[key] = path
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    from importlib.metadata import entry_points
+
+    # Names registered in-process (built-ins included) take precedence
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        _STRATEGY_PATHS.setdefault(ep.name.lower(), ep.value)
+
+
 def get_strategy_names() -> list[str]:
-    return sorted(_STRATEGY_REGISTRY.keys())
+    _load_entry_points()
+    return sorted(_STRATEGY_PATHS.keys())
+
+
+def resolve_strategy(name: str) -> type:
+    """Class registered as ``name``: a ``Strategy``, a ``SignalStrategy`` or both."""
+    key = name.lower()
+    found = _STRATEGY_REGISTRY.get(key)
+    if found is not None:
+        return found
+    _load_entry_points()
+    path = _STRATEGY_PATHS.get(key)
+    if path is None:
+        raise KeyError(
+            f"Unknown strategy '{name}'; available: {', '.join(get_strategy_names())}"
+        ) from None
+    module, _, attr = path.partition(":")
+    obj: object = importlib.import_module(module)
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    if not (isinstance(obj, type) and issubclass(obj, (Strategy, SignalStrategy))):
+        raise TypeError(f"Strategy '{name}' at {path} is not a Strategy subclass")
+    # Importing the module may already have registered it through the decorator
+    return _STRATEGY_REGISTRY.setdefault(key, obj)
+
+
+def get_strategy(name: str) -> Type[Strategy]:
+    cls = resolve_strategy(name)
+    if not issubclass(cls, Strategy):
+        raise TypeError(f"Strategy '{name}' only supports the vectorized engine")
+    return cls
+
+
+def get_signal_strategy(name: str) -> Type[SignalStrategy]:
+    """Class registered as ``name`` for the vectorized engine (a ``SignalStrategy``)."""
+    cls = resolve_strategy(name)
+    if not issubclass(cls, SignalStrategy):
+        raise TypeError(f"Strategy '{name}' does not support the vectorized engine")
+    return cls
+
+
+def create_strategy(cls: Type[_T], symbol: str, params: Mapping[str, Any]) -> _T:
+    """Instantiate ``cls(**params)`` for one symbol.
+
+    ``symbol`` is passed as a keyword only when the constructor declares a ``symbol``
+    parameter (or ``**kwargs``); strategies that do not need it are not required to
+    take it. An explicit ``symbol`` in ``params`` wins.
+    """
+    kwargs = dict(params)
+    accepted = inspect.signature(cls).parameters
+    if "symbol" in accepted or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in accepted.values()
+    ):
+        kwargs.setdefault("symbol", symbol)
+    return cls(**kwargs)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+from typing import Optional
+
+from trading.core.models import Order
+
+
+def target_shares(price: float, quantity: int = 100, notional: Optional[float] = None) -> int:
+    """Shares to hold when long: ``notional // price`` when a notional is set, else a
+    fixed ``quantity``."""
+    if notional is None:
+        return int(quantity)
+    if price <= 0.0:
+        return 0
+    return int(notional // price)
+
+
+def rebalance_order(
+    symbol: str, local_id: str, current: int, target: int, order_type: str = "market"
+) -> Optional[Order]:
+    """Market order moving a position from ``current`` to ``target`` shares.
+
+    Sells carry a negative quantity, the signed convention fills and portfolio
+    accounting use. Returns None when no trade is needed.
+    """
+    delta = int(target) - int(current)
+    if delta == 0:
+        return None
+    side = "buy" if delta > 0 else "sell"
+    return Order(local_id=local_id, symbol=symbol, side=side, type=order_type, quantity=delta)
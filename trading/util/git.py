@@ -0,0 +1,26 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Optional
+import subprocess
+
+
+def run_git(*args: str) -> str:
+    """Stripped stdout of ``git -C <package dir> <args>`` ("" outside a checkout).
+
+    Commands run against the checkout the ``trading`` package is imported from, not the
+    working directory. Raises ``OSError`` when git is not installed.
+    """
+    import trading
+
+    package_dir = Path(trading.__file__).resolve().parent
+    return subprocess.run(
+        ["git", "-C", str(package_dir), *args], capture_output=True, text=True
+    ).stdout.strip()
+
+
+def git_sha() -> Optional[str]:
+    """HEAD SHA of the checkout ``trading`` is imported from, or None."""
+    try:
+        return run_git("rev-parse", "HEAD") or None
+    except OSError:
+        return None